@@ -2,9 +2,10 @@
 import json
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator
 import shutil
 
 try:
@@ -65,6 +66,9 @@ class BossDatabase:
         self.db_path = Path(db_path)
         self.app_dir = app_dir
         self.bosses: List[Dict] = []
+        # save() calls made inside batch() are deferred to the end of the outermost batch
+        self._batch_depth = 0
+        self._save_pending = False
         
         logger.info(f"[INIT] Step 1: Initializing with defaults")
         self._initialize_with_defaults()
@@ -702,7 +706,11 @@ class BossDatabase:
         return self._create_backup()
     
     def save(self) -> None:
-        """Save bosses to JSON file."""
+        """Save bosses to JSON file (deferred while inside batch())."""
+        if self._batch_depth:
+            self._save_pending = True
+            return
+        
         logger.info(f"[SAVE] Starting save operation - {len(self.bosses)} bosses in memory")
         logger.info(f"[SAVE] Target file: {self.db_path}")
 
@@ -771,6 +779,24 @@ class BossDatabase:
                 logger.info(f"[SAVE] Previous version backed up at: {backup_path}")
             raise
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several changes into a single save.
+        
+        Every mutator saves the whole file; inside this block those saves are
+        deferred, and the database is written once when the outermost batch()
+        exits (also on error, so the file matches memory).
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self._save_pending = False
+                self.save()
+    
     def exists(self, monster_name: str) -> bool:
         """Check if a monster exists in the database."""
         return any(boss['name'].lower() == monster_name.lower() for boss in self.bosses)
@@ -2,15 +2,18 @@
 import sys
 import json
 import os
+import base64
 import time
 import hashlib
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from PyQt6.QtWidgets import QApplication, QMessageBox, QSystemTrayIcon, QDialog
+from PyQt6.QtWidgets import (
+    QApplication, QMessageBox, QSystemTrayIcon, QDialog, QComboBox, QProxyStyle, QStyle
+)
 from PyQt6.QtCore import QTimer, QObject, pyqtSignal, pyqtSlot, Qt
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtGui import QPalette, QColor, QPixmap
 from typing import Optional, List, Dict
 from queue import Queue
 
@@ -87,12 +90,10 @@ try:
     from .log_monitor import LogMonitor
     from .system_tray import SystemTray
     from .options_window import OptionsWindow
-    from .message_editor import MessageEditor
     from .theme_manager import ThemeManager
     from .timestamp_formatter import TimestampFormatter
     from .activity_database import ActivityDatabase
     from .main_window import MainWindow
-    from .new_boss_dialog import NewBossDialog
     from .security import SecurityManager
     # Discord checker is optional (requires discord.py)
     try:
@@ -114,12 +115,10 @@ except ImportError:
             from src.log_monitor import LogMonitor
             from src.system_tray import SystemTray
             from src.options_window import OptionsWindow
-            from src.message_editor import MessageEditor
             from src.theme_manager import ThemeManager
             from src.timestamp_formatter import TimestampFormatter
             from src.activity_database import ActivityDatabase
             from src.main_window import MainWindow
-            from src.new_boss_dialog import NewBossDialog
             from src.security import SecurityManager
             try:
                 from src.discord_checker import DiscordChecker, DISCORD_AVAILABLE
@@ -136,12 +135,10 @@ except ImportError:
             from log_monitor import LogMonitor
             from system_tray import SystemTray
             from options_window import OptionsWindow
-            from message_editor import MessageEditor
             from theme_manager import ThemeManager
             from timestamp_formatter import TimestampFormatter
             from activity_database import ActivityDatabase
             from main_window import MainWindow
-            from new_boss_dialog import NewBossDialog
             try:
                 from security import SecurityManager
             except ImportError:
@@ -164,12 +161,10 @@ except ImportError:
         from log_monitor import LogMonitor
         from system_tray import SystemTray
         from options_window import OptionsWindow
-        from message_editor import MessageEditor
         from theme_manager import ThemeManager
         from timestamp_formatter import TimestampFormatter
         from activity_database import ActivityDatabase
         from main_window import MainWindow
-        from new_boss_dialog import NewBossDialog
         try:
             from security import SecurityManager
         except ImportError:
@@ -1542,6 +1537,11 @@ class BossTrackerApp(QObject):
                 logger.debug(f"Dialog already exists for boss '{parsed.monster}', skipping duplicate")
                 return
             
+            try:
+                from .new_boss_dialog import NewBossDialog
+            except ImportError:
+                from new_boss_dialog import NewBossDialog
+            
             # Show non-modal dialog
             dialog = NewBossDialog(parsed.monster, parsed.location, self.main_window)
             # Connect signal - this will be called when user clicks Yes or No
@@ -2476,14 +2476,14 @@ class BossTrackerApp(QObject):
                         parsed = MessageParser.parse_lockout_line(line)
                         if parsed:
                             is_lockout = True
-                            logger.debug(f"Found lockout message during scan: {parsed.monster}")
+                            logger.debug("Found lockout message during scan: %s", parsed.monster)
                     
                     if parsed:
                         parsed_count += 1
                         monster = parsed.monster
                         location = parsed.location
                         
-                        logger.debug(f"Parsed kill: {monster} in {location} at {parsed.timestamp}")
+                        logger.debug("Parsed kill: %s in %s at %s", monster, location, parsed.timestamp)
                         
                         # Track unique bosses (monster + location combination)
                         key = (monster, location)
@@ -2659,7 +2659,7 @@ class BossTrackerApp(QObject):
             # Get accent color from settings (default to blue)
             accent_color = self.settings.get('accent_color', '#007acc')
             # Update stylesheet
-            self.app.setStyleSheet(_get_theme(theme, accent_color))
+            _apply_app_theme(self.app, theme, accent_color)
             
             # Update palette with accent color
             accent_qcolor = QColor(accent_color)
@@ -2725,6 +2725,9 @@ class BossTrackerApp(QObject):
     def _update_all_boss_info_labels(self) -> None:
         """Update all boss info labels (called after UI is ready)."""
         try:
+            # The zone widget coalesces set_bosses; apply it before refreshing
+            # so the labels aren't updated against the previous list
+            self.main_window.zone_widget.flush()
             bosses = self.boss_db.get_all_bosses()
             for boss in bosses:
                 self.main_window.zone_widget.refresh_boss_info(boss['name'])
@@ -3246,6 +3249,11 @@ class BossTrackerApp(QObject):
     
     def _show_message_editor(self) -> None:
         """Show the message format editor."""
+        try:
+            from .message_editor import MessageEditor
+        except ImportError:
+            from message_editor import MessageEditor
+        
         window = MessageEditor(self.main_window)
         window.set_template(
             self.settings.get('message_template', '{discord_timestamp} {monster} was killed in {location}!'),
@@ -3597,12 +3605,12 @@ def main():
             except Exception:
                 pass
         
-        app.setStyleSheet(_get_theme(theme, accent_color))
+        _apply_app_theme(app, theme, accent_color)
         logger.info(f"Using {theme} theme with accent color {accent_color}")
     except Exception as e:
         logger.error(f"Error loading theme: {e}")
         # Fallback to dark theme
-        app.setStyleSheet(_get_theme("dark", '#007acc'))
+        _apply_app_theme(app, "dark", '#007acc')
     
     # Check if system tray is available
     if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -3703,6 +3711,58 @@ def _darken_color(hex_color: str, factor: float = 0.2) -> str:
     color.setHslF(h, s, l, a)
     return color.name()
 
+# Combo box drop-down arrows (12x8 SVG chevrons), painted by _ComboArrowStyle
+_COMBO_ARROW_B64 = {
+    "dark": "PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEyIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDFMNiA2TDExIDEiIHN0cm9rZT0iI2Q0ZDRkNCIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+",
+    "light": "PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEyIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDFMNiA2TDExIDEiIHN0cm9rZT0iIzFhMWExYSIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+",
+}
+
+
+class _ComboArrowStyle(QProxyStyle):
+    """Proxy style that paints the QComboBox down arrow from a cached pixmap."""
+    
+    _pixmaps: Dict[str, QPixmap] = {}  # theme name -> decoded arrow, shared across instances
+    
+    def __init__(self):
+        super().__init__()
+        self._arrow: Optional[QPixmap] = None
+    
+    def set_theme(self, theme_name: str) -> None:
+        """Select the arrow matching the theme, decoding it on first use."""
+        key = "light" if theme_name == "light" else "dark"
+        if key not in self._pixmaps:
+            pixmap = QPixmap()
+            pixmap.loadFromData(base64.b64decode(_COMBO_ARROW_B64[key]), "SVG")
+            self._pixmaps[key] = pixmap
+        self._arrow = self._pixmaps[key]
+    
+    def drawPrimitive(self, element, option, painter, widget=None) -> None:
+        if (element == QStyle.PrimitiveElement.PE_IndicatorArrowDown
+                and isinstance(widget, QComboBox)
+                and self._arrow is not None and not self._arrow.isNull()):
+            rect = option.rect
+            painter.drawPixmap(
+                rect.x() + (rect.width() - self._arrow.width()) // 2,
+                rect.y() + (rect.height() - self._arrow.height()) // 2,
+                self._arrow
+            )
+            return
+        super().drawPrimitive(element, option, painter, widget)
+
+
+_combo_arrow_style: Optional[_ComboArrowStyle] = None
+
+
+def _apply_app_theme(app: QApplication, theme_name: str, accent_color: str = "#007acc") -> None:
+    """Apply the theme stylesheet and the matching combo box arrow to the application."""
+    global _combo_arrow_style
+    if _combo_arrow_style is None:
+        # Installed once; later theme switches only swap the cached pixmap
+        _combo_arrow_style = _ComboArrowStyle()
+        app.setStyle(_combo_arrow_style)
+    _combo_arrow_style.set_theme(theme_name)
+    app.setStyleSheet(_get_theme(theme_name, accent_color))
+
 def _get_theme(theme_name: str = "dark", accent_color: str = "#007acc") -> str:
     """Get theme QSS by name with optional accent color."""
     if theme_name == "light":
@@ -3774,7 +3834,6 @@ QLineEdit, QTextEdit, QPlainTextEdit {{
     border: 1px solid #2a2a2a;
     border-radius: 4px;
     padding: 4px 8px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
     selection-background-color: {selection_color};
     selection-color: #ffffff;
 }}
@@ -3793,7 +3852,6 @@ QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
 QCheckBox {{
     color: #f0f0f0;
     spacing: 8px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QCheckBox::indicator {{
@@ -3826,14 +3884,12 @@ QListWidget {{
     border: 1px solid #2a2a2a;
     border-radius: 4px;
     alternate-background-color: #151515;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QListWidget::item {{
     padding: 6px 8px;
     border-bottom: 1px solid #2a2a2a;
     color: #f0f0f0;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QListWidget::item:hover {{
@@ -3884,7 +3940,6 @@ QGroupBox QLabel[class="zone-count"] {{
 QLabel {{
     color: #f0f0f0;
     background-color: transparent;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QLabel[class="heading"] {{
@@ -3894,6 +3949,11 @@ QLabel[class="heading"] {{
     font-size: 11pt;
 }}
 
+QLabel[class="hint"] {{
+    color: #888888;
+    font-size: 11px;
+}}
+
 QMenuBar {{
     background-color: #0d0d0d;
     color: #f0f0f0;
@@ -3917,12 +3977,10 @@ QMenu {{
     color: #f0f0f0;
     border: 1px solid #2a2a2a;
     border-radius: 4px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMenu::item {{
     padding: 6px 24px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
     color: #f0f0f0;
 }}
 
@@ -3941,49 +3999,44 @@ QStatusBar {{
     background-color: {status_bar_color};
     color: #ffffff;
     border-top: 1px solid {status_bar_border};
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
-QScrollBar:vertical {{
+QScrollBar:vertical, QScrollBar:horizontal {{
     background-color: #0d0d0d;
-    width: 14px;
     border-radius: 7px;
     border: none;
 }}
 
-QScrollBar::handle:vertical {{
-    background-color: #2a2a2a;
-    border-radius: 7px;
-    min-height: 30px;
-    border: 2px solid #0d0d0d;
+QScrollBar:vertical {{
+    width: 14px;
 }}
 
-QScrollBar::handle:vertical:hover {{
-    background-color: #3a3a3a;
+QScrollBar:horizontal {{
+    height: 14px;
 }}
 
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-    height: 0px;
+QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
+    background-color: #2a2a2a;
+    border-radius: 7px;
+    border: 2px solid #0d0d0d;
 }}
 
-QScrollBar:horizontal {{
-    background-color: #0d0d0d;
-    height: 14px;
-    border-radius: 7px;
-    border: none;
+QScrollBar::handle:vertical {{
+    min-height: 30px;
 }}
 
 QScrollBar::handle:horizontal {{
-    background-color: #2a2a2a;
-    border-radius: 7px;
     min-width: 30px;
-    border: 2px solid #0d0d0d;
 }}
 
-QScrollBar::handle:horizontal:hover {{
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {{
     background-color: #3a3a3a;
 }}
 
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+
 QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
     width: 0px;
 }}
@@ -3995,7 +4048,6 @@ QComboBox {{
     border-radius: 4px;
     padding: 4px 8px;
     min-width: 120px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QComboBox:hover {{
@@ -4009,19 +4061,15 @@ QComboBox:focus {{
 }}
 
 QComboBox::drop-down {{
-    border: none;
     width: 20px;
 }}
 
 QComboBox::down-arrow {{
-    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEyIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDFMNiA2TDExIDEiIHN0cm9rZT0iI2Q0ZDRkNCIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+);
     width: 12px;
     height: 8px;
 }}
 
 QComboBox QAbstractItemView {{
-    background-color: #0d0d0d;
-    color: #f0f0f0;
     border: 1px solid #2a2a2a;
     selection-background-color: {selection_color};
     selection-color: #ffffff;
@@ -4039,17 +4087,15 @@ QSplitter::handle:vertical {{
     height: 2px;
 }}
 
-/* Message Boxes and Dialogs */
-QMessageBox {{
+/* Message Boxes, Tooltips and Popups */
+QMessageBox, QToolTip, QComboBox QAbstractItemView {{
     background-color: #0d0d0d;
     color: #f0f0f0;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMessageBox QLabel {{
     color: #f0f0f0;
     min-width: 300px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMessageBox QPushButton {{
@@ -4059,12 +4105,9 @@ QMessageBox QPushButton {{
 
 /* Tooltips */
 QToolTip {{
-    background-color: #0d0d0d;
-    color: #f0f0f0;
     border: 1px solid #2a2a2a;
     padding: 4px 8px;
     border-radius: 4px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 """.format(
@@ -4142,7 +4185,6 @@ QLineEdit, QTextEdit, QPlainTextEdit {{
     border: 1px solid #cccccc;
     border-radius: 4px;
     padding: 4px 8px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
     selection-background-color: {selection_color};
     selection-color: #ffffff;
 }}
@@ -4161,7 +4203,6 @@ QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
 QCheckBox {{
     color: #1a1a1a;
     spacing: 8px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QCheckBox::indicator {{
@@ -4194,14 +4235,12 @@ QListWidget {{
     border: 1px solid #cccccc;
     border-radius: 4px;
     alternate-background-color: #f9f9f9;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QListWidget::item {{
     padding: 6px 8px;
     border-bottom: 1px solid #e5e5e5;
     color: #1a1a1a;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QListWidget::item:hover {{
@@ -4252,7 +4291,6 @@ QGroupBox QLabel[class="zone-count"] {{
 QLabel {{
     color: #1a1a1a;
     background-color: transparent;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QLabel[class="heading"] {{
@@ -4262,6 +4300,11 @@ QLabel[class="heading"] {{
     font-size: 11pt;
 }}
 
+QLabel[class="hint"] {{
+    color: #888888;
+    font-size: 11px;
+}}
+
 QMenuBar {{
     background-color: #ffffff;
     color: #1a1a1a;
@@ -4285,12 +4328,10 @@ QMenu {{
     color: #1a1a1a;
     border: 1px solid #cccccc;
     border-radius: 4px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMenu::item {{
     padding: 6px 24px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
     color: #1a1a1a;
 }}
 
@@ -4309,49 +4350,44 @@ QStatusBar {{
     background-color: {status_bar_color};
     color: #ffffff;
     border-top: 1px solid {status_bar_border};
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
-QScrollBar:vertical {{
+QScrollBar:vertical, QScrollBar:horizontal {{
     background-color: #ffffff;
-    width: 14px;
     border-radius: 7px;
     border: none;
 }}
 
-QScrollBar::handle:vertical {{
-    background-color: #cccccc;
-    border-radius: 7px;
-    min-height: 30px;
-    border: 2px solid #ffffff;
+QScrollBar:vertical {{
+    width: 14px;
 }}
 
-QScrollBar::handle:vertical:hover {{
-    background-color: #999999;
+QScrollBar:horizontal {{
+    height: 14px;
 }}
 
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-    height: 0px;
+QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
+    background-color: #cccccc;
+    border-radius: 7px;
+    border: 2px solid #ffffff;
 }}
 
-QScrollBar:horizontal {{
-    background-color: #ffffff;
-    height: 14px;
-    border-radius: 7px;
-    border: none;
+QScrollBar::handle:vertical {{
+    min-height: 30px;
 }}
 
 QScrollBar::handle:horizontal {{
-    background-color: #cccccc;
-    border-radius: 7px;
     min-width: 30px;
-    border: 2px solid #ffffff;
 }}
 
-QScrollBar::handle:horizontal:hover {{
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {{
     background-color: #999999;
 }}
 
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+
 QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
     width: 0px;
 }}
@@ -4363,7 +4399,6 @@ QComboBox {{
     border-radius: 4px;
     padding: 4px 8px;
     min-width: 120px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QComboBox:hover {{
@@ -4377,19 +4412,15 @@ QComboBox:focus {{
 }}
 
 QComboBox::drop-down {{
-    border: none;
     width: 20px;
 }}
 
 QComboBox::down-arrow {{
-    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEyIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDFMNiA2TDExIDEiIHN0cm9rZT0iIzFhMWExYSIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+);
     width: 12px;
     height: 8px;
 }}
 
 QComboBox QAbstractItemView {{
-    background-color: #ffffff;
-    color: #1a1a1a;
     border: 1px solid #cccccc;
     selection-background-color: {selection_color};
     selection-color: #ffffff;
@@ -4407,17 +4438,15 @@ QSplitter::handle:vertical {{
     height: 2px;
 }}
 
-/* Message Boxes and Dialogs */
-QMessageBox {{
+/* Message Boxes, Tooltips and Popups */
+QMessageBox, QToolTip, QComboBox QAbstractItemView {{
     background-color: #ffffff;
     color: #1a1a1a;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMessageBox QLabel {{
     color: #1a1a1a;
     min-width: 300px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 QMessageBox QPushButton {{
@@ -4427,12 +4456,9 @@ QMessageBox QPushButton {{
 
 /* Tooltips */
 QToolTip {{
-    background-color: #ffffff;
-    color: #1a1a1a;
     border: 1px solid #cccccc;
     padding: 4px 8px;
     border-radius: 4px;
-    font-family: "Fira Sans", "Segoe UI", Arial, sans-serif;
 }}
 
 """.format(
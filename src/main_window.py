@@ -1,26 +1,71 @@
 """Main application window with target list and activity log."""
+import functools
+import importlib
+import logging
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QMenuBar, QStatusBar, QLabel, QPushButton, QMessageBox, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtBoundSignal, QTimer, QElapsedTimer
+from PyQt6.QtGui import QAction
 from typing import Optional, Callable, Dict, List
 
-try:
-    from .logger import get_logger
-    from .zone_group_widget import ZoneGroupWidget
-    from .activity_log import ActivityLogWidget
-    from .about_dialog import AboutDialog
-    from .quick_start_dialog import QuickStartDialog
-except ImportError:
-    from logger import get_logger
-    from zone_group_widget import ZoneGroupWidget
-    from activity_log import ActivityLogWidget
-    from about_dialog import AboutDialog
-    from quick_start_dialog import QuickStartDialog
+
+def _import_sibling(name: str):
+    """Import a module from this directory, whether loaded as a package or as a script."""
+    if __package__:
+        return importlib.import_module(f".{name}", __package__)
+    return importlib.import_module(name)
+
+
+get_logger = _import_sibling("logger").get_logger
+ZoneGroupWidget = _import_sibling("zone_group_widget").ZoneGroupWidget
+ActivityLogWidget = _import_sibling("activity_log").ActivityLogWidget
 
 logger = get_logger(__name__)
 
+# Window state is saved this long after the last resize/move/splitter drag
+_SAVE_STATE_DELAY_MS = 300
+# A pending save is only pushed back once less than (delay - slack) remains
+_SAVE_STATE_RESTART_SLACK_MS = 50
+
+_MENU_SEPARATOR = "---"
+
+# (menu title, [(action label, signal or method name on MainWindow), ...])
+_MENU_SPEC = (
+    ("File", (
+        ("Settings", "settings_requested"),
+        (_MENU_SEPARATOR, None),
+        ("Exit", "close"),
+    )),
+    # Tools: target management, data operations, then configuration
+    ("Tools", (
+        ("Add Target", "add_boss_requested"),
+        ("Remove Target", "_remove_selected_boss"),
+        ("Edit Bosses", "edit_respawn_times_requested"),
+        (_MENU_SEPARATOR, None),
+        ("Scan", "scan_requested"),
+        ("Sync from Discord", "discord_sync_requested"),
+        ("Refresh", "refresh_requested"),
+        (_MENU_SEPARATOR, None),
+        ("Message Format", "message_format_requested"),
+        ("Switch to Light Mode", "theme_switch_requested"),
+    )),
+    ("Help", (
+        ("Quick Start", "_show_quick_start_dialog"),
+        ("About", "_show_about_dialog"),
+    )),
+)
+
+# Only added when the window is created with debug_mode=True
+_DEBUG_MENU_SPEC = (
+    ("Debug", (
+        ("Boss Capture", "boss_capture_requested"),
+        ("Boss Simulation", "boss_simulation_requested"),
+    )),
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -60,6 +105,22 @@ class MainWindow(QMainWindow):
         # Settings callback for saving window state
         self.on_save_window_state: Optional[Callable] = None
         
+        # Assigned in _setup_ui
+        self.zone_widget: Optional[ZoneGroupWidget] = None
+        
+        # Single debounce timer shared by resize, move and splitter drags
+        self._save_state_timer = QTimer(self)
+        self._save_state_timer.setSingleShot(True)
+        self._save_state_timer.timeout.connect(self._save_window_state)
+        self._save_state_clock = QElapsedTimer()
+        self._save_state_clock.start()
+        self._save_deadline_ms = 0  # Clock time at which the pending save fires
+        # Last (geometry, splitter sizes, zone scroll) handed to on_save_window_state
+        self._last_saved_state: Optional[tuple] = None
+        # Message boxes are built on first use and reused afterwards
+        self._no_targets_msg: Optional[QMessageBox] = None
+        self._error_msg: Optional[QMessageBox] = None
+        
         logger.info("Initializing main window")
         self._setup_ui()
     
@@ -87,14 +148,26 @@ class MainWindow(QMainWindow):
         self.targets_label.customContextMenuRequested.connect(self._show_targets_context_menu)
         self.targets_label.setToolTip("Right-click for Enable All / Disable All")
         targets_header.addWidget(self.targets_label)
+        
+        # Context menu is built once and reused on every right-click
+        self._targets_menu = QMenu(self)
+        enable_action = self._targets_menu.addAction("Enable All")
+        enable_action.triggered.connect(functools.partial(self.all_bosses_enabled_changed.emit, True))
+        disable_action = self._targets_menu.addAction("Disable All")
+        disable_action.triggered.connect(functools.partial(self.all_bosses_enabled_changed.emit, False))
         targets_header.addStretch()
         
         left_layout.addLayout(targets_header)
         
         # Zone groups widget (scrollable)
         self.zone_widget = ZoneGroupWidget()
-        self.zone_widget.boss_enabled_changed.connect(self._on_boss_enabled_changed)
-        self.zone_widget.zone_enabled_changed.connect(self._on_zone_enabled_changed)
+        # Same-thread forwarding: dispatch directly rather than via AutoConnection
+        self.zone_widget.boss_enabled_changed.connect(
+            self._on_boss_enabled_changed, Qt.ConnectionType.DirectConnection
+        )
+        self.zone_widget.zone_enabled_changed.connect(
+            self._on_zone_enabled_changed, Qt.ConnectionType.DirectConnection
+        )
         self.zone_widget.edit_boss_requested.connect(self.edit_boss_requested.emit)
         left_layout.addWidget(self.zone_widget)
         
@@ -132,68 +205,21 @@ class MainWindow(QMainWindow):
     def _create_menu_bar(self) -> None:
         """Create the menu bar."""
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("File")
-        
-        settings_action = file_menu.addAction("Settings")
-        settings_action.triggered.connect(self.settings_requested.emit)
-        
-        file_menu.addSeparator()
-        
-        exit_action = file_menu.addAction("Exit")
-        exit_action.triggered.connect(self.close)
-        
-        # Tools menu (utility functions and configuration)
-        tools_menu = menubar.addMenu("Tools")
-        
-        # Target Management Section
-        add_target_action = tools_menu.addAction("Add Target")
-        add_target_action.triggered.connect(self.add_boss_requested.emit)
-        
-        remove_target_action = tools_menu.addAction("Remove Target")
-        remove_target_action.triggered.connect(self._remove_selected_boss)
-        
-        edit_respawn_action = tools_menu.addAction("Edit Bosses")
-        edit_respawn_action.triggered.connect(self.edit_respawn_times_requested.emit)
-        
-        tools_menu.addSeparator()
-        
-        # Data Operations Section
-        scan_action = tools_menu.addAction("Scan")
-        scan_action.triggered.connect(self.scan_requested.emit)
-        
-        discord_sync_action = tools_menu.addAction("Sync from Discord")
-        discord_sync_action.triggered.connect(self.discord_sync_requested.emit)
-        
-        refresh_action = tools_menu.addAction("Refresh")
-        refresh_action.triggered.connect(self.refresh_requested.emit)
-        
-        tools_menu.addSeparator()
-        
-        # Settings/Configuration Section
-        message_format_action = tools_menu.addAction("Message Format")
-        message_format_action.triggered.connect(self.message_format_requested.emit)
+        actions: Dict[str, QAction] = {}
+        menu_spec = _MENU_SPEC + _DEBUG_MENU_SPEC if self.debug_mode else _MENU_SPEC
+        for menu_title, items in menu_spec:
+            menu = menubar.addMenu(menu_title)
+            for label, target_name in items:
+                if label == _MENU_SEPARATOR:
+                    menu.addSeparator()
+                    continue
+                target = getattr(self, target_name)
+                action = menu.addAction(label)
+                action.triggered.connect(target.emit if isinstance(target, pyqtBoundSignal) else target)
+                actions[label] = action
         
         # Theme switcher - dynamically shows opposite mode
-        self.theme_switch_action = tools_menu.addAction("Switch to Light Mode")
-        self.theme_switch_action.triggered.connect(self.theme_switch_requested.emit)
-        
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        quick_start_action = help_menu.addAction("Quick Start")
-        quick_start_action.triggered.connect(self._show_quick_start_dialog)
-        about_action = help_menu.addAction("About")
-        about_action.triggered.connect(self._show_about_dialog)
-        
-        # Debug menu (only when debug_mode is True)
-        if self.debug_mode:
-            debug_menu = menubar.addMenu("Debug")
-            boss_capture_action = debug_menu.addAction("Boss Capture")
-            boss_capture_action.triggered.connect(self.boss_capture_requested.emit)
-            boss_simulation_action = debug_menu.addAction("Boss Simulation")
-            boss_simulation_action.triggered.connect(self.boss_simulation_requested.emit)
-            # Advanced Settings removed - use main settings / manual webhook change for testing
+        self.theme_switch_action = actions["Switch to Light Mode"]
     
     def update_theme_menu(self, current_theme: str) -> None:
         """Update the theme switch menu item text based on current theme."""
@@ -205,6 +231,7 @@ class MainWindow(QMainWindow):
     def set_bosses(self, bosses: List[Dict]) -> None:
         """Set the list of bosses to display."""
         logger.debug(f"Setting {len(bosses)} bosses in main window")
+        # The zone widget coalesces updates and suspends painting while it applies them
         self.zone_widget.set_bosses(bosses)
     
     def add_activity(self, timestamp: str, monster: str, location: str, 
@@ -224,44 +251,55 @@ class MainWindow(QMainWindow):
     
     def _on_boss_enabled_changed(self, boss: Dict, enabled: bool) -> None:
         """Handle boss enable/disable change."""
-        boss_name = boss.get('name', 'Unknown')
-        note = boss.get('note', '').strip()
-        logger.info(f"Boss '{boss_name}' ({note or 'no note'}) {'enabled' if enabled else 'disabled'}")
+        # Checkboxes re-fire when the zone widget repopulates; skip no-op transitions
+        if bool(boss.get('enabled', False)) == enabled:
+            return
+        if logger.isEnabledFor(logging.INFO):
+            boss_name = boss.get('name', 'Unknown')
+            note = boss.get('note', '').strip()
+            logger.info(f"Boss '{boss_name}' ({note or 'no note'}) {'enabled' if enabled else 'disabled'}")
         # Only emit signal - don't call callback directly to avoid double-calling
         # Pass boss dict for proper duplicate handling
         self.boss_enabled_changed.emit(boss, enabled)
     
     def _on_zone_enabled_changed(self, zone_name: str, enabled: bool) -> None:
         """Handle zone enable/disable change."""
-        logger.info(f"Zone '{zone_name}' {'enabled' if enabled else 'disabled'} for all targets")
+        if self.zone_widget is not None:
+            # Apply any coalesced set_bosses first so the check sees the current list
+            self.zone_widget.flush()
+            zone_bosses = [b for b in self.zone_widget.bosses if b.get('location') == zone_name]
+            if zone_bosses and all(bool(b.get('enabled', False)) == enabled for b in zone_bosses):
+                return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Zone '{zone_name}' {'enabled' if enabled else 'disabled'} for all targets")
         # Only emit signal - don't call callback directly to avoid double-calling
         self.zone_enabled_changed.emit(zone_name, enabled)
     
     def _show_targets_context_menu(self, pos) -> None:
         """Show context menu for bulk Enable All / Disable All on the Targets header."""
-        menu = QMenu(self)
-        enable_action = menu.addAction("Enable All")
-        enable_action.triggered.connect(lambda: self.all_bosses_enabled_changed.emit(True))
-        disable_action = menu.addAction("Disable All")
-        disable_action.triggered.connect(lambda: self.all_bosses_enabled_changed.emit(False))
-        menu.exec(self.targets_label.mapToGlobal(pos))
+        self._targets_menu.exec(self.targets_label.mapToGlobal(pos))
     
     def _remove_selected_boss(self) -> None:
         """Remove a boss using the remove boss dialog."""
         try:
-            from .remove_boss_dialog import RemoveBossDialog
+            RemoveBossDialog = _import_sibling("remove_boss_dialog").RemoveBossDialog
             
             # Get current list of bosses from the zone widget
             bosses = []
-            if hasattr(self, 'zone_widget') and hasattr(self.zone_widget, 'bosses'):
+            if self.zone_widget is not None:
+                self.zone_widget.flush()
                 bosses = self.zone_widget.bosses
             
             if not bosses:
-                QMessageBox.information(
-                    self,
-                    "No Targets",
-                    "No targets available to remove."
-                )
+                if self._no_targets_msg is None:
+                    self._no_targets_msg = QMessageBox(
+                        QMessageBox.Icon.Information,
+                        "No Targets",
+                        "No targets available to remove.",
+                        QMessageBox.StandardButton.Ok,
+                        self
+                    )
+                self._no_targets_msg.exec()
                 return
             
             dialog = RemoveBossDialog(bosses, self)
@@ -277,18 +315,23 @@ class MainWindow(QMainWindow):
                     self.remove_boss_requested.emit(boss_name)
         except ImportError as e:
             logger.error(f"Error importing remove boss dialog: {e}", exc_info=True)
-            QMessageBox.warning(
-                self,
-                "Error",
-                f"Could not open remove target dialog: {e}"
-            )
+            self._show_error(f"Could not open remove target dialog: {e}")
         except Exception as e:
             logger.error(f"Error showing remove boss dialog: {e}", exc_info=True)
-            QMessageBox.warning(
-                self,
+            self._show_error(f"Could not open remove target dialog: {e}")
+    
+    def _show_error(self, text: str) -> None:
+        """Show a warning using the shared "Error" message box."""
+        if self._error_msg is None:
+            self._error_msg = QMessageBox(
+                QMessageBox.Icon.Warning,
                 "Error",
-                f"Could not open remove target dialog: {e}"
+                "",
+                QMessageBox.StandardButton.Ok,
+                self
             )
+        self._error_msg.setText(text)
+        self._error_msg.exec()
     
     def closeEvent(self, event) -> None:
         """Handle window close event - minimize to tray instead."""
@@ -302,43 +345,45 @@ class MainWindow(QMainWindow):
         """Handle window resize - save state after a short delay."""
         super().resizeEvent(event)
         # Defer saving to avoid excessive saves during resize
-        if not hasattr(self, '_resize_timer'):
-            self._resize_timer = QTimer()
-            self._resize_timer.setSingleShot(True)
-            self._resize_timer.timeout.connect(self._save_window_state)
-        self._resize_timer.stop()
-        self._resize_timer.start(500)  # Save 500ms after resize stops
+        self._schedule_state_save()
     
     def moveEvent(self, event) -> None:
         """Handle window move - save state after a short delay."""
         super().moveEvent(event)
         # Defer saving to avoid excessive saves during move
-        if not hasattr(self, '_move_timer'):
-            self._move_timer = QTimer()
-            self._move_timer.setSingleShot(True)
-            self._move_timer.timeout.connect(self._save_window_state)
-        self._move_timer.stop()
-        self._move_timer.start(500)  # Save 500ms after move stops
+        self._schedule_state_save()
     
     def _on_splitter_moved(self, pos: int, index: int) -> None:
         """Handle splitter movement - save position after a short delay."""
         # Defer saving to avoid excessive saves during drag
-        if not hasattr(self, '_splitter_timer'):
-            self._splitter_timer = QTimer()
-            self._splitter_timer.setSingleShot(True)
-            self._splitter_timer.timeout.connect(self._save_window_state)
-        self._splitter_timer.stop()
-        self._splitter_timer.start(300)  # Save 300ms after splitter stops moving
+        self._schedule_state_save()
+    
+    def _schedule_state_save(self) -> None:
+        """(Re)start the debounced window state save.
+        
+        Drag events arrive many times per second; the timer is only restarted
+        when the pending save is about to fire, not on every event.
+        """
+        now = self._save_state_clock.elapsed()
+        if (self._save_state_timer.isActive()
+                and now + _SAVE_STATE_DELAY_MS - self._save_deadline_ms <= _SAVE_STATE_RESTART_SLACK_MS):
+            return
+        self._save_state_timer.start(_SAVE_STATE_DELAY_MS)
+        self._save_deadline_ms = now + _SAVE_STATE_DELAY_MS
     
     def _save_window_state(self) -> None:
         """Save window geometry, splitter state, and Targets by Zone scroll position."""
         if self.on_save_window_state:
-            geometry = self.saveGeometry()
+            geometry = bytes(self.saveGeometry())
             splitter_sizes = self.splitter.sizes()
             zone_scroll = 0
-            if hasattr(self, "zone_widget") and self.zone_widget is not None:
+            if self.zone_widget is not None:
                 zone_scroll = self.zone_widget.verticalScrollBar().value()
+            state = (geometry, tuple(splitter_sizes), zone_scroll)
+            if state == self._last_saved_state:
+                return  # Nothing changed since the last save
             self.on_save_window_state(geometry, splitter_sizes, zone_scroll)
+            self._last_saved_state = state
     
     def restore_window_state(self, geometry: bytes, splitter_sizes: list, zone_scroll_position: Optional[int] = None) -> None:
         """Restore window geometry, splitter state, and Targets by Zone scroll position."""
@@ -356,17 +401,24 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 logger.warning(f"Could not restore splitter sizes: {e}")
         
-        if zone_scroll_position is not None and zone_scroll_position >= 0 and hasattr(self, "zone_widget") and self.zone_widget is not None:
-            sb = self.zone_widget.verticalScrollBar()
+        if zone_scroll_position is not None and zone_scroll_position >= 0 and self.zone_widget is not None:
             # Defer so layout is complete and maximum() is valid
-            QTimer.singleShot(200, lambda: sb.setValue(min(zone_scroll_position, sb.maximum())))
+            QTimer.singleShot(200, functools.partial(self._restore_zone_scroll, zone_scroll_position))
+    
+    def _restore_zone_scroll(self, zone_scroll_position: int) -> None:
+        """Apply a saved Targets by Zone scroll position, clamped to the current range."""
+        # scroll_to builds the lazily-populated zones above the target first
+        self.zone_widget.scroll_to(zone_scroll_position)
     
     def _show_quick_start_dialog(self) -> None:
         """Show the Quick Start dialog."""
+        # Imported on first use; the dialog is rarely opened
+        QuickStartDialog = _import_sibling("quick_start_dialog").QuickStartDialog
         dialog = QuickStartDialog(self)
         dialog.exec()
 
     def _show_about_dialog(self) -> None:
         """Show the about dialog."""
+        AboutDialog = _import_sibling("about_dialog").AboutDialog
         dialog = AboutDialog(self)
         dialog.exec()
@@ -1,8 +1,10 @@
 """Message format editor window."""
+import functools
 import re
-from typing import Optional, Callable
+import string
+from typing import List, Optional, Callable
 from PyQt6.QtWidgets import (
-    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton,
     QGroupBox, QMessageBox
 )
 from PyQt6.QtCore import Qt
@@ -14,10 +16,97 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# {note} plus any surrounding parentheses/spaces, removed when the note is empty
+_NOTE_RE = re.compile(r'\s*\(?\s*\{note\}\s*\)?\s*')
+_WS_RE = re.compile(r'\s+')
+
+_FORMATTER = string.Formatter()
+
+# Variables a message template may reference
+_ALLOWED_FIELDS = frozenset({
+    'timestamp', 'discord_timestamp', 'discord_timestamp_relative', 'monster',
+    'note', 'player', 'guild', 'location', 'server'
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str, drop_note: bool = False) -> tuple:
+    """
+    Pre-split a template into (literal, field_name, format_spec, conversion) segments.
+    
+    With drop_note, {note} and its surrounding parentheses/spaces are removed
+    first (for bosses without a note), so rendering never touches a regex.
+    """
+    if drop_note:
+        if '{note}' in template:
+            # Handle patterns like " ({note})", " {note}", "{note} ", etc.
+            template = _NOTE_RE.sub(' ', template)
+        # Clean up multiple spaces
+        template = _WS_RE.sub(' ', template).strip()
+    return tuple(_FORMATTER.parse(template))
+
+
+def _check_template_fields(template: str) -> None:
+    """Raise KeyError for the first variable not in _ALLOWED_FIELDS (ValueError if malformed)."""
+    for _, field_name, _, _ in _compile_template(template):
+        if field_name is not None and field_name not in _ALLOWED_FIELDS:
+            raise KeyError(field_name)
+
 
 class MessageEditor(QDialog):
     """Window for editing Discord message format."""
     
+    # Sample data shared by every preview/save - never mutate these
+    # Regular message sample data
+    _SAMPLE_DATA = {
+        'timestamp': 'Sat Nov 22 23:02:42 2025',
+        'discord_timestamp': '<t:1732312962:F>',  # Example Discord timestamp
+        'discord_timestamp_relative': '<t:1732312962:R>',
+        'monster': 'Severilous',
+        'note': '',  # No note for this example
+        'player': 'Saelilya',
+        'guild': 'Former Glory',
+        'location': 'The Emerald Jungle',
+        'server': 'Druzzil Ro'
+    }
+    
+    # Regular message sample data with a note
+    _SAMPLE_DATA_WITH_NOTE = {
+        'timestamp': 'Sat Nov 22 23:02:42 2025',
+        'discord_timestamp': '<t:1732312962:F>',
+        'discord_timestamp_relative': '<t:1732312962:R>',
+        'monster': 'Thall Va Xakra',
+        'note': 'F1 North',  # Example note
+        'player': 'Saelilya',
+        'guild': 'Former Glory',
+        'location': 'Vex Thal',
+        'server': 'Druzzil Ro'
+    }
+    
+    # Lockout message sample data (no location, player, guild)
+    _LOCKOUT_SAMPLE = {
+        'timestamp': 'Mon Jan 12 22:01:42 2026',
+        'discord_timestamp': '<t:1732312962:F>',
+        'discord_timestamp_relative': '<t:1732312962:R>',
+        'monster': 'Emperor Ssraeshza',
+        'note': '',  # No note for lockout example
+        'player': '',
+        'guild': '',
+        'location': '',
+        'server': ''
+    }
+    _LOCKOUT_SAMPLE_WITH_NOTE = {
+        'timestamp': 'Mon Jan 12 22:01:42 2026',
+        'discord_timestamp': '<t:1732312962:F>',
+        'discord_timestamp_relative': '<t:1732312962:R>',
+        'monster': 'Kaas Thox Xi Aten Ha Ra',
+        'note': 'South Blob',  # So template ({note}) shows parentheses in preview
+        'player': '',
+        'guild': '',
+        'location': '',
+        'server': ''
+    }
+    
     def __init__(self, parent=None):
         """Initialize the message editor."""
         super().__init__(parent)
@@ -29,6 +118,9 @@ class MessageEditor(QDialog):
         self.lockout_template = ""
         self.on_save: Optional[Callable] = None
         
+        # (template, lockout_template) last rendered into the preview labels
+        self._last_preview_key: Optional[tuple] = None
+        
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -56,7 +148,7 @@ class MessageEditor(QDialog):
         editor_group = QGroupBox("Message Template")
         editor_layout = QVBoxLayout()
         
-        self.template_edit = QTextEdit()
+        self.template_edit = QPlainTextEdit()
         self.template_edit.setPlaceholderText(
             "Example: {discord_timestamp} {monster} ({note}) was killed by {player} of <{guild}> in {location}!"
         )
@@ -75,7 +167,7 @@ class MessageEditor(QDialog):
         lockout_info.setStyleSheet("color: #999999; font-style: italic;")
         lockout_layout.addWidget(lockout_info)
         
-        self.lockout_template_edit = QTextEdit()
+        self.lockout_template_edit = QPlainTextEdit()
         self.lockout_template_edit.setPlaceholderText(
             "Example: {discord_timestamp} {monster} lockout detected!"
         )
@@ -132,62 +224,18 @@ class MessageEditor(QDialog):
         template = self.template_edit.toPlainText().strip()
         lockout_template = self.lockout_template_edit.toPlainText().strip()
         
-        # Regular message sample data
-        sample_data = {
-            'timestamp': 'Sat Nov 22 23:02:42 2025',
-            'discord_timestamp': '<t:1732312962:F>',  # Example Discord timestamp
-            'discord_timestamp_relative': '<t:1732312962:R>',
-            'monster': 'Severilous',
-            'note': '',  # No note for this example
-            'player': 'Saelilya',
-            'guild': 'Former Glory',
-            'location': 'The Emerald Jungle',
-            'server': 'Druzzil Ro'
-        }
-        
-        # Also show example with note
-        sample_data_with_note = {
-            'timestamp': 'Sat Nov 22 23:02:42 2025',
-            'discord_timestamp': '<t:1732312962:F>',
-            'discord_timestamp_relative': '<t:1732312962:R>',
-            'monster': 'Thall Va Xakra',
-            'note': 'F1 North',  # Example note
-            'player': 'Saelilya',
-            'guild': 'Former Glory',
-            'location': 'Vex Thal',
-            'server': 'Druzzil Ro'
-        }
-        
-        # Lockout message sample data (no location, player, guild)
-        lockout_sample_data = {
-            'timestamp': 'Mon Jan 12 22:01:42 2026',
-            'discord_timestamp': '<t:1732312962:F>',
-            'discord_timestamp_relative': '<t:1732312962:R>',
-            'monster': 'Emperor Ssraeshza',
-            'note': '',  # No note for lockout example
-            'player': '',
-            'guild': '',
-            'location': '',
-            'server': ''
-        }
-        lockout_sample_data_with_note = {
-            'timestamp': 'Mon Jan 12 22:01:42 2026',
-            'discord_timestamp': '<t:1732312962:F>',
-            'discord_timestamp_relative': '<t:1732312962:R>',
-            'monster': 'Kaas Thox Xi Aten Ha Ra',
-            'note': 'South Blob',  # So template ({note}) shows parentheses in preview
-            'player': '',
-            'guild': '',
-            'location': '',
-            'server': ''
-        }
+        # Sample data is static, so unchanged templates render the same preview
+        preview_key = (template, lockout_template)
+        if preview_key == self._last_preview_key:
+            return
+        self._last_preview_key = preview_key
         
         # Update regular preview
         try:
             if template:
                 # Show two previews: one without note, one with note
-                preview_no_note = self._format_template_with_note(template, sample_data)
-                preview_with_note = self._format_template_with_note(template, sample_data_with_note)
+                preview_no_note = self._format_template_with_note(template, self._SAMPLE_DATA)
+                preview_with_note = self._format_template_with_note(template, self._SAMPLE_DATA_WITH_NOTE)
                 
                 preview_text = f"Regular (no note): {preview_no_note}\nRegular (with note): {preview_with_note}"
                 self.preview_label.setText(preview_text)
@@ -206,8 +254,8 @@ class MessageEditor(QDialog):
         # Update lockout preview (with and without note so ({note}) is visible when used)
         try:
             if lockout_template:
-                preview_no_note = self._format_template_with_note(lockout_template, lockout_sample_data)
-                preview_with_note = self._format_template_with_note(lockout_template, lockout_sample_data_with_note)
+                preview_no_note = self._format_template_with_note(lockout_template, self._LOCKOUT_SAMPLE)
+                preview_with_note = self._format_template_with_note(lockout_template, self._LOCKOUT_SAMPLE_WITH_NOTE)
                 self.lockout_preview_label.setText(f"Lockout (no note): {preview_no_note}\nLockout (with note): {preview_with_note}")
             else:
                 self.lockout_preview_label.setText("Lockout: (empty)")
@@ -220,10 +268,9 @@ class MessageEditor(QDialog):
             error_msg = f"Lockout Error: {e}"
             self.lockout_preview_label.setText(error_msg)
             logger.error(f"Lockout preview error: {e}")
-        # Force UI to refresh so preview reflects current template text immediately
+        # Schedule a repaint; Qt coalesces it on the next event loop iteration
         self.preview_label.update()
         self.lockout_preview_label.update()
-        QApplication.processEvents()
     
     def _format_template_with_note(self, template: str, data: dict) -> str:
         """
@@ -238,17 +285,42 @@ class MessageEditor(QDialog):
         """
         note = data.get('note', '').strip()
         
+        # Render from the cached pre-split template instead of letting str.format re-parse
+        segments = _compile_template(template, not note)
         if not note:
-            # Remove {note} and clean up surrounding spaces/punctuation
-            # Handle patterns like " ({note})", " {note}", "{note} ", etc.
-            # Remove {note} and any surrounding parentheses and spaces
-            template = re.sub(r'\s*\(?\s*\{note\}\s*\)?\s*', ' ', template)
-            # Clean up multiple spaces
-            template = re.sub(r'\s+', ' ', template).strip()
-            # Remove note from data so format() doesn't try to use it
+            # Remove note from data so formatting doesn't try to use it
             data = {k: v for k, v in data.items() if k != 'note'}
         
-        return template.format(**data)
+        parts = []
+        for literal, field_name, format_spec, conversion in segments:
+            parts.append(literal)
+            if field_name is not None:
+                value, _ = _FORMATTER.get_field(field_name, (), data)
+                value = _FORMATTER.convert_field(value, conversion)
+                parts.append(format(value, format_spec or ''))
+        return ''.join(parts)
+    
+    def _validate_template(self, template: str, kind: str) -> List[str]:
+        """
+        Check a template's variables.
+        
+        Args:
+            template: Message template string
+            kind: "Regular" or "Lockout", used in messages
+            
+        Returns:
+            List of error messages (empty if the template is valid)
+        """
+        try:
+            _check_template_fields(template)
+        except KeyError as e:
+            logger.error(f"{kind} template validation failed - unknown variable: {e}")
+            return [f"Unknown variable in {kind.lower()} template: {e}"]
+        except Exception as e:
+            logger.error(f"{kind} template validation failed: {e}")
+            return [f"{kind} template error: {e}"]
+        logger.debug(f"{kind} template validation successful")
+        return []
     
     def _save(self) -> None:
         """Save the templates."""
@@ -265,64 +337,10 @@ class MessageEditor(QDialog):
             QMessageBox.warning(self, "Empty Template", "Lockout message template cannot be empty.")
             return
         
-        # Validate regular template with sample data
-        sample_data = {
-            'timestamp': 'test',
-            'discord_timestamp': '<t:1234567890:F>',
-            'discord_timestamp_relative': '<t:1234567890:R>',
-            'monster': 'test',
-            'note': '',  # Empty note for validation
-            'player': 'test',
-            'guild': 'test',
-            'location': 'test',
-            'server': 'test'
-        }
-        
-        try:
-            # Use the note-aware formatter for validation
-            self._format_template_with_note(template, sample_data)
-            logger.debug("Regular template validation successful")
-        except KeyError as e:
-            logger.error(f"Regular template validation failed - unknown variable: {e}")
-            QMessageBox.warning(
-                self,
-                "Invalid Template",
-                f"Unknown variable in regular template: {e}"
-            )
-            return
-        except Exception as e:
-            logger.error(f"Regular template validation failed: {e}")
-            QMessageBox.warning(self, "Invalid Template", f"Regular template error: {e}")
-            return
-        
-        # Validate lockout template (no location, player, guild)
-        lockout_sample_data = {
-            'timestamp': 'test',
-            'discord_timestamp': '<t:1234567890:F>',
-            'discord_timestamp_relative': '<t:1234567890:R>',
-            'monster': 'test',
-            'note': '',  # Empty note for validation
-            'player': '',
-            'guild': '',
-            'location': '',
-            'server': ''
-        }
-        
-        try:
-            # Use the note-aware formatter for validation
-            self._format_template_with_note(lockout_template, lockout_sample_data)
-            logger.debug("Lockout template validation successful")
-        except KeyError as e:
-            logger.error(f"Lockout template validation failed - unknown variable: {e}")
-            QMessageBox.warning(
-                self,
-                "Invalid Template",
-                f"Unknown variable in lockout template: {e}"
-            )
-            return
-        except Exception as e:
-            logger.error(f"Lockout template validation failed: {e}")
-            QMessageBox.warning(self, "Invalid Template", f"Lockout template error: {e}")
+        # Validate both templates so every problem is reported in one dialog
+        errors = self._validate_template(template, "Regular") + self._validate_template(lockout_template, "Lockout")
+        if errors:
+            QMessageBox.warning(self, "Invalid Template", "\n".join(errors))
             return
         
         logger.info("Saving message templates")
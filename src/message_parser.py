@@ -1,7 +1,16 @@
 """Parse EverQuest log messages to extract boss kill information."""
 import re
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import FrozenSet, List, Optional
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
 
 try:
     from .logger import get_logger
@@ -10,10 +19,20 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Keyword pre-check needles, matched case-sensitively against the raw line
+_GUILD_KW = "tells the guild"
+_KILLED_KW = "has killed"
+_IN_KW = "in "
+_LOCKOUT_KW = "incurred a lockout"
+_EXPIRES_KW = "expires in"
 
-@dataclass
+
+@dataclass(frozen=True)
 class BossKillMessage:
     """Structured data from a parsed boss kill message."""
+    # Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('timestamp', 'server', 'player', 'guild', 'monster', 'location')
+    
     timestamp: str
     server: str
     player: str
@@ -22,23 +41,85 @@ class BossKillMessage:
     location: str
 
 
+def _kill_from_groups(timestamp: str, server: str, player: str, guild: str,
+                      monster: str, location: str) -> BossKillMessage:
+    """Build a BossKillMessage from PATTERN's groups."""
+    # Server, guild, zone and boss names repeat across thousands of lines, so
+    # intern them; timestamp may carry a trailing CR from Windows log lines
+    return BossKillMessage(
+        timestamp=timestamp.strip(),
+        server=sys.intern(server),
+        player=player,
+        guild=sys.intern(guild),
+        monster=sys.intern(monster),
+        location=sys.intern(location)
+    )
+
+
 class MessageParser:
     """Parse guild messages about boss kills from EverQuest logs."""
     
     # Pattern: [timestamp] server tells the guild, 'player of <guild> has killed monster in location!'
+    # Delimited fields use negated character classes so the engine never backtracks
+    # into them; server/player/monster keep lazy groups (they may contain spaces).
+    # No group can cross a newline, so the patterns are safe to run over a whole buffer.
+    # Separators absorb runs of spaces, so only the timestamp group needs stripping.
     PATTERN = re.compile(
-        r"\[(.+?)\] (.+?) tells the guild, '(.+?) of <(.+?)> has killed (.+?) in (.+?)!'"
+        r"\[([^\]\n]+)\] +([^'\n]+?) +tells the guild, ' *([^'\n]+?) +of < *([^>\n]+?) *> +has killed +(.+?) +in +([^!\n]+?) *!'"
     )
     
     # Pattern: [timestamp] You have incurred a lockout for BossName that expires in X Days and Y Hours.
     LOCKOUT_PATTERN = re.compile(
-        r"\[(.+?)\] You have incurred a lockout for (.+?) that expires in"
+        r"\[([^\]\n]+)\] You have incurred a lockout for +(.+?) +that expires in"
     )
 
     # Pattern: [timestamp] Boss Name in Zone (e.g. from Discord or manual posts)
     # Matches lines like: [Sun Feb 15 13:56:04 2026] Lady Vox in Permafrost Caverns
     SIMPLE_PATTERN = re.compile(r"^\[(.+?)\]\s+(.+?)\s+in\s+(.+)$", re.MULTILINE)
 
+    # Optional Hyperscan database holding PATTERN (id 0) and LOCKOUT_PATTERN (id 1).
+    # Built on first use; False once compilation has failed.
+    _hs_db = None
+    _hs_lock = threading.Lock()
+    # (line, ids) of the last scan, so the parse_line -> parse_lockout_line
+    # fallback scans each line only once
+    _hs_last: tuple = (None, frozenset())
+
+    @classmethod
+    def _hyperscan_ids(cls, line: str) -> Optional[FrozenSet[int]]:
+        """
+        Scan a line for both patterns in a single Hyperscan pass.
+        
+        Returns:
+            Set of matching pattern ids, or None if Hyperscan is unavailable
+        """
+        if not HYPERSCAN_AVAILABLE or cls._hs_db is False:
+            return None
+        with cls._hs_lock:
+            if cls._hs_last[0] == line:
+                return cls._hs_last[1]
+            if cls._hs_db is None:
+                try:
+                    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                    db.compile(
+                        expressions=[cls.PATTERN.pattern.encode(), cls.LOCKOUT_PATTERN.pattern.encode()],
+                        ids=[0, 1],
+                        elements=2,
+                        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * 2
+                    )
+                    cls._hs_db = db
+                except Exception as e:
+                    logger.warning(f"Could not compile Hyperscan database, using re fallback: {e}")
+                    cls._hs_db = False
+                    return None
+            ids = set()
+            cls._hs_db.scan(
+                line.encode('utf-8', errors='ignore'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: ids.add(pattern_id)
+            )
+            cls._hs_last = (line, frozenset(ids))
+            return cls._hs_last[1]
+
     @classmethod
     def parse_simple_line(cls, line: str) -> Optional[BossKillMessage]:
         """
@@ -78,30 +159,48 @@ class MessageParser:
         Returns:
             BossKillMessage if the line matches the pattern, None otherwise
         """
-        # Check if line contains keywords that suggest it might be a boss kill message
-        if "tells the guild" in line.lower() and "has killed" in line.lower() and "in " in line.lower():
+        ids = cls._hyperscan_ids(line)
+        if ids is not None:
+            candidate = 0 in ids
+        else:
+            # Check if line contains keywords that suggest it might be a boss kill message.
+            # PATTERN is case-sensitive, so a lowered copy of the line would only admit
+            # lines that can never match.
+            candidate = _GUILD_KW in line and _KILLED_KW in line and _IN_KW in line
+        if candidate:
             match = cls.PATTERN.search(line)
             if not match:
                 # Log potential matches that didn't parse (for debugging)
-                logger.debug(f"Line contains boss kill keywords but didn't match pattern: {line[:100]}...")
+                # Lazy %-formatting: the line is only truncated/formatted if DEBUG is emitted
+                logger.debug("Line contains boss kill keywords but didn't match pattern: %.100s...", line)
                 return None
             
-            timestamp, server, player, guild, monster, location = match.groups()
-            
-            result = BossKillMessage(
-                timestamp=timestamp.strip(),
-                server=server.strip(),
-                player=player.strip(),
-                guild=guild.strip(),
-                monster=monster.strip(),
-                location=location.strip()
-            )
+            result = _kill_from_groups(*match.groups())
             
-            logger.debug(f"Parsed boss kill: {result.monster} in {result.location} by {result.player}")
+            logger.debug("Parsed boss kill: %s in %s by %s", result.monster, result.location, result.player)
             return result
         
         return None
     
+    @classmethod
+    def parse_lines(cls, text: str) -> List[BossKillMessage]:
+        """
+        Parse every boss kill message in a block of log text.
+        
+        Runs a single regex scan over the whole buffer instead of calling
+        parse_line once per line.
+        
+        Args:
+            text: One or more lines from the EverQuest log file
+            
+        Returns:
+            List of BossKillMessage in the order they appear in the text
+        """
+        return [
+            _kill_from_groups(*match.groups())
+            for match in cls.PATTERN.finditer(text)
+        ]
+    
     @classmethod
     def parse_lockout_line(cls, line: str) -> Optional[BossKillMessage]:
         """
@@ -115,7 +214,12 @@ class MessageParser:
         Returns:
             BossKillMessage if the line matches the lockout pattern, None otherwise
         """
-        if "incurred a lockout" in line.lower() and "expires in" in line.lower():
+        ids = cls._hyperscan_ids(line)
+        if ids is not None:
+            candidate = 1 in ids
+        else:
+            candidate = _LOCKOUT_KW in line and _EXPIRES_KW in line
+        if candidate:
             match = cls.LOCKOUT_PATTERN.search(line)
             if match:
                 timestamp, monster = match.groups()
@@ -125,12 +229,34 @@ class MessageParser:
                     server="",  # Not available in lockout message
                     player="",  # Not available in lockout message
                     guild="",   # Not available in lockout message
-                    monster=monster.strip(),
+                    monster=monster,
                     location="Lockouts"  # Special category for lockout-detected bosses
                 )
                 
-                logger.debug(f"Parsed lockout boss kill: {result.monster} (location: Lockouts)")
+                logger.debug("Parsed lockout boss kill: %s (location: Lockouts)", result.monster)
                 return result
         
         return None
-
+    
+    @classmethod
+    def parse_lockout_lines(cls, text: str) -> List[BossKillMessage]:
+        """
+        Parse every lockout message in a block of log text.
+        
+        Args:
+            text: One or more lines from the EverQuest log file
+            
+        Returns:
+            List of BossKillMessage (location "Lockouts") in the order they appear
+        """
+        return [
+            BossKillMessage(
+                timestamp=timestamp.strip(),
+                server="",
+                player="",
+                guild="",
+                monster=monster,
+                location="Lockouts"
+            )
+            for timestamp, monster in (match.groups() for match in cls.LOCKOUT_PATTERN.finditer(text))
+        ]
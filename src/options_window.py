@@ -2,18 +2,13 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QCheckBox, QGroupBox, QFileDialog, QComboBox, QFormLayout, QMessageBox,
-    QRadioButton, QButtonGroup, QColorDialog, QSpinBox
+    QColorDialog, QSpinBox, QAbstractButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QColor, QStandardItemModel, QStandardItem
 from typing import Optional, Callable
 from pathlib import Path
 
-try:
-    from .backup_restore_dialog import BackupRestoreDialog
-except ImportError:
-    from backup_restore_dialog import BackupRestoreDialog
-
 try:
     from .logger import get_logger
 except ImportError:
@@ -25,6 +20,56 @@ logger = get_logger(__name__)
 _app_log = logging.getLogger('eq_boss_tracker')
 
 
+def _assign(widget, value) -> None:
+    """Set a form widget's value only if it differs, so unchanged fields emit no signals."""
+    if isinstance(widget, QLineEdit):
+        if widget.text() != value:
+            widget.setText(value)
+    elif isinstance(widget, QAbstractButton):
+        if widget.isChecked() != bool(value):
+            widget.setChecked(bool(value))
+    elif isinstance(widget, QSpinBox):
+        if widget.value() != value:
+            widget.setValue(value)
+    else:
+        raise TypeError(f"Unsupported widget for _assign: {type(widget).__name__}")
+
+
+_HOME_STR: Optional[str] = None
+
+
+def _home() -> str:
+    """Return the user's home directory as a string, resolved once."""
+    global _HOME_STR
+    if _HOME_STR is None:
+        _HOME_STR = str(Path.home())
+    return _HOME_STR
+
+
+# Common audio formats for the sound file picker
+_SOUND_FILE_FILTER = "Audio Files (*.mp3 *.wav *.ogg *.flac);;All Files (*.*)"
+
+# Accent color swatch; only the background varies. A palette change would be
+# ignored here because the app-level stylesheet already styles QPushButton.
+_COLOR_BUTTON_QSS = "background-color: {color}; border: 2px solid #2a2a2a; border-radius: 4px;"
+
+# Timezone combo model shared by every OptionsWindow; built on first use
+# (needs a QApplication) from OptionsWindow.TIMEZONES
+_TZ_MODEL: Optional[QStandardItemModel] = None
+
+
+def _get_tz_model() -> QStandardItemModel:
+    """Return the shared timezone model, building it on first call."""
+    global _TZ_MODEL
+    if _TZ_MODEL is None:
+        _TZ_MODEL = QStandardItemModel()
+        for display_name, tz_name in OptionsWindow.TIMEZONES:
+            item = QStandardItem(display_name)
+            item.setData(tz_name, Qt.ItemDataRole.UserRole)
+            _TZ_MODEL.appendRow(item)
+    return _TZ_MODEL
+
+
 class OptionsWindow(QDialog):
     """Options window for configuring the application."""
     
@@ -54,6 +99,21 @@ class OptionsWindow(QDialog):
         ("Japan (JST)", "Asia/Tokyo"),
         ("Singapore / Hong Kong", "Asia/Singapore"),
     ]
+    # Default accent color, parsed once on first use (needs a QApplication)
+    _DEFAULT_ACCENT: Optional[QColor] = None
+    
+    # Fallback bosses.json location for restore, computed on first use
+    _default_bosses_json_path: Optional[Path] = None
+    
+    # IANA name -> combo index
+    _TZ_INDEX = {tz_name: i for i, (_, tz_name) in enumerate(TIMEZONES)}
+    
+    @classmethod
+    def _default_accent(cls) -> QColor:
+        """Return the shared default accent color; copy it before modifying."""
+        if cls._DEFAULT_ACCENT is None:
+            cls._DEFAULT_ACCENT = QColor('#007acc')
+        return cls._DEFAULT_ACCENT
     
     def __init__(self, parent=None):
         """Initialize the options window."""
@@ -64,17 +124,39 @@ class OptionsWindow(QDialog):
         
         self.settings = {}
         self.on_settings_save: Optional[Callable] = None
-        self._selected_color = QColor('#007acc')  # Default blue
+        self._selected_color = QColor(self._default_accent())  # Default blue
         self.on_test_notification: Optional[Callable] = None  # Callback to test notification
         self.bosses_json_path: Optional[Path] = None  # Path to bosses.json for backup restore
         self.on_create_backup: Optional[Callable] = None  # Callback to create backup
         
+        # Sections built after the dialog is first shown (see showEvent)
+        self._built = {'backup': False}
+        
         logger.debug("Initializing options window")
         self._setup_ui()
     
     def _setup_ui(self) -> None:
-        """Set up the UI components."""
-        layout = QVBoxLayout(self)
+        """Set up the UI components needed before the dialog is shown."""
+        self._layout = QVBoxLayout(self)
+        self._build_settings_group()
+    
+    def showEvent(self, event) -> None:
+        """Build the secondary sections once the dialog is on screen."""
+        super().showEvent(event)
+        if not self._built['backup']:
+            QTimer.singleShot(0, self._build_deferred)
+    
+    def _build_deferred(self) -> None:
+        """Build the Backup & Restore group and the Save/Cancel buttons."""
+        if self._built['backup']:
+            return
+        self._built['backup'] = True
+        self._build_backup_group()
+        self._build_buttons()
+    
+    def _build_settings_group(self) -> None:
+        """Build the main settings form."""
+        layout = self._layout
         
         # Settings group
         settings_group = QGroupBox("Settings")
@@ -112,15 +194,14 @@ class OptionsWindow(QDialog):
         discord_sync_row = QHBoxLayout()
         discord_sync_row.addWidget(self.discord_sync_interval_spin)
         discord_sync_hint = QLabel("(1 hour – 1 week)")
-        discord_sync_hint.setStyleSheet("color: #888888; font-size: 11px;")
+        discord_sync_hint.setProperty("class", "hint")
         discord_sync_row.addWidget(discord_sync_hint)
         discord_sync_row.addStretch()
         settings_layout.addRow("Sync from Discord interval:", discord_sync_row)
         
         # Timezone
         self.timezone_combo = QComboBox()
-        for display_name, tz_name in self.TIMEZONES:
-            self.timezone_combo.addItem(display_name, tz_name)
+        self.timezone_combo.setModel(_get_tz_model())
         settings_layout.addRow("Timezone:", self.timezone_combo)
         
         # Time format
@@ -157,19 +238,8 @@ class OptionsWindow(QDialog):
         settings_layout.addRow("", windows_notification_layout)
         
         # New boss default action
-        new_boss_group = QGroupBox("New Target Default Action")
-        new_boss_layout = QVBoxLayout()
-        
-        self.new_boss_button_group = QButtonGroup(self)
-        self.new_boss_enable_radio = QRadioButton("Enable by default (auto-post to Discord)")
-        self.new_boss_disable_radio = QRadioButton("Disable by default")
-        self.new_boss_button_group.addButton(self.new_boss_enable_radio, 0)
-        self.new_boss_button_group.addButton(self.new_boss_disable_radio, 1)
-        
-        new_boss_layout.addWidget(self.new_boss_enable_radio)
-        new_boss_layout.addWidget(self.new_boss_disable_radio)
-        new_boss_group.setLayout(new_boss_layout)
-        settings_layout.addRow("", new_boss_group)
+        self.new_boss_enable_checkbox = QCheckBox("Enable new targets by default (auto-post to Discord)")
+        settings_layout.addRow("", self.new_boss_enable_checkbox)
         
         # Accent color picker
         self.color_picker_btn = QPushButton()
@@ -187,6 +257,10 @@ class OptionsWindow(QDialog):
         
         settings_group.setLayout(settings_layout)
         layout.addWidget(settings_group)
+    
+    def _build_backup_group(self) -> None:
+        """Build the Backup & Restore group."""
+        layout = self._layout
         
         # Backup & Restore group
         backup_group = QGroupBox("Backup & Restore")
@@ -213,6 +287,10 @@ class OptionsWindow(QDialog):
         
         backup_group.setLayout(backup_layout)
         layout.addWidget(backup_group)
+    
+    def _build_buttons(self) -> None:
+        """Build the Save/Cancel button row."""
+        layout = self._layout
         
         # Buttons
         buttons_layout = QHBoxLayout()
@@ -231,44 +309,35 @@ class OptionsWindow(QDialog):
         self.settings = settings
         logger.debug("Options window: loading settings into form (default_webhook_url present: %s, log_directory: %s)",
                     bool(settings.get('default_webhook_url')), bool(settings.get('log_directory')))
-        self.log_directory_edit.setText(settings.get('log_directory', ''))
-        self.webhook_url_edit.setText(settings.get('default_webhook_url', ''))
-        self.bot_token_edit.setText(settings.get('discord_bot_token', ''))
-        self.discord_sync_interval_spin.setValue(max(1, min(168, int(settings.get('discord_sync_interval_hours', 12)))))
-        self.sound_enabled_checkbox.setChecked(settings.get('sound_enabled', True))
+        _assign(self.log_directory_edit, settings.get('log_directory', ''))
+        _assign(self.webhook_url_edit, settings.get('default_webhook_url', ''))
+        _assign(self.bot_token_edit, settings.get('discord_bot_token', ''))
+        _assign(self.discord_sync_interval_spin, max(1, min(168, int(settings.get('discord_sync_interval_hours', 12)))))
+        _assign(self.sound_enabled_checkbox, settings.get('sound_enabled', True))
         
         # Set sound file path
         sound_file_path = settings.get('sound_file_path', 'fanfare.mp3')
-        self.sound_file_edit.setText(sound_file_path)
+        _assign(self.sound_file_edit, sound_file_path)
         
-        self.window_popup_checkbox.setChecked(settings.get('window_popup_on_new_boss', True))
-        self.windows_notification_checkbox.setChecked(settings.get('windows_notification', False))
+        _assign(self.window_popup_checkbox, settings.get('window_popup_on_new_boss', True))
+        _assign(self.windows_notification_checkbox, settings.get('windows_notification', False))
         
         # Set new boss default action
-        new_boss_default = settings.get('new_boss_default_action', 'disable')
-        if new_boss_default == 'enable':
-            self.new_boss_enable_radio.setChecked(True)
-        else:
-            self.new_boss_disable_radio.setChecked(True)
+        _assign(self.new_boss_enable_checkbox, settings.get('new_boss_default_action', 'disable') == 'enable')
         
         # Set timezone
-        timezone = settings.get('timezone', '')
-        index = 0  # Default to auto-detect
-        for i, (_, tz_name) in enumerate(self.TIMEZONES):
-            if tz_name == timezone:
-                index = i
-                break
+        index = self._TZ_INDEX.get(settings.get('timezone', ''), 0)  # Default to auto-detect
         self.timezone_combo.setCurrentIndex(index)
         
         # Set time format
         use_military_time = settings.get('use_military_time', False)
-        self.military_time_checkbox.setChecked(use_military_time)
+        _assign(self.military_time_checkbox, use_military_time)
         
         # Set accent color (default to blue: #007acc)
-        accent_color = settings.get('accent_color', '#007acc')
-        color = QColor(accent_color)
+        accent_color = settings.get('accent_color')
+        color = QColor(accent_color) if accent_color else QColor(self._default_accent())
         if not color.isValid():
-            color = QColor('#007acc')  # Fallback to default blue
+            color = QColor(self._default_accent())  # Fallback to default blue
         self._update_color_button(color)
         
         logger.debug("Settings loaded into options window")
@@ -285,7 +354,7 @@ class OptionsWindow(QDialog):
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Log Directory",
-            self.log_directory_edit.text() or str(Path.home())
+            self.log_directory_edit.text() or _home()
         )
         if directory:
             logger.debug(f"User selected log directory: {directory}")
@@ -293,13 +362,11 @@ class OptionsWindow(QDialog):
     
     def _browse_sound_file(self) -> None:
         """Open file browser for sound file."""
-        # Common audio formats
-        file_filter = "Audio Files (*.mp3 *.wav *.ogg *.flac);;All Files (*.*)"
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Sound File",
-            self.sound_file_edit.text() or str(Path.home()),
-            file_filter
+            self.sound_file_edit.text() or _home(),
+            _SOUND_FILE_FILTER
         )
         if file_path:
             logger.debug(f"User selected sound file: {file_path}")
@@ -324,10 +391,10 @@ class OptionsWindow(QDialog):
         if hasattr(self, '_selected_color') and self._selected_color.isValid():
             current_color = self._selected_color
         else:
-            accent_color = self.settings.get('accent_color', '#007acc')
-            current_color = QColor(accent_color)
+            accent_color = self.settings.get('accent_color')
+            current_color = QColor(accent_color) if accent_color else QColor(self._default_accent())
             if not current_color.isValid():
-                current_color = QColor('#007acc')
+                current_color = QColor(self._default_accent())
         
         color = QColorDialog.getColor(current_color, self, "Choose Accent Color")
         if color.isValid():
@@ -336,29 +403,28 @@ class OptionsWindow(QDialog):
     
     def _update_color_button(self, color: QColor) -> None:
         """Update the color picker button appearance."""
-        self.color_picker_btn.setStyleSheet(
-            f"background-color: {color.name()}; "
-            f"border: 2px solid #2a2a2a; "
-            f"border-radius: 4px;"
-        )
+        # Skip the stylesheet re-parse when the swatch already shows this color
+        if color.name() != self._selected_color.name() or not self.color_picker_btn.styleSheet():
+            self.color_picker_btn.setStyleSheet(_COLOR_BUTTON_QSS.format(color=color.name()))
         # Store the color for saving
         self._selected_color = color
     
     def _save_settings(self) -> None:
         """Save settings and close."""
-        webhook_text = self.webhook_url_edit.text().strip()
-        webhook_status = "EMPTY" if not webhook_text else "set ({} chars)".format(len(webhook_text))
         # Log to root app logger so this always appears in the terminal
-        _app_log.info("=" * 60)
-        _app_log.info("OPTIONS: Save button clicked")
-        _app_log.info("OPTIONS: default_webhook_url in form: %s", webhook_status)
-        _app_log.info("OPTIONS: log_directory in form: %s", "set" if self.log_directory_edit.text().strip() else "empty")
-        _app_log.info("OPTIONS: Calling on_settings_save callback")
+        if _app_log.isEnabledFor(logging.INFO):
+            webhook_text = self.webhook_url_edit.text().strip()
+            webhook_status = "EMPTY" if not webhook_text else "set ({} chars)".format(len(webhook_text))
+            _app_log.info("=" * 60)
+            _app_log.info("OPTIONS: Save button clicked")
+            _app_log.info("OPTIONS: default_webhook_url in form: %s", webhook_status)
+            _app_log.info("OPTIONS: log_directory in form: %s", "set" if self.log_directory_edit.text().strip() else "empty")
+            _app_log.info("OPTIONS: Calling on_settings_save callback")
 
         if self.on_settings_save:
-            timezone_data = self.timezone_combo.currentData()
+            timezone_data = self.timezone_combo.currentData(Qt.ItemDataRole.UserRole)
             # Get new boss default action
-            new_boss_default = 'enable' if self.new_boss_enable_radio.isChecked() else 'disable'
+            new_boss_default = 'enable' if self.new_boss_enable_checkbox.isChecked() else 'disable'
             
             # Ensure _selected_color is set (fallback to current settings if somehow not set)
             if hasattr(self, '_selected_color') and self._selected_color.isValid():
@@ -386,10 +452,10 @@ class OptionsWindow(QDialog):
                 'new_boss_default_action': new_boss_default,
                 'accent_color': accent_color
             }
-            logger.debug(f"Saving accent color: {accent_color}")
-            logger.debug(f"Saving sound file path: {sound_file_path}")
-            logger.debug(f"Full settings dict being saved: {list(settings.keys())}")
-            logger.debug(f"accent_color value: {settings.get('accent_color', 'MISSING')}")
+            logger.debug("Saving accent color: %s", accent_color)
+            logger.debug("Saving sound file path: %s", sound_file_path)
+            logger.debug("Full settings dict being saved: %s", list(settings))
+            logger.debug("accent_color value: %s", settings.get('accent_color', 'MISSING'))
             _app_log.info("OPTIONS: Invoking on_settings_save(settings) now")
             self.on_settings_save(settings)
             _app_log.info("OPTIONS: on_settings_save returned (settings written)")
@@ -418,7 +484,7 @@ class OptionsWindow(QDialog):
                         f"Location: {backup_path.parent}\n\n"
                         f"Your current boss data has been saved."
                     )
-                    logger.info(f"[BACKUP] Manual backup created from settings: {backup_path.name}")
+                    logger.info("[BACKUP] Manual backup created from settings: %s", backup_path.name)
                 else:
                     QMessageBox.warning(
                         self,
@@ -446,8 +512,10 @@ class OptionsWindow(QDialog):
         """Show the backup restore dialog."""
         if not self.bosses_json_path:
             # Try to infer from default location
-            app_data = Path.home() / "AppData" / "Roaming" / "boss tracker"
-            self.bosses_json_path = app_data / "bosses.json"
+            if OptionsWindow._default_bosses_json_path is None:
+                app_data = Path(_home()) / "AppData" / "Roaming" / "boss tracker"
+                OptionsWindow._default_bosses_json_path = app_data / "bosses.json"
+            self.bosses_json_path = OptionsWindow._default_bosses_json_path
             logger.info(f"[BACKUP RESTORE] No path set, using default: {self.bosses_json_path}")
         
         if not self.bosses_json_path:
@@ -459,6 +527,11 @@ class OptionsWindow(QDialog):
             )
             return
         
+        try:
+            from .backup_restore_dialog import BackupRestoreDialog
+        except ImportError:
+            from backup_restore_dialog import BackupRestoreDialog
+        
         dialog = BackupRestoreDialog(self.bosses_json_path, self)
         if dialog.exec():
             logger.info("[BACKUP RESTORE] User restored a backup from settings")
@@ -1,4 +1,5 @@
 """Detect OS theme (light/dark mode) for initial app setup."""
+import functools
 import sys
 import logging
 
@@ -10,10 +11,14 @@ except ImportError:
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def detect_os_theme() -> str:
     """
     Detect the operating system's theme preference.
     
+    The result is cached for the session; call detect_os_theme.cache_clear()
+    to force a fresh probe (e.g. after an OS theme change notification).
+    
     Returns:
         "light" or "dark" based on OS theme, defaults to "dark" if detection fails
     """
@@ -38,21 +43,13 @@ def _detect_windows_theme() -> str:
         value_name = "AppsUseLightTheme"
         
         try:
-            # Open registry key
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                key_path,
-                0,
-                winreg.KEY_READ
-            )
-            
-            # Read the value
-            value, _ = winreg.QueryValueEx(key, value_name)
-            winreg.CloseKey(key)
+            # Read the value (the key handle closes when the block exits)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_READ) as key:
+                value, _ = winreg.QueryValueEx(key, value_name)
             
             # 0 = dark mode, 1 = light mode
             theme = "light" if value == 1 else "dark"
-            logger.info(f"Detected Windows theme: {theme} (registry value: {value})")
+            logger.debug(f"Detected Windows theme: {theme} (registry value: {value})")
             return theme
             
         except FileNotFoundError:
@@ -70,6 +67,21 @@ def _detect_windows_theme() -> str:
 
 def _detect_macos_theme() -> str:
     """Detect macOS theme preference."""
+    # In-process lookup via pyobjc when available (avoids spawning `defaults`)
+    try:
+        from Foundation import NSUserDefaults
+    except ImportError:
+        NSUserDefaults = None
+    if NSUserDefaults is not None:
+        try:
+            # AppleInterfaceStyle is unset (None) in light mode
+            style = NSUserDefaults.standardUserDefaults().stringForKey_('AppleInterfaceStyle')
+            theme = "dark" if style and 'dark' in str(style).lower() else "light"
+            logger.info(f"Detected macOS theme: {theme}")
+            return theme
+        except Exception as e:
+            logger.debug(f"NSUserDefaults theme lookup failed, falling back to defaults command: {e}")
+    
     try:
         import subprocess
         
@@ -99,6 +111,64 @@ def _detect_macos_theme() -> str:
         return "dark"  # Default to dark
 
 
+def _read_gnome_color_scheme():
+    """
+    Read org.gnome.desktop.interface color-scheme in-process via PyGObject.
+    
+    Returns:
+        The color-scheme string, or None if PyGObject or the key is unavailable
+    """
+    try:
+        from gi.repository import Gio
+    except (ImportError, ValueError):
+        return None
+    try:
+        schema_id = 'org.gnome.desktop.interface'
+        source = Gio.SettingsSchemaSource.get_default()
+        # Gio.Settings.new() aborts the process on an unknown schema, so check first
+        schema = source.lookup(schema_id, True) if source else None
+        if schema is None or not schema.has_key('color-scheme'):
+            return None
+        return Gio.Settings.new(schema_id).get_string('color-scheme')
+    except Exception as e:
+        logger.debug(f"Gio color-scheme lookup failed, falling back to gsettings: {e}")
+        return None
+
+
+def _read_gtk_settings_theme():
+    """
+    Read the theme preference from the user's GTK settings.ini files.
+    
+    Only a positive answer counts: prefer-dark-theme=0 is commonly left in
+    settings.ini while dark mode comes from GNOME's color-scheme, so it must
+    not stop the GNOME/KDE probes.
+    
+    Returns:
+        "dark" if gtk-4.0/gtk-3.0 settings.ini asks for a dark theme, otherwise None
+    """
+    import configparser
+    import os
+    from pathlib import Path
+    
+    config_home = Path(os.environ.get('XDG_CONFIG_HOME') or Path.home() / '.config')
+    for gtk_dir in ('gtk-4.0', 'gtk-3.0'):
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            if not parser.read(config_home / gtk_dir / 'settings.ini', encoding='utf-8'):
+                continue
+        except (configparser.Error, OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Could not read {gtk_dir} settings.ini: {e}")
+            continue
+        if not parser.has_section('Settings'):
+            continue
+        settings = parser['Settings']
+        if 'dark' in settings.get('gtk-theme-name', '').lower():
+            return "dark"
+        if settings.get('gtk-application-prefer-dark-theme', '').strip().lower() in ('1', 'true', 'yes'):
+            return "dark"
+    return None
+
+
 def _detect_linux_theme() -> str:
     """Detect Linux desktop environment theme preference."""
     try:
@@ -108,8 +178,21 @@ def _detect_linux_theme() -> str:
         # Try different desktop environments
         desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
         
+        # GTK_THEME env var and GTK settings answer most setups without spawning a process
+        if 'dark' in os.environ.get('GTK_THEME', '').lower():
+            logger.info("Detected dark GTK theme")
+            return "dark"
+        if _read_gtk_settings_theme() == "dark":
+            logger.info("Detected dark GTK settings theme")
+            return "dark"
+        
         # GNOME
         if 'gnome' in desktop:
+            scheme = _read_gnome_color_scheme()
+            if scheme is not None:
+                theme = "dark" if 'dark' in scheme.lower() else "light"
+                logger.info(f"Detected GNOME theme: {theme}")
+                return theme
             result = subprocess.run(
                 ['gsettings', 'get', 'org.gnome.desktop.interface', 'color-scheme'],
                 capture_output=True,
@@ -138,12 +221,6 @@ def _detect_linux_theme() -> str:
                 logger.info("Detected KDE desktop, defaulting to dark theme")
                 return "dark"
         
-        # Fallback: check GTK theme
-        gtk_theme = os.environ.get('GTK_THEME', '').lower()
-        if 'dark' in gtk_theme:
-            logger.info("Detected dark GTK theme")
-            return "dark"
-        
         logger.info("Linux theme detection inconclusive, defaulting to dark")
         return "dark"
         
@@ -2,10 +2,13 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTextBrowser, QPushButton
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QUrl
+from PyQt6.QtGui import QImage, QTextDocument
 from pathlib import Path
+from typing import Dict, Tuple
+import functools
+import os
 import sys
-import urllib.parse
 
 try:
     from .logger import get_logger
@@ -29,22 +32,11 @@ def _get_assets_dir() -> Path:
 
 def _file_url(path: Path) -> str:
     """Return file:// URL for local path (QTextBrowser img src)."""
-    return "file:///" + urllib.parse.quote(str(path.resolve().as_posix()))
+    return QUrl.fromLocalFile(str(path)).toString(QUrl.ComponentFormattingOption.FullyEncoded)
 
 
-def _build_html(assets_dir: Path) -> str:
-    """Build HTML for the one-pager. Embeds images only if files exist."""
-    bot_img = assets_dir / "bot_token.png"
-    webhook_img = assets_dir / "webhook_url.png"
-
-    bot_img_html = ""
-    if bot_img.exists():
-        bot_img_html = f'<p><img src="{_file_url(bot_img)}" alt="Discord Bot Token" style="max-width:100%;"/></p>'
-    webhook_img_html = ""
-    if webhook_img.exists():
-        webhook_img_html = f'<p><img src="{_file_url(webhook_img)}" alt="Discord Webhook URL" style="max-width:100%;"/></p>'
-
-    return f"""
+# One-pager body; {bot_img} / {webhook_img} are filled with <img> paragraphs (or left empty)
+_HTML_TEMPLATE = """
 <h2>1. Discord Bot and Bot Token</h2>
 <p>You need a Bot Token for optional features (e.g. Discord sync and duplicate detection).</p>
 <ol>
@@ -65,7 +57,7 @@ def _build_html(assets_dir: Path) -> str:
 <li>Copy the generated URL and open it in your browser. Select your server and authorize the bot.</li>
 <li>Ensure the bot has access to the channel where your webhook posts messages.</li>
 </ol>
-{bot_img_html}
+{bot_img}
 
 <h2>2. Discord Webhook URL (for server admins)</h2>
 <p>To post kill messages to a channel, you need a Webhook URL. Only someone with permission to manage webhooks can create it.</p>
@@ -76,10 +68,58 @@ def _build_html(assets_dir: Path) -> str:
 <li>Configure: set <strong>Name</strong> (e.g. "Boss Tracker"), select the <strong>Channel</strong> where kill messages should appear, then click <strong>Copy Webhook URL</strong>. Save this URL — you'll paste it in this app's Settings.</li>
 <li>Click <strong>Save Changes</strong>.</li>
 </ol>
-{webhook_img_html}
+{webhook_img}
 """
 
 
+@functools.lru_cache(maxsize=4)
+def _load_images(assets_dir: Path) -> Dict[str, Tuple[str, QImage]]:
+    """Decode the Quick Start images once; maps file name -> (img src URL, image).
+
+    The dialog registers these as document resources under the same URL the
+    HTML references, so QTextBrowser never goes back to disk for them.
+    """
+    # One directory listing instead of a stat per image
+    try:
+        with os.scandir(assets_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
+
+    images = {}
+    for name in ("bot_token.png", "webhook_url.png"):
+        if name not in present:
+            continue
+        path = assets_dir / name
+        image = QImage(str(path))
+        if image.isNull():
+            logger.warning(f"Could not load Quick Start image: {path}")
+            continue
+        images[name] = (_file_url(path), image)
+    return images
+
+
+@functools.lru_cache(maxsize=4)
+def _build_html(assets_dir: Path) -> str:
+    """Build HTML for the one-pager. Embeds images only if they could be loaded.
+
+    Cached per assets dir: the assets don't change while the app is running,
+    so reopening the dialog skips the filesystem checks and string building.
+    """
+    images = _load_images(assets_dir)
+
+    bot_img_html = ""
+    if "bot_token.png" in images:
+        bot_url = images["bot_token.png"][0]
+        bot_img_html = f'<p><img src="{bot_url}" alt="Discord Bot Token" style="max-width:100%;"/></p>'
+    webhook_img_html = ""
+    if "webhook_url.png" in images:
+        webhook_url = images["webhook_url.png"][0]
+        webhook_img_html = f'<p><img src="{webhook_url}" alt="Discord Webhook URL" style="max-width:100%;"/></p>'
+
+    return _HTML_TEMPLATE.format_map({'bot_img': bot_img_html, 'webhook_img': webhook_img_html})
+
+
 class QuickStartDialog(QDialog):
     """Modal dialog showing Quick Start text and optional images."""
 
@@ -90,6 +130,7 @@ class QuickStartDialog(QDialog):
         self.setMinimumWidth(520)
         self.setMinimumHeight(480)
         logger.debug("Showing Quick Start dialog")
+        self._html_loaded = False
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -97,12 +138,10 @@ class QuickStartDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(12)
 
-        browser = QTextBrowser()
-        browser.setOpenExternalLinks(True)
-        assets_dir = _get_assets_dir()
-        html = _build_html(assets_dir)
-        browser.setHtml(html)
-        layout.addWidget(browser)
+        # Content is loaded on first show (see showEvent)
+        self.browser = QTextBrowser()
+        self.browser.setOpenExternalLinks(True)
+        layout.addWidget(self.browser)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -113,3 +152,15 @@ class QuickStartDialog(QDialog):
         button_layout.addWidget(close_btn)
         button_layout.addStretch()
         layout.addLayout(button_layout)
+
+    def showEvent(self, event) -> None:
+        """Load the one-pager content the first time the dialog is shown."""
+        super().showEvent(event)
+        if self._html_loaded:
+            return
+        self._html_loaded = True
+        assets_dir = _get_assets_dir()
+        document = self.browser.document()
+        for url, image in _load_images(assets_dir).values():
+            document.addResource(QTextDocument.ResourceType.ImageResource, QUrl(url), image)
+        self.browser.setHtml(_build_html(assets_dir))
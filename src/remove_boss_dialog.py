@@ -4,7 +4,8 @@ from PyQt6.QtWidgets import (
     QComboBox, QGroupBox, QMessageBox
 )
 from PyQt6.QtCore import Qt
-from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+from typing import List, Dict, Optional
 
 try:
     from .logger import get_logger
@@ -59,12 +60,13 @@ class RemoveBossDialog(QDialog):
         self.boss_combo = QComboBox()
         
         # Group bosses by zone for better organization
-        bosses_by_zone: Dict[str, List[Dict]] = {}
+        bosses_by_zone: Dict[str, List[Dict]] = defaultdict(list)
         for boss in self.bosses:
-            zone = boss.get('location', 'Unknown')
-            if zone not in bosses_by_zone:
-                bosses_by_zone[zone] = []
-            bosses_by_zone[zone].append(boss)
+            bosses_by_zone[boss.get('location', 'Unknown')].append(boss)
+        
+        # Build all rows first so the combo is filled with one addItems call
+        display_texts: List[str] = []
+        ordered_bosses: List[Dict] = []
         
         # Sort zones alphabetically
         for zone in sorted(bosses_by_zone.keys(), key=str.lower):
@@ -77,11 +79,14 @@ class RemoveBossDialog(QDialog):
                 
                 # Build display text
                 if note:
-                    display_text = f"{boss_name} ({note}) - {zone}"
+                    display_texts.append(f"{boss_name} ({note}) - {zone}")
                 else:
-                    display_text = f"{boss_name} - {zone}"
-                
-                self.boss_combo.addItem(display_text, boss)
+                    display_texts.append(f"{boss_name} - {zone}")
+                ordered_bosses.append(boss)
+        
+        self.boss_combo.addItems(display_texts)
+        for i, boss in enumerate(ordered_bosses):
+            self.boss_combo.setItemData(i, boss)
         
         if self.boss_combo.count() == 0:
             # No bosses to remove
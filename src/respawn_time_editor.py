@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QSpinBox, QMessageBox, QGroupBox, QLineEdit
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 try:
     from .logger import get_logger
@@ -63,6 +63,7 @@ class RespawnTimeEditor(QDialog):
         self.boss_combo = QComboBox()
         # Sort bosses alphabetically, then by note if duplicates exist
         sorted_bosses = sorted(self.bosses, key=lambda b: (b['name'].lower(), b.get('note', '').lower()))
+        display_texts: List[str] = []
         for boss in sorted_bosses:
             boss_name = boss['name']
             location = boss.get('location', 'Unknown')
@@ -70,12 +71,18 @@ class RespawnTimeEditor(QDialog):
             
             # Build display text: include note if present to distinguish duplicates
             if note:
-                display_text = f"{boss_name} ({note}) - {location}"
+                display_texts.append(f"{boss_name} ({note}) - {location}")
             else:
-                display_text = f"{boss_name} ({location})"
-            
-            # Store the full boss dict as itemData so we can identify the specific entry
-            self.boss_combo.addItem(display_text, boss)
+                display_texts.append(f"{boss_name} ({location})")
+        
+        # Fill the combo in one call, then store the full boss dict as itemData
+        # so we can identify the specific entry
+        self.boss_combo.addItems(display_texts)
+        # Also index rows by (name, location, note) so _select_boss is a dict lookup
+        self._boss_index: Dict[Tuple[str, str, str], int] = {}
+        for i, boss in enumerate(sorted_bosses):
+            self.boss_combo.setItemData(i, boss)
+            self._boss_index.setdefault(self._boss_key(boss), i)
         
         self.boss_combo.currentIndexChanged.connect(self._on_boss_selected)
         boss_layout.addWidget(self.boss_combo)
@@ -160,18 +167,20 @@ class RespawnTimeEditor(QDialog):
         if self.boss_combo.count() > 0:
             self._on_boss_selected(0)
 
+    @staticmethod
+    def _boss_key(boss: Dict) -> Tuple[str, str, str]:
+        """Case-insensitive (name, location, note) key used to match bosses."""
+        return (
+            (boss.get('name') or '').lower(),
+            (boss.get('location') or '').lower(),
+            (boss.get('note') or '').strip().lower(),
+        )
+
     def _select_boss(self, boss: Dict) -> None:
         """Select the given boss in the combo (match by name, location, note)."""
-        name = (boss.get('name') or '').lower()
-        location = (boss.get('location') or '').lower()
-        note = (boss.get('note') or '').strip().lower()
-        for i in range(self.boss_combo.count()):
-            b = self.boss_combo.itemData(i)
-            if not isinstance(b, dict):
-                continue
-            if (b.get('name') or '').lower() == name and (b.get('location') or '').lower() == location and (b.get('note') or '').strip().lower() == note:
-                self.boss_combo.setCurrentIndex(i)
-                return
+        index = self._boss_index.get(self._boss_key(boss))
+        if index is not None:
+            self.boss_combo.setCurrentIndex(index)
 
     def _on_boss_selected(self, index: int) -> None:
         """Handle boss selection change."""
@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 class ScanDialog(QDialog):
     """Dialog for selecting a log file to scan for boss kills."""
     
+    # Directory of the last picked log file; shared across dialogs for this session
+    _last_dir: str = ""
+    
     def __init__(self, parent=None):
         """
         Initialize the scan dialog.
@@ -96,13 +99,14 @@ class ScanDialog(QDialog):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Log File to Scan",
-            "",
+            ScanDialog._last_dir,
             "Text Files (*.txt);;All Files (*.*)"
         )
         
         if file_path:
             self.file_path_edit.setText(file_path)
             self.selected_file_path = file_path
+            ScanDialog._last_dir = str(Path(file_path).parent)
             self.ok_button.setEnabled(True)
             logger.debug(f"Selected log file: {file_path}")
     
@@ -10,6 +10,9 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Plain text URLs start with these; encrypted values never do
+_PLAINTEXT_PREFIXES = ('http://', 'https://')
+
 
 class SecurityManager:
     """Manages encryption/decryption of sensitive data."""
@@ -20,31 +23,29 @@ class SecurityManager:
     
     @staticmethod
     def _get_key() -> bytes:
-        """Generate encryption key from salt."""
-        # Create a simple key from the salt
-        key = hashlib.sha256(SecurityManager._KEY_SALT.encode()).digest()
-        return key
+        """Return the encryption key derived from the salt (computed once at import)."""
+        return _KEY
+    
+    @staticmethod
+    def _xor_bytes(data: bytes, key: bytes) -> bytes:
+        """XOR data against a repeating key in one big-int operation."""
+        size = len(data)
+        keystream = (key * (size // len(key) + 1))[:size]
+        result = int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')
+        return result.to_bytes(size, 'big')
     
     @staticmethod
     def _xor_encrypt(data: str, key: bytes) -> str:
         """Simple XOR encryption (obfuscation, not true security)."""
-        data_bytes = data.encode('utf-8')
-        encrypted = bytearray()
-        key_len = len(key)
-        for i, byte in enumerate(data_bytes):
-            encrypted.append(byte ^ key[i % key_len])
-        return base64.b64encode(bytes(encrypted)).decode('utf-8')
+        encrypted = SecurityManager._xor_bytes(data.encode('utf-8'), key)
+        return base64.b64encode(encrypted).decode('utf-8')
     
     @staticmethod
     def _xor_decrypt(encrypted_data: str, key: bytes) -> str:
         """Simple XOR decryption."""
         try:
             encrypted_bytes = base64.b64decode(encrypted_data.encode('utf-8'))
-            decrypted = bytearray()
-            key_len = len(key)
-            for i, byte in enumerate(encrypted_bytes):
-                decrypted.append(byte ^ key[i % key_len])
-            return bytes(decrypted).decode('utf-8')
+            return SecurityManager._xor_bytes(encrypted_bytes, key).decode('utf-8')
         except Exception as e:
             logger.error(f"Decryption error: {e}")
             return ""
@@ -105,6 +106,32 @@ class SecurityManager:
         if key in data and data[key]:
             data[key] = cls.encrypt(data[key])
     
+    @classmethod
+    def _try_decrypt_bytes(cls, value: str) -> Optional[str]:
+        """
+        Decrypt a value that looks like our ciphertext, decoding it only once.
+        
+        Args:
+            value: Stored value (either plaintext or encrypted)
+            
+        Returns:
+            Decrypted plain text, or None if the value should be treated as plaintext
+        """
+        # Plain text URLs start with http:// or https://
+        if value.startswith(_PLAINTEXT_PREFIXES):
+            return None
+        # Encrypted values are padded base64, so the length is a multiple of 4;
+        # plain text tokens are usually shorter than 20 chars
+        if len(value) < 20 or len(value) % 4:
+            return None
+        try:
+            # validate=True rejects anything outside the base64 alphabet
+            encrypted_bytes = base64.b64decode(value, validate=True)
+            return cls._xor_bytes(encrypted_bytes, cls._get_key()).decode('utf-8')
+        except ValueError:
+            # Not base64, or didn't decrypt to valid UTF-8 - it was plaintext
+            return None
+    
     @classmethod
     def decrypt_dict_value(cls, data: dict, key: str) -> None:
         """
@@ -122,48 +149,17 @@ class SecurityManager:
         if not isinstance(value, str):
             return
         
-        # Check if value looks like encrypted data (base64 encoded)
-        # Encrypted values are base64 strings, typically longer
-        # Plain text URLs/tokens usually start with http://, https://, or are shorter
         try:
-            import base64
-            import re
-            
-            # Heuristic: encrypted values are base64 (longer, alphanumeric + / + =)
-            # Plain text URLs start with http:// or https://
-            # Plain text tokens are usually shorter alphanumeric strings
-            
-            # If it starts with http:// or https://, it's definitely plaintext
-            if value.startswith(('http://', 'https://')):
-                logger.debug(f"Value for key '{key}' appears to be plaintext URL, skipping decryption")
-                return
-            
-            # If it's short (< 20 chars), likely plaintext token
-            if len(value) < 20:
-                logger.debug(f"Value for key '{key}' is too short to be encrypted, assuming plaintext")
-                return
-            
-            # Check if it's valid base64 format
-            # Base64 strings contain A-Z, a-z, 0-9, +, /, and = for padding
-            base64_pattern = re.compile(r'^[A-Za-z0-9+/]+=*$')
-            if not base64_pattern.match(value):
-                logger.debug(f"Value for key '{key}' doesn't match base64 pattern, assuming plaintext")
-                return
-            
-            # Try to decode as base64
-            try:
-                base64.b64decode(value, validate=True)
-                # If it's valid base64, try to decrypt
-                decrypted = cls.decrypt(value)
-                # Only update if decryption succeeded and result is different and valid
-                if decrypted and decrypted != value and len(decrypted) > 0:
-                    data[key] = decrypted
-                    logger.debug(f"Decrypted value for key '{key}'")
-                else:
-                    logger.debug(f"Decryption for key '{key}' produced invalid result, keeping original")
-            except Exception as e:
-                # Not valid base64 or decryption failed - assume it's plaintext
-                logger.debug(f"Value for key '{key}' decryption failed, assuming plaintext: {e}")
+            decrypted = cls._try_decrypt_bytes(value)
+            # Only update if decryption succeeded and result is different and valid
+            if decrypted and decrypted != value:
+                data[key] = decrypted
+                logger.debug(f"Decrypted value for key '{key}'")
+            else:
+                logger.debug(f"Value for key '{key}' doesn't look encrypted, assuming plaintext")
         except Exception as e:
             # If anything fails, assume it's already plaintext
             logger.debug(f"Could not process value for key '{key}', assuming plaintext: {e}")
+
+# The salt is a constant, so derive the key once rather than on every call
+_KEY = hashlib.sha256(SecurityManager._KEY_SALT.encode()).digest()
@@ -1,7 +1,9 @@
 """Play sound notifications."""
 import os
 from pathlib import Path
+from typing import Optional
 import pygame
+import queue
 import threading
 
 try:
@@ -15,16 +17,69 @@ logger = get_logger(__name__)
 class SoundPlayer:
     """Handles playing sound notifications."""
     
-    def __init__(self, sound_file_path: str = "fanfare.mp3"):
+    def __init__(self, sound_file_path: str = "fanfare.mp3", buffer_size: int = 4096):
         """
         Initialize the sound player.
         
         Args:
             sound_file_path: Path to the sound file to play
+            buffer_size: Mixer buffer in samples. 4096 adds ~90 ms of latency at
+                44.1 kHz, which is unnoticeable for a notification, but keeps the
+                audio thread from waking hundreds of times a second (small buffers
+                can cause "out of buffers" underruns on PipeWire). Lower it only
+                if you need low-latency playback.
         """
         self.sound_file_path = Path(sound_file_path)
+        self._path_str = str(self.sound_file_path)
+        # Only a positive result is trusted; a missing file is re-checked on
+        # each play in case it appears later. A file deleted mid-run is not
+        # noticed until set_sound_file is called again.
+        self._path_exists = self.sound_file_path.exists()
         self.enabled = True
-        pygame.mixer.init()
+        self.buffer_size = buffer_size
+        # The mixer is started on first use (see _ensure_mixer) so installs
+        # that never play a sound don't pay for an idle audio device
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        # Decoded sound, cached for _sound_path (None if it couldn't be decoded)
+        self._sound: Optional[pygame.mixer.Sound] = None
+        self._sound_path: Optional[Path] = None
+        # Playback worker, started on the first play(). It has its own lock so
+        # play() on the GUI thread never waits on a mixer init or decode
+        # holding _init_lock.
+        self._queue = queue.Queue(maxsize=4)
+        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+    
+    def _ensure_mixer(self) -> bool:
+        """Initialize pygame.mixer once. Returns True if the mixer is ready."""
+        with self._init_lock:
+            if not self._initialized:
+                try:
+                    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=self.buffer_size)
+                except pygame.error as e:
+                    logger.error(f"[SOUND] Could not initialize audio mixer: {e}")
+                    return False
+                self._initialized = True
+                logger.debug("[SOUND] Audio mixer initialized")
+            return True
+    
+    def _get_sound(self) -> Optional[pygame.mixer.Sound]:
+        """Decode the sound file once and reuse it; None if Sound can't load it."""
+        with self._init_lock:
+            if self._sound_path != self.sound_file_path:
+                self._sound_path = self.sound_file_path
+                try:
+                    self._sound = pygame.mixer.Sound(self._path_str)
+                except pygame.error as e:
+                    logger.debug("[SOUND] Could not preload sound, will stream it instead: %s", e)
+                    self._sound = None
+            return self._sound
+    
+    def pre_init(self) -> None:
+        """Warm up the mixer in a background thread so the first play() is quick."""
+        if self.enabled and not self._initialized:
+            threading.Thread(target=self._ensure_mixer, daemon=True).start()
     
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable sound playback."""
@@ -33,28 +88,58 @@ class SoundPlayer:
     
     def set_sound_file(self, sound_file_path: str) -> None:
         """Set the sound file path."""
-        self.sound_file_path = Path(sound_file_path)
-        logger.debug(f"Sound file path set to: {sound_file_path}")
+        with self._init_lock:
+            self.sound_file_path = Path(sound_file_path)
+            self._path_str = str(self.sound_file_path)
+            self._path_exists = self.sound_file_path.exists()
+            self._sound = None
+            self._sound_path = None
+        logger.debug("Sound file path set to: %s", sound_file_path)
     
     def play(self) -> None:
-        """Play the sound file in a separate thread."""
+        """Queue the sound file to be played on the background worker thread."""
         if not self.enabled:
             logger.info("[SOUND] Sound playback disabled, skipping")
             return
         
-        if not self.sound_file_path.exists():
+        if not self._path_exists:
+            self._path_exists = self.sound_file_path.exists()
+        if not self._path_exists:
             logger.warning(f"Sound file not found: {self.sound_file_path}")
             return
         
-        def _play():
-            try:
-                logger.info(f"[SOUND] Playing sound: {self.sound_file_path}")
-                pygame.mixer.music.load(str(self.sound_file_path))
+        # One long-lived worker plays queued requests; bursts beyond the
+        # queue size are dropped since they'd only replay the same sound
+        with self._worker_lock:
+            if self._worker_thread is None:
+                self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+                self._worker_thread.start()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            logger.debug("[SOUND] Play queue full, dropping notification")
+    
+    def _worker(self) -> None:
+        """Play queued notifications one at a time."""
+        while True:
+            self._queue.get()
+            self._play_now()
+    
+    def _play_now(self) -> None:
+        """Play the sound file on the calling (worker) thread."""
+        if not self._ensure_mixer():
+            return
+        try:
+            logger.info(f"[SOUND] Playing sound: {self.sound_file_path}")
+            sound = self._get_sound()
+            if sound is not None:
+                # Restart rather than overlap, like mixer.music did
+                sound.stop()
+                sound.play()
+            else:
+                # Fall back to streaming for formats Sound can't decode
+                pygame.mixer.music.load(self._path_str)
                 pygame.mixer.music.play()
-                logger.info("[SOUND] Sound played successfully")
-            except pygame.error as e:
-                logger.error(f"[SOUND] Error playing sound: {e}")
-        
-        thread = threading.Thread(target=_play, daemon=True)
-        thread.start()
-
+            logger.info("[SOUND] Sound played successfully")
+        except pygame.error as e:
+            logger.error(f"[SOUND] Error playing sound: {e}")
@@ -1,7 +1,7 @@
 """System tray icon and window management."""
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
 from PyQt6.QtGui import QIcon, QAction
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 from typing import Optional
 
 try:
@@ -22,6 +22,17 @@ class SystemTray(QObject):
     discord_sync_clicked = pyqtSignal()
     exit_clicked = pyqtSignal()
     
+    # Style's generic computer icon, looked up on first use
+    _DEFAULT_ICON: Optional[QIcon] = None
+    
+    @classmethod
+    def _default_icon(cls) -> QIcon:
+        """Return the shared fallback tray icon."""
+        if cls._DEFAULT_ICON is None:
+            style = QApplication.style()
+            cls._DEFAULT_ICON = style.standardIcon(style.StandardPixmap.SP_ComputerIcon)
+        return cls._DEFAULT_ICON
+    
     def __init__(self, icon_path: Optional[str] = None):
         """
         Initialize the system tray.
@@ -32,63 +43,58 @@ class SystemTray(QObject):
         super().__init__()
         self.tray_icon = QSystemTrayIcon()
         
+        icon = None
         if icon_path:
             try:
                 icon = QIcon(icon_path)
                 # Verify icon is valid (not null)
                 if icon.isNull():
                     logger.warning(f"Tray icon file found but QIcon is null: {icon_path}, using default")
-                    icon = QApplication.style().standardIcon(
-                        QApplication.style().StandardPixmap.SP_ComputerIcon
-                    )
                 else:
-                    logger.debug(f"Loaded tray icon from: {icon_path}")
-                self.tray_icon.setIcon(icon)
+                    logger.debug("Loaded tray icon from: %s", icon_path)
             except Exception as e:
                 logger.error(f"Error loading tray icon from {icon_path}: {e}", exc_info=True)
-                # Fallback to default icon
-                self.tray_icon.setIcon(QApplication.style().standardIcon(
-                    QApplication.style().StandardPixmap.SP_ComputerIcon
-                ))
+                icon = None
                 logger.debug("Using default system tray icon due to error")
         else:
-            # Use default icon
-            self.tray_icon.setIcon(QApplication.style().standardIcon(
-                QApplication.style().StandardPixmap.SP_ComputerIcon
-            ))
             logger.debug("Using default system tray icon (no icon path provided)")
-        
-        self.tray_icon.setToolTip("Project Quarm Boss Tracker")
+        if icon is None or icon.isNull():
+            icon = self._default_icon()
+        self.tray_icon.setIcon(icon)
+        
+        self._last_tooltip = "Project Quarm Boss Tracker"
+        self._pending_tooltip = self._last_tooltip
+        self.tray_icon.setToolTip(self._last_tooltip)
+        # Tooltip changes are applied at most once per second; the timer is a
+        # cooldown that only runs after an update, so an idle app never wakes
+        self._tooltip_timer = QTimer(self)
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.setInterval(1000)
+        self._tooltip_timer.timeout.connect(self._on_tooltip_cooldown)
         
         # Create context menu
         self.menu = QMenu()
         
-        show_window_action = QAction("Show Window", self)
-        show_window_action.triggered.connect(self.show_window_clicked.emit)
-        self.menu.addAction(show_window_action)
-        
-        self.menu.addSeparator()
-        
-        options_action = QAction("Settings", self)
-        options_action.triggered.connect(self.options_clicked.emit)
-        self.menu.addAction(options_action)
-        
-        self.menu.addSeparator()
-        
-        # Quick actions - commonly used operations
-        refresh_action = QAction("Refresh", self)
-        refresh_action.triggered.connect(self.refresh_clicked.emit)
-        self.menu.addAction(refresh_action)
-        
-        discord_sync_action = QAction("Sync from Discord", self)
-        discord_sync_action.triggered.connect(self.discord_sync_clicked.emit)
-        self.menu.addAction(discord_sync_action)
-        
-        self.menu.addSeparator()
-        
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self.exit_clicked.emit)
-        self.menu.addAction(exit_action)
+        # (label, signal) per action; None adds a separator
+        menu_items = [
+            ("Show Window", self.show_window_clicked),
+            None,
+            ("Settings", self.options_clicked),
+            None,
+            # Quick actions - commonly used operations
+            ("Refresh", self.refresh_clicked),
+            ("Sync from Discord", self.discord_sync_clicked),
+            None,
+            ("Exit", self.exit_clicked),
+        ]
+        for item in menu_items:
+            if item is None:
+                self.menu.addSeparator()
+                continue
+            label, signal = item
+            action = QAction(label, self)
+            action.triggered.connect(signal.emit)
+            self.menu.addAction(action)
         
         self.tray_icon.setContextMenu(self.menu)
         self.tray_icon.activated.connect(self._on_tray_activated)
@@ -106,9 +112,25 @@ class SystemTray(QObject):
         logger.debug("System tray icon hidden")
     
     def set_tooltip(self, text: str) -> None:
-        """Update the tooltip text."""
-        self.tray_icon.setToolTip(text)
-        logger.debug(f"Tray tooltip updated: {text}")
+        """Update the tooltip text (coalesced to at most one update per second)."""
+        self._pending_tooltip = text
+        if not self._tooltip_timer.isActive():
+            if self._flush_tooltip():
+                self._tooltip_timer.start()
+    
+    def _on_tooltip_cooldown(self) -> None:
+        """Apply any tooltip text that arrived during the cooldown."""
+        if self._flush_tooltip():
+            self._tooltip_timer.start()
+    
+    def _flush_tooltip(self) -> bool:
+        """Push the pending tooltip to the tray icon if it changed. Returns True if it did."""
+        if self._pending_tooltip == self._last_tooltip:
+            return False
+        self._last_tooltip = self._pending_tooltip
+        self.tray_icon.setToolTip(self._last_tooltip)
+        logger.debug("Tray tooltip updated: %s", self._last_tooltip)
+        return True
     
     def show_notification(self, title: str, message: str) -> None:
         """
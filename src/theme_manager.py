@@ -1,15 +1,72 @@
 """Manage application themes - convert CSS to PyQt6 QSS."""
+import functools
+import hashlib
 import json
+import math
 import re
 from pathlib import Path
 from typing import Dict, Optional
 
-try:
-    from colorspacious import cspace_convert
-    HAS_COLORSPACIOUS = True
-except ImportError:
-    HAS_COLORSPACIOUS = False
-    print("Warning: colorspacious not available, using fallback color conversion")
+# oklch(L C H) color values
+_OKLCH_RE = re.compile(r"oklch\(([\d.]+)\s+([\d.]+)\s+([\d.]+)\)")
+# :root (light) and .dark variable blocks, and the --name: value; lines inside them
+_BLOCK_RE = re.compile(r'(:root|\.dark)\s*\{([^}]+)\}', re.DOTALL)
+_VAR_RE = re.compile(r'--([^:]+):\s*([^;]+);')
+
+# Bump when convert_css_to_qss output changes so cached QSS is rebuilt
+_QSS_CACHE_VERSION = "1"
+
+
+def _linear_to_srgb(c: float) -> float:
+    """Apply the sRGB transfer curve to a linear channel value."""
+    if c <= 0.0031308:
+        return 12.92 * c
+    return 1.055 * (c ** (1.0 / 2.4)) - 0.055
+
+
+@functools.lru_cache(maxsize=512)
+def _oklch_to_rgb_impl(oklch_str: str) -> str:
+    """Convert an oklch color string to RGB hex (cached; see ThemeManager.oklch_to_rgb)."""
+    try:
+        # Parse oklch string: oklch(L C H)
+        match = _OKLCH_RE.match(oklch_str)
+        if not match:
+            return "#ffffff"
+        
+        L, C, H = float(match.group(1)), float(match.group(2)), float(match.group(3))
+        
+        # Convert OKLCH to OKLab
+        a = C * math.cos(math.radians(H))
+        b = C * math.sin(math.radians(H))
+        
+        # OKLab to linear RGB (simplified)
+        # This is a rough approximation
+        l_linear = L + 0.3963377774 * a + 0.2158037573 * b
+        m_linear = L - 0.1055613458 * a - 0.0638541728 * b
+        s_linear = L - 0.0894841775 * a - 1.2914855480 * b
+        
+        r_linear = +1.2270138511 * l_linear - 0.5577999807 * m_linear + 0.2812561490 * s_linear
+        g_linear = -0.0405801784 * l_linear + 1.1122568696 * m_linear - 0.0716766787 * s_linear
+        b_linear = -0.0763812849 * l_linear - 0.4214819784 * m_linear + 1.5861632204 * s_linear
+        
+        r = max(0, min(255, int(_linear_to_srgb(r_linear) * 255)))
+        g = max(0, min(255, int(_linear_to_srgb(g_linear) * 255)))
+        b = max(0, min(255, int(_linear_to_srgb(b_linear) * 255)))
+        
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except Exception as e:
+        print(f"Error converting oklch to RGB: {e}")
+        return "#ffffff"
+
+
+@functools.lru_cache(maxsize=32)
+def _rem_to_px(rem_str: str) -> int:
+    """Convert rem string to pixels (assuming 1rem = 16px); 8 if it can't be parsed."""
+    try:
+        rem_value = float(rem_str.replace("rem", "").strip())
+        return int(rem_value * 16)
+    except (ValueError, AttributeError):
+        return 8
 
 
 class ThemeManager:
@@ -27,6 +84,10 @@ class ThemeManager:
         self.current_theme: Optional[str] = None
         self.light_qss: Optional[str] = None
         self.dark_qss: Optional[str] = None
+        # Parsed CSS variables waiting to be converted on first get_qss()
+        self._light_vars: Optional[Dict[str, str]] = None
+        self._dark_vars: Optional[Dict[str, str]] = None
+        self._css_hash: Optional[str] = None
     
     def oklch_to_rgb(self, oklch_str: str) -> str:
         """
@@ -38,76 +99,7 @@ class ThemeManager:
         Returns:
             RGB hex color string like "#f9f9f9"
         """
-        try:
-            # Parse oklch string: oklch(L C H)
-            match = re.match(r"oklch\(([\d.]+)\s+([\d.]+)\s+([\d.]+)\)", oklch_str)
-            if not match:
-                return "#ffffff"
-            
-            L, C, H = float(match.group(1)), float(match.group(2)), float(match.group(3))
-            
-            if HAS_COLORSPACIOUS:
-                try:
-                    # Convert oklch to RGB using colorspacious
-                    # OKLCH -> CIELAB -> XYZ -> sRGB255
-                    oklch_color = [L * 100, C * 100, H]  # L in 0-100, C in 0-100, H in degrees
-                    # Try via CIELAB as intermediate
-                    lab = cspace_convert(oklch_color, "OKLCH", "CIELAB")
-                    xyz = cspace_convert(lab, "CIELAB", "XYZ100")
-                    rgb = cspace_convert(xyz, "XYZ100", "sRGB255")
-                    
-                    # Clamp values and convert to hex
-                    r = max(0, min(255, int(rgb[0])))
-                    g = max(0, min(255, int(rgb[1])))
-                    b = max(0, min(255, int(rgb[2])))
-                    
-                    return f"#{r:02x}{g:02x}{b:02x}"
-                except Exception as e:
-                    # Try direct conversion if intermediate fails
-                    try:
-                        oklch_color = [L * 100, C * 100, H]
-                        rgb = cspace_convert(oklch_color, "OKLCH", "sRGB1")
-                        # Convert from 0-1 range to 0-255
-                        r = max(0, min(255, int(rgb[0] * 255)))
-                        g = max(0, min(255, int(rgb[1] * 255)))
-                        b = max(0, min(255, int(rgb[2] * 255)))
-                        return f"#{r:02x}{g:02x}{b:02x}"
-                    except Exception as e2:
-                        pass  # Fall through to manual conversion
-            
-            # Manual OKLCH to RGB conversion (simplified approximation)
-            # This is a basic approximation - for better results, use colorspacious
-            import math
-            
-            # Convert OKLCH to OKLab
-            a = C * math.cos(math.radians(H))
-            b = C * math.sin(math.radians(H))
-            
-            # OKLab to linear RGB (simplified)
-            # This is a rough approximation
-            l_linear = L + 0.3963377774 * a + 0.2158037573 * b
-            m_linear = L - 0.1055613458 * a - 0.0638541728 * b
-            s_linear = L - 0.0894841775 * a - 1.2914855480 * b
-            
-            # Apply gamma correction (simplified)
-            def linear_to_srgb(c):
-                if c <= 0.0031308:
-                    return 12.92 * c
-                else:
-                    return 1.055 * (c ** (1.0 / 2.4)) - 0.055
-            
-            r_linear = +1.2270138511 * l_linear - 0.5577999807 * m_linear + 0.2812561490 * s_linear
-            g_linear = -0.0405801784 * l_linear + 1.1122568696 * m_linear - 0.0716766787 * s_linear
-            b_linear = -0.0763812849 * l_linear - 0.4214819784 * m_linear + 1.5861632204 * s_linear
-            
-            r = max(0, min(255, int(linear_to_srgb(r_linear) * 255)))
-            g = max(0, min(255, int(linear_to_srgb(g_linear) * 255)))
-            b = max(0, min(255, int(linear_to_srgb(b_linear) * 255)))
-            
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except Exception as e:
-            print(f"Error converting oklch to RGB: {e}")
-            return "#ffffff"
+        return _oklch_to_rgb_impl(oklch_str)
     
     def convert_css_to_qss(self, css_vars: Dict[str, str], is_dark: bool = False) -> str:
         """
@@ -132,166 +124,156 @@ class ThemeManager:
         radius = css_vars.get("--radius", "0.5rem")
         radius_px = self._rem_to_px(radius)
         
-        # Build QSS stylesheet
-        qss = f"""
-/* {'Dark' if is_dark else 'Light'} Theme */
-
-QWidget {{
-    background-color: {colors.get('--background', '#ffffff')};
-    color: {colors.get('--foreground', '#000000')};
-    font-family: {css_vars.get('--font-sans', 'Segoe UI')};
-}}
-
-QPushButton {{
-    background-color: {colors.get('--primary', '#0078d4')};
-    color: {colors.get('--primary-foreground', '#ffffff')};
-    border: 1px solid {colors.get('--border', '#cccccc')};
+        # Resolve each color once; several are used by many rules
+        background = colors.get('--background', '#ffffff')
+        foreground = colors.get('--foreground', '#000000')
+        font_family = css_vars.get('--font-sans', 'Segoe UI')
+        primary = colors.get('--primary', '#0078d4')
+        primary_fg = colors.get('--primary-foreground', '#ffffff')
+        border = colors.get('--border', '#cccccc')
+        input_bg = colors.get('--input', '#ffffff')
+        ring = colors.get('--ring', '#0078d4')
+        card = colors.get('--card', '#ffffff')
+        popover = colors.get('--popover', '#ffffff')
+        popover_fg = colors.get('--popover-foreground', '#000000')
+        muted = colors.get('--muted', '#f5f5f5')
+        # --accent has a different fallback depending on where it's used
+        button_hover = colors.get('--accent', '#005a9e')
+        item_hover = colors.get('--accent', '#f0f0f0')
+        scroll_hover = colors.get('--accent', '#e0e0e0')
+        title = 'Dark' if is_dark else 'Light'
+        
+        # Build QSS stylesheet, one rule per fragment
+        parts = [
+            f"/* {title} Theme */",
+            f"""QWidget {{
+    background-color: {background};
+    color: {foreground};
+    font-family: {font_family};
+}}""",
+            f"""QPushButton {{
+    background-color: {primary};
+    color: {primary_fg};
+    border: 1px solid {border};
     border-radius: {radius_px}px;
     padding: 8px 16px;
-}}
-
-QPushButton:hover {{
-    background-color: {colors.get('--accent', '#005a9e')};
-}}
-
-QPushButton:pressed {{
-    background-color: {colors.get('--primary', '#0078d4')};
-}}
-
-QLineEdit, QTextEdit, QPlainTextEdit {{
-    background-color: {colors.get('--input', '#ffffff')};
-    color: {colors.get('--foreground', '#000000')};
-    border: 1px solid {colors.get('--border', '#cccccc')};
+}}""",
+            f"""QPushButton:hover {{
+    background-color: {button_hover};
+}}""",
+            f"""QPushButton:pressed {{
+    background-color: {primary};
+}}""",
+            f"""QLineEdit, QTextEdit, QPlainTextEdit {{
+    background-color: {input_bg};
+    color: {foreground};
+    border: 1px solid {border};
     border-radius: {radius_px}px;
     padding: 4px 8px;
-}}
-
-QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
-    border: 2px solid {colors.get('--ring', '#0078d4')};
-}}
-
-QCheckBox {{
-    color: {colors.get('--foreground', '#000000')};
+}}""",
+            f"""QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
+    border: 2px solid {ring};
+}}""",
+            f"""QCheckBox {{
+    color: {foreground};
     spacing: 8px;
-}}
-
-QCheckBox::indicator {{
+}}""",
+            f"""QCheckBox::indicator {{
     width: 18px;
     height: 18px;
-    border: 2px solid {colors.get('--border', '#cccccc')};
+    border: 2px solid {border};
     border-radius: 4px;
-    background-color: {colors.get('--input', '#ffffff')};
-}}
-
-QCheckBox::indicator:checked {{
-    background-color: {colors.get('--primary', '#0078d4')};
-    border-color: {colors.get('--primary', '#0078d4')};
-}}
-
-QListWidget {{
-    background-color: {colors.get('--card', '#ffffff')};
-    color: {colors.get('--foreground', '#000000')};
-    border: 1px solid {colors.get('--border', '#cccccc')};
+    background-color: {input_bg};
+}}""",
+            f"""QCheckBox::indicator:checked {{
+    background-color: {primary};
+    border-color: {primary};
+}}""",
+            f"""QListWidget {{
+    background-color: {card};
+    color: {foreground};
+    border: 1px solid {border};
     border-radius: {radius_px}px;
-}}
-
-QListWidget::item {{
+}}""",
+            f"""QListWidget::item {{
     padding: 8px;
-    border-bottom: 1px solid {colors.get('--border', '#cccccc')};
-}}
-
-QListWidget::item:hover {{
-    background-color: {colors.get('--accent', '#f0f0f0')};
-}}
-
-QListWidget::item:selected {{
-    background-color: {colors.get('--primary', '#0078d4')};
-    color: {colors.get('--primary-foreground', '#ffffff')};
-}}
-
-QMenuBar {{
-    background-color: {colors.get('--background', '#ffffff')};
-    color: {colors.get('--foreground', '#000000')};
-}}
-
-QMenu {{
-    background-color: {colors.get('--popover', '#ffffff')};
-    color: {colors.get('--popover-foreground', '#000000')};
-    border: 1px solid {colors.get('--border', '#cccccc')};
+    border-bottom: 1px solid {border};
+}}""",
+            f"""QListWidget::item:hover {{
+    background-color: {item_hover};
+}}""",
+            f"""QListWidget::item:selected {{
+    background-color: {primary};
+    color: {primary_fg};
+}}""",
+            f"""QMenuBar {{
+    background-color: {background};
+    color: {foreground};
+}}""",
+            f"""QMenu {{
+    background-color: {popover};
+    color: {popover_fg};
+    border: 1px solid {border};
     border-radius: {radius_px}px;
-}}
-
-QMenu::item {{
+}}""",
+            f"""QMenu::item {{
     padding: 8px 24px;
-}}
-
-QMenu::item:selected {{
-    background-color: {colors.get('--accent', '#f0f0f0')};
-}}
-
-QScrollBar:vertical {{
-    background-color: {colors.get('--muted', '#f5f5f5')};
+}}""",
+            f"""QMenu::item:selected {{
+    background-color: {item_hover};
+}}""",
+            f"""QScrollBar:vertical {{
+    background-color: {muted};
     width: 12px;
     border-radius: 6px;
-}}
-
-QScrollBar::handle:vertical {{
-    background-color: {colors.get('--border', '#cccccc')};
+}}""",
+            f"""QScrollBar::handle:vertical {{
+    background-color: {border};
     border-radius: 6px;
     min-height: 20px;
-}}
-
-QScrollBar::handle:vertical:hover {{
-    background-color: {colors.get('--accent', '#e0e0e0')};
-}}
-
-QScrollBar:horizontal {{
-    background-color: {colors.get('--muted', '#f5f5f5')};
+}}""",
+            f"""QScrollBar::handle:vertical:hover {{
+    background-color: {scroll_hover};
+}}""",
+            f"""QScrollBar:horizontal {{
+    background-color: {muted};
     height: 12px;
     border-radius: 6px;
-}}
-
-QScrollBar::handle:horizontal {{
-    background-color: {colors.get('--border', '#cccccc')};
+}}""",
+            f"""QScrollBar::handle:horizontal {{
+    background-color: {border};
     border-radius: 6px;
     min-width: 20px;
-}}
-
-QScrollBar::handle:horizontal:hover {{
-    background-color: {colors.get('--accent', '#e0e0e0')};
-}}
-
-QLabel {{
-    color: {colors.get('--foreground', '#000000')};
-}}
-
-QGroupBox {{
-    border: 1px solid {colors.get('--border', '#cccccc')};
+}}""",
+            f"""QScrollBar::handle:horizontal:hover {{
+    background-color: {scroll_hover};
+}}""",
+            f"""QLabel {{
+    color: {foreground};
+}}""",
+            f"""QGroupBox {{
+    border: 1px solid {border};
     border-radius: {radius_px}px;
     margin-top: 12px;
     padding-top: 12px;
-}}
-
-QGroupBox::title {{
+}}""",
+            f"""QGroupBox::title {{
     subcontrol-origin: margin;
     subcontrol-position: top left;
     padding: 0 8px;
-    color: {colors.get('--foreground', '#000000')};
-}}
-"""
-        return qss.strip()
+    color: {foreground};
+}}""",
+        ]
+        return "\n\n".join(parts)
     
     def _rem_to_px(self, rem_str: str) -> int:
         """Convert rem string to pixels (assuming 1rem = 16px)."""
-        try:
-            rem_value = float(rem_str.replace("rem", "").strip())
-            return int(rem_value * 16)
-        except:
-            return 8
+        return _rem_to_px(rem_str)
     
     def load_theme_from_css(self, css_file: str) -> None:
         """
-        Load theme from CSS file and convert to QSS.
+        Load theme from CSS file. Each theme's QSS is converted on its first
+        get_qss() call (or read from the on-disk cache).
         
         Args:
             css_file: Path to CSS file with theme variables
@@ -301,41 +283,60 @@ QGroupBox::title {{
             print(f"CSS file not found: {css_file}")
             return
         
-        # Parse CSS to extract variables
-        light_vars = {}
-        dark_vars = {}
-        
         with open(css_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Extract :root variables (light theme)
-        root_match = re.search(r':root\s*\{([^}]+)\}', content, re.DOTALL)
-        if root_match:
-            vars_text = root_match.group(1)
-            for match in re.finditer(r'--([^:]+):\s*([^;]+);', vars_text):
-                key = f"--{match.group(1).strip()}"
-                value = match.group(2).strip()
-                light_vars[key] = value
+        # Converted QSS is cached next to light.qss/dark.qss under a hash of
+        # the CSS, so an unchanged theme skips parsing and color conversion
+        self._css_hash = hashlib.blake2b(
+            (_QSS_CACHE_VERSION + content).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        # Remove any cache left over from an older version of the CSS
+        for cached in list(self.theme_dir.glob("*.light.qss")) + list(self.theme_dir.glob("*.dark.qss")):
+            if not cached.name.startswith(f"{self._css_hash}."):
+                cached.unlink(missing_ok=True)
+        light_cache = self.theme_dir / f"{self._css_hash}.light.qss"
+        dark_cache = self.theme_dir / f"{self._css_hash}.dark.qss"
+        self.light_qss = light_cache.read_text(encoding='utf-8') if light_cache.exists() else None
+        self.dark_qss = dark_cache.read_text(encoding='utf-8') if dark_cache.exists() else None
+        self._light_vars = None
+        self._dark_vars = None
+        if self.light_qss is not None and self.dark_qss is not None:
+            return
         
-        # Extract .dark variables
-        dark_match = re.search(r'\.dark\s*\{([^}]+)\}', content, re.DOTALL)
-        if dark_match:
-            vars_text = dark_match.group(1)
-            for match in re.finditer(r'--([^:]+):\s*([^;]+);', vars_text):
-                key = f"--{match.group(1).strip()}"
-                value = match.group(2).strip()
-                dark_vars[key] = value
+        # Parse CSS to extract variables
+        light_vars = {}
+        dark_vars = {}
         
-        # Convert to QSS
-        self.light_qss = self.convert_css_to_qss(light_vars, is_dark=False)
-        self.dark_qss = self.convert_css_to_qss(dark_vars, is_dark=True)
+        # Extract :root (light theme) and .dark variables in one pass; like
+        # before, only the first block of each kind is used
+        blocks: Dict[str, str] = {}
+        for selector, vars_text in _BLOCK_RE.findall(content):
+            blocks.setdefault(selector, vars_text)
+        for selector, target in ((':root', light_vars), ('.dark', dark_vars)):
+            for match in _VAR_RE.finditer(blocks.get(selector, '')):
+                target[f"--{match.group(1).strip()}"] = match.group(2).strip()
         
-        # Save QSS files
-        light_qss_path = self.theme_dir / "light.qss"
-        dark_qss_path = self.theme_dir / "dark.qss"
+        # Conversion to QSS is deferred until a theme is actually requested
+        if self.light_qss is None:
+            self._light_vars = light_vars
+        if self.dark_qss is None:
+            self._dark_vars = dark_vars
+    
+    def _build_qss(self, is_dark: bool) -> str:
+        """Convert the pending CSS variables for one theme and save the QSS files."""
+        name = "dark" if is_dark else "light"
+        css_vars = self._dark_vars if is_dark else self._light_vars
+        qss = self.convert_css_to_qss(css_vars, is_dark=is_dark)
+        if is_dark:
+            self.dark_qss, self._dark_vars = qss, None
+        else:
+            self.light_qss, self._light_vars = qss, None
         
-        light_qss_path.write_text(self.light_qss, encoding='utf-8')
-        dark_qss_path.write_text(self.dark_qss, encoding='utf-8')
+        # Save QSS files
+        (self.theme_dir / f"{name}.qss").write_text(qss, encoding='utf-8')
+        (self.theme_dir / f"{self._css_hash}.{name}.qss").write_text(qss, encoding='utf-8')
+        return qss
     
     def get_qss(self, theme: str = "light") -> str:
         """
@@ -348,6 +349,8 @@ QGroupBox::title {{
             QSS stylesheet string
         """
         if theme == "dark":
+            if self.dark_qss is None and self._dark_vars is not None:
+                self._build_qss(is_dark=True)
             if self.dark_qss:
                 return self.dark_qss
             # Try to load from file
@@ -355,6 +358,8 @@ QGroupBox::title {{
             if dark_path.exists():
                 return dark_path.read_text(encoding='utf-8')
         else:
+            if self.light_qss is None and self._light_vars is not None:
+                self._build_qss(is_dark=False)
             if self.light_qss:
                 return self.light_qss
             # Try to load from file
@@ -1,9 +1,15 @@
 """Handle timezone conversion and Discord timestamp formatting."""
+import functools
 import re
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import Optional
 import pytz
 
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python 3.8: pytz only
+    ZoneInfo = None
+
 try:
     from .logger import get_logger
 except ImportError:
@@ -11,12 +17,126 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+# Fast path for the canonical log format "Sat Jan 31 23:30:48 2026"
+_LOG_TIMESTAMP_RE = re.compile(
+    r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) (" + "|".join(_MONTHS) + r") "
+    r"([0-9]{1,2}) ([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2}) ([0-9]{4})\Z"
+)
+
+
+def _get_tz(name: str) -> tzinfo:
+    """
+    Return the timezone for an IANA name.
+
+    Uses stdlib zoneinfo when it knows the zone and falls back to pytz otherwise
+    (Python 3.8, or Windows without the tzdata package). Raises
+    pytz.exceptions.UnknownTimeZoneError for names neither one knows.
+    """
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return pytz.timezone(name)
+
+
+def _localize(dt: datetime, tz: tzinfo) -> datetime:
+    """Attach tz to a naive datetime, resolving DST edge cases like pytz's localize()."""
+    if hasattr(tz, 'localize'):
+        return tz.localize(dt, is_dst=False)
+    # In the repeated hour after DST ends and the skipped hour when it starts,
+    # pytz (is_dst=False) picks standard time, i.e. the smaller UTC offset
+    aware = dt.replace(tzinfo=tz)
+    other = dt.replace(tzinfo=tz, fold=1)
+    if other.utcoffset() < aware.utcoffset():
+        return other
+    return aware
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_log_timestamp(timestamp_str: str, tz: tzinfo) -> datetime:
+    """
+    Parse a log timestamp and localize it to tz (raises ValueError if malformed).
+
+    Cached because replays and duplicate checks parse the same few timestamps
+    over and over; keyed on the timezone too since that's per formatter.
+    """
+    match = _LOG_TIMESTAMP_RE.match(timestamp_str)
+    if match:
+        mon, day, hour, minute, second, year = match.groups()
+        dt = datetime(int(year), _MONTHS[mon], int(day), int(hour), int(minute), int(second))
+    else:
+        # Anything unusual (lowercase names, padded fields...) goes through
+        # strptime so the accepted formats and error messages don't change
+        dt = datetime.strptime(timestamp_str, "%a %b %d %H:%M:%S %Y")
+    return _localize(dt, tz)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_system_tz() -> str:
+    """Detect the system timezone's IANA name (once per process; it doesn't change)."""
+    # 1) Try zoneinfo.ZoneInfo local zone (Python 3.9+, some systems set .key)
+    try:
+        now = datetime.now().astimezone()
+        if now.tzinfo and getattr(now.tzinfo, "key", None):
+            name = getattr(now.tzinfo, "key")
+            if name and name != "localtime":
+                _get_tz(name)  # validate
+                return name
+    except Exception:
+        pass
+
+    # 2) Map time.tzname abbreviations to IANA (US, EU, AUS, Asia)
+    try:
+        import time
+        tzname = (time.tzname()[0] or "").upper()
+        tz_map = {
+            # US
+            "EST": "US/Eastern",
+            "EDT": "US/Eastern",
+            "CST": "US/Central",
+            "CDT": "US/Central",
+            "MST": "US/Mountain",
+            "MDT": "US/Mountain",
+            "PST": "US/Pacific",
+            "PDT": "US/Pacific",
+            # Europe / UK
+            "GMT": "Europe/London",
+            "BST": "Europe/London",
+            "CET": "Europe/Paris",
+            "CEST": "Europe/Paris",
+            "EET": "Europe/Athens",
+            "EEST": "Europe/Athens",
+            "WET": "Europe/London",
+            "WEST": "Europe/London",
+            # Australia
+            "AEST": "Australia/Sydney",
+            "AEDT": "Australia/Sydney",
+            "ACST": "Australia/Adelaide",
+            "ACDT": "Australia/Adelaide",
+            "AWST": "Australia/Perth",
+            # Asia
+            "JST": "Asia/Tokyo",
+            "SGT": "Asia/Singapore",
+            "HKT": "Asia/Hong_Kong",
+        }
+        if tzname in tz_map:
+            return tz_map[tzname]
+    except Exception:
+        pass
+
+    return "US/Eastern"
+
 
 class TimestampFormatter:
     """Formats timestamps for Discord with timezone support."""
     
     # EST timezone (server time)
-    EST = pytz.timezone('US/Eastern')
+    EST = _get_tz('US/Eastern')
     
     def __init__(self, user_timezone: Optional[str] = None):
         """
@@ -28,23 +148,23 @@ class TimestampFormatter:
         """
         if user_timezone and user_timezone.strip():
             try:
-                self.user_tz = pytz.timezone(user_timezone.strip())
+                self.user_tz = _get_tz(user_timezone.strip())
             except pytz.exceptions.UnknownTimeZoneError:
-                self.user_tz = pytz.timezone(self.get_system_timezone())
+                self.user_tz = _get_tz(self.get_system_timezone())
         else:
             # Auto-detect from system (supports EU, AUS, etc. when system TZ is detectable)
             tz_name = self.get_system_timezone()
-            self.user_tz = pytz.timezone(tz_name)
+            self.user_tz = _get_tz(tz_name)
     
     def set_timezone(self, timezone: str) -> None:
         """Set the user's timezone. Pass empty string to use system (auto-detect)."""
         if not timezone or not timezone.strip():
             tz_name = self.get_system_timezone()
-            self.user_tz = pytz.timezone(tz_name)
+            self.user_tz = _get_tz(tz_name)
             logger.info(f"Timezone set to auto-detect: {tz_name}")
             return
         try:
-            self.user_tz = pytz.timezone(timezone.strip())
+            self.user_tz = _get_tz(timezone.strip())
             logger.info(f"Timezone set to: {timezone}")
         except pytz.exceptions.UnknownTimeZoneError as e:
             logger.error(f"Unknown timezone '{timezone}': {e}")
@@ -64,9 +184,8 @@ class TimestampFormatter:
             datetime object in user_tz, or None if parsing fails
         """
         try:
-            dt = datetime.strptime(timestamp_str, "%a %b %d %H:%M:%S %Y")
-            dt_local = self.user_tz.localize(dt)
-            logger.debug(f"Parsed timestamp: {timestamp_str} -> {dt_local} (user_tz: {self.user_tz})")
+            dt_local = _parse_log_timestamp(timestamp_str, self.user_tz)
+            logger.debug("Parsed timestamp: %s -> %s (user_tz: %s)", timestamp_str, dt_local, self.user_tz)
             return dt_local
         except ValueError as e:
             logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
@@ -113,7 +232,7 @@ class TimestampFormatter:
         
         unix_ts = self.to_unix_timestamp(dt_local)
         result = f"<t:{unix_ts}:{format_type}>"
-        logger.debug(f"Formatted Discord timestamp: {timestamp_str} -> {result} (user_tz: {self.user_tz})")
+        logger.debug("Formatted Discord timestamp: %s -> %s (user_tz: %s)", timestamp_str, result, self.user_tz)
         return result
     
     def format_discord_timestamp_relative(self, timestamp_str: str) -> str:
@@ -131,58 +250,7 @@ class TimestampFormatter:
         Returns:
             IANA timezone name (e.g. 'US/Eastern', 'Europe/London', 'Australia/Sydney').
         """
-        # 1) Try zoneinfo.ZoneInfo local zone (Python 3.9+, some systems set .key)
-        try:
-            from datetime import datetime
-            now = datetime.now().astimezone()
-            if now.tzinfo and getattr(now.tzinfo, "key", None):
-                name = getattr(now.tzinfo, "key")
-                if name and name != "localtime":
-                    pytz.timezone(name)  # validate
-                    return name
-        except Exception:
-            pass
-
-        # 2) Map time.tzname abbreviations to IANA (US, EU, AUS, Asia)
-        try:
-            import time
-            tzname = (time.tzname()[0] or "").upper()
-            tz_map = {
-                # US
-                "EST": "US/Eastern",
-                "EDT": "US/Eastern",
-                "CST": "US/Central",
-                "CDT": "US/Central",
-                "MST": "US/Mountain",
-                "MDT": "US/Mountain",
-                "PST": "US/Pacific",
-                "PDT": "US/Pacific",
-                # Europe / UK
-                "GMT": "Europe/London",
-                "BST": "Europe/London",
-                "CET": "Europe/Paris",
-                "CEST": "Europe/Paris",
-                "EET": "Europe/Athens",
-                "EEST": "Europe/Athens",
-                "WET": "Europe/London",
-                "WEST": "Europe/London",
-                # Australia
-                "AEST": "Australia/Sydney",
-                "AEDT": "Australia/Sydney",
-                "ACST": "Australia/Adelaide",
-                "ACDT": "Australia/Adelaide",
-                "AWST": "Australia/Perth",
-                # Asia
-                "JST": "Asia/Tokyo",
-                "SGT": "Asia/Singapore",
-                "HKT": "Asia/Hong_Kong",
-            }
-            if tzname in tz_map:
-                return tz_map[tzname]
-        except Exception:
-            pass
-
-        return "US/Eastern"
+        return _detect_system_tz()
     
     def compare_timestamps(self, timestamp1_str: str, timestamp2_str: str, 
                           tolerance_minutes: int = 3) -> bool:
@@ -200,14 +268,19 @@ class TimestampFormatter:
         Returns:
             True if timestamps are within tolerance, False otherwise
         """
+        if timestamp1_str == timestamp2_str:
+            # Exact duplicate (the common case): only need to know it parses
+            return self.parse_log_timestamp(timestamp1_str) is not None and tolerance_minutes >= 0
+        
         dt1 = self.parse_log_timestamp(timestamp1_str)
         dt2 = self.parse_log_timestamp(timestamp2_str)
         
         if not dt1 or not dt2:
             return False
         
-        # Calculate difference
-        diff = abs((dt1 - dt2).total_seconds())
+        # Calculate difference (via epoch seconds: subtracting two datetimes
+        # that share a zoneinfo tzinfo would ignore a DST change between them)
+        diff = abs(dt1.timestamp() - dt2.timestamp())
         tolerance_seconds = tolerance_minutes * 60
         
         return diff <= tolerance_seconds
@@ -1,11 +1,16 @@
 """Zone grouping widget for displaying targets grouped by zone."""
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QGroupBox, QCheckBox,
-    QHBoxLayout, QLabel, QMenu
+    QHBoxLayout, QLabel, QMenu, QStyle, QStyleOption, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from typing import List, Dict, Optional
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from collections import defaultdict
+import logging
+import os
+import time
 
 try:
     from .logger import get_logger
@@ -14,6 +19,31 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Zone title and boss info label styles; the container's stylesheet overrides the app theme
+_CONTAINER_QSS = """
+QLabel[class="zone-title"] {
+    font-family: 'Segoe UI', 'Fira Sans', Arial, sans-serif;
+    font-weight: bold;
+    font-size: 10pt;
+}
+QLabel[class="boss-info"] {
+    color: #999999;
+    font-size: 9pt;
+}
+"""
+
+# Opt-in tracing of the duplicate-name targets (also needs DEBUG logging)
+_DUP_DEBUG = os.getenv('EQ_BOSS_TRACKER_DUP_DEBUG', '').lower() in ('1', 'true', 'yes')
+_DUP_DEBUG_NAMES = frozenset({"Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"})
+
+# Bursts of set_bosses calls within this window collapse into one update
+_SET_BOSSES_DELAY_MS = 100
+
+# Respawn countdown refresh: every minute while a respawn is under an hour away,
+# every five minutes otherwise (the labels only show whole hours)
+_RESPAWN_TICK_MS = 60000
+_RESPAWN_IDLE_TICK_MS = 300000
+
 
 def _get_boss_key(boss: Dict) -> str:
     """
@@ -33,6 +63,48 @@ def _get_boss_key(boss: Dict) -> str:
     return name
 
 
+@lru_cache(maxsize=256)
+def _format_respawn(days: int, hours: int) -> str:
+    """Format a respawn countdown; only a few hundred (days, hours) pairs ever occur."""
+    if days > 0:
+        return f"Respawn: {days}d {hours}h"
+    return f"Respawn: {hours}h"
+
+
+@lru_cache(maxsize=1024)
+def _format_last_killed(last_killed_str: str, use_military_time: bool) -> str:
+    """
+    Format the "Last: ..." part of a boss info label.
+    
+    Only the countdown changes from tick to tick, so the kill time is parsed and
+    formatted once per (timestamp, time format). Raises ValueError/TypeError for
+    unparseable timestamps (exceptions are not cached).
+    """
+    # Parse ISO format datetime (stored in UTC/local time)
+    kill_time = datetime.fromisoformat(last_killed_str)
+    # Format relative to user's timezone (already in local time from datetime.now())
+    # Use 12-hour format with AM/PM or 24-hour format based on setting
+    if use_military_time:
+        time_str = kill_time.strftime("%m/%d %H:%M")  # 24-hour format
+    else:
+        time_str = kill_time.strftime("%m/%d %I:%M %p")  # 12-hour format with AM/PM
+    return f"Last: {time_str}"
+
+
+@lru_cache(maxsize=256)
+def _format_respawn_tooltip(respawn_hours: float) -> str:
+    """Format the checkbox tooltip for a respawn time, e.g. "Respawn Time: 2 days 6 hours"."""
+    # Convert hours to days and hours for readability
+    tooltip_days = int(respawn_hours // 24)
+    tooltip_hours = int(respawn_hours % 24)
+    
+    if tooltip_days > 0:
+        if tooltip_hours > 0:
+            return f"Respawn Time: {tooltip_days} day{'s' if tooltip_days != 1 else ''} {tooltip_hours} hour{'s' if tooltip_hours != 1 else ''}"
+        return f"Respawn Time: {tooltip_days} day{'s' if tooltip_days != 1 else ''}"
+    return f"Respawn Time: {tooltip_hours} hour{'s' if tooltip_hours != 1 else ''}"
+
+
 class ZoneGroupWidget(QScrollArea):
     """Widget that displays targets grouped by zone."""
     
@@ -51,22 +123,51 @@ class ZoneGroupWidget(QScrollArea):
         self.container = QWidget()
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # One stylesheet for every label, matched on the "class" property, instead of
+        # parsing an inline stylesheet per label
+        self.container.setStyleSheet(_CONTAINER_QSS)
         self.setWidget(self.container)
         
         # Store zone groups
         self.zone_groups: Dict[str, QGroupBox] = {}
         self.boss_checkboxes: Dict[str, QCheckBox] = {}
         self.zone_checkboxes: Dict[str, QCheckBox] = {}  # Zone name -> zone checkbox
+        self.zone_count_labels: Dict[str, QLabel] = {}  # Zone name -> "(N targets, M enabled)" label
         self.boss_info_labels: Dict[str, QLabel] = {}  # boss_name -> info label
         
         # Store bosses data
         self.bosses: List[Dict] = []
+        self._boss_by_key: Dict[str, Dict] = {}  # boss key -> current boss dict
+        self._bosses_by_name: Dict[str, List[Dict]] = {}  # boss name -> its boss dicts (duplicates share a name)
+        self._bosses_by_zone: Dict[str, List[Dict]] = {}  # zone name -> its boss dicts
+        # Zone name -> boss keys shown in that zone, used to decide if the group can be reused
+        self._zone_boss_keys: Dict[str, List[str]] = {}
+        # Boss key -> fields shown in its info label when it was last rendered
+        self._boss_state_cache: Dict[str, Tuple] = {}
+        # Zone name -> bosses of a group whose rows haven't been built yet (not scrolled into view)
+        self._zone_pending: Dict[str, List[Dict]] = {}
+        self.verticalScrollBar().valueChanged.connect(self._populate_visible_zones)
         
         # Timer to update respawn times periodically
-        # Update every minute (60000 ms) so respawn countdowns stay current
+        # Update every minute (60000 ms) so respawn countdowns stay current; backs off
+        # to _RESPAWN_IDLE_TICK_MS while no respawn is within the hour
         self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
         self.update_timer.timeout.connect(self._update_respawn_times)
-        self.update_timer.start(60000)  # Update every minute (60000 ms = 60 seconds)
+        self.update_timer.start(_RESPAWN_TICK_MS)
+        self._respawn_soon = False  # Set while labelling when any countdown is under an hour
+        self._dirty = False  # A tick was skipped while hidden; refresh on next show
+        # (name, last_killed, respawn_hours, minute) -> get_time_until_respawn result, so
+        # the several refreshes that follow a set_bosses share one lookup per boss
+        self._respawn_cache: Dict[Tuple, Optional[Dict]] = {}
+        
+        # Coalesce set_bosses bursts (file watcher, log replays) into one update
+        self._pending_bosses: Optional[List[Dict]] = None
+        self._set_bosses_timer = QTimer(self)
+        self._set_bosses_timer.setSingleShot(True)
+        self._set_bosses_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._set_bosses_timer.setInterval(_SET_BOSSES_DELAY_MS)
+        self._set_bosses_timer.timeout.connect(self.flush)
         
         # Reference to boss database for respawn calculations
         self.boss_db = None
@@ -75,57 +176,110 @@ class ZoneGroupWidget(QScrollArea):
         self.use_military_time = False
     
     def set_bosses(self, bosses: List[Dict]) -> None:
-        """Set the list of bosses to display, grouped by zone."""
+        """
+        Set the list of bosses to display, grouped by zone.
+        
+        The update is applied up to _SET_BOSSES_DELAY_MS later; calls made in the
+        meantime replace the pending list, so a burst costs a single update.
+        """
+        self._pending_bosses = bosses
+        if not self._set_bosses_timer.isActive():
+            self._set_bosses_timer.start()
+    
+    def flush(self) -> None:
+        """Apply a pending set_bosses call immediately."""
+        self._set_bosses_timer.stop()
+        bosses = self._pending_bosses
+        if bosses is None:
+            return
+        self._pending_bosses = None
+        self._do_set_bosses(bosses)
+    
+    def _do_set_bosses(self, bosses: List[Dict]) -> None:
+        """Update the zone groups to show the given bosses."""
         try:
             self.bosses = bosses
             
             # Debug: Log duplicate bosses to verify notes are present
-            for boss_name in ["Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"]:
-                matching = [b for b in bosses if b.get('name') == boss_name]
-                if len(matching) > 1:
-                    logger.info(f"[DUPLICATE DEBUG] Found {len(matching)} entries for '{boss_name}':")
+            if _DUP_DEBUG and logger.isEnabledFor(logging.DEBUG):
+                for boss_name in sorted(_DUP_DEBUG_NAMES):
+                    matching = [b for b in bosses if b.get('name') == boss_name]
+                    logger.debug("[DUPLICATE DEBUG] Found %d entries for '%s'", len(matching), boss_name)
                     for i, b in enumerate(matching):
-                        note_val = b.get('note')
-                        logger.info(f"  Entry {i+1}: Note: '{note_val}' (type: {type(note_val)}, raw: {repr(note_val)}, enabled: {b.get('enabled')})")
-                elif len(matching) == 1:
-                    logger.info(f"[DUPLICATE DEBUG] Found 1 entry for '{boss_name}': Note: '{matching[0].get('note')}'")
-                else:
-                    logger.info(f"[DUPLICATE DEBUG] Found 0 entries for '{boss_name}'")
+                        logger.debug("  Entry %d: note=%r, enabled=%r", i + 1, b.get('note'), b.get('enabled'))
             
             logger.debug(f"Setting {len(bosses)} bosses in zone widget")
             
-            # Save scroll position before clearing widgets
+            # Save scroll position before updating widgets
             scroll_position = self.verticalScrollBar().value()
             
-            # Clear existing widgets
-            self._clear_widgets()
-            
-            # Group bosses by location
-            bosses_by_zone: Dict[str, List[Dict]] = {}
-            for boss in bosses:
-                zone = boss.get('location', 'Unknown')
-                if zone not in bosses_by_zone:
-                    bosses_by_zone[zone] = []
-                bosses_by_zone[zone].append(boss)
-            
-            logger.debug(f"Grouped bosses into {len(bosses_by_zone)} zones")
-            
-            # Create zone groups - sort alphabetically A-Z (case-insensitive)
-            for zone in sorted(bosses_by_zone.keys(), key=str.lower):
-                try:
-                    self._create_zone_group(zone, bosses_by_zone[zone])
-                except Exception as e:
-                    logger.error(f"Error creating zone group for '{zone}': {e}", exc_info=True)
-            
-            # Add stretch at end
-            self.container_layout.addStretch()
+            # Suspend painting while groups are added/removed/updated so the
+            # viewport repaints once, after the layout has settled
+            self.setUpdatesEnabled(False)
+            try:
+                # Group bosses by location, counting enabled targets in the same pass
+                bosses_by_zone: Dict[str, List[Dict]] = defaultdict(list)
+                enabled_by_zone: Dict[str, int] = defaultdict(int)
+                for boss in bosses:
+                    zone = boss.get('location', 'Unknown')
+                    bosses_by_zone[zone].append(boss)
+                    if boss.get('enabled', False):
+                        enabled_by_zone[zone] += 1
+                # Sort each zone once by name, then by note to keep duplicates together
+                for zone_bosses in bosses_by_zone.values():
+                    zone_bosses.sort(key=lambda b: (b['name'], b.get('note') or ''))
+                
+                logger.debug(f"Grouped bosses into {len(bosses_by_zone)} zones")
+                
+                # Indexes for click/refresh handlers (first entry wins for duplicate keys)
+                self._boss_by_key = {}
+                bosses_by_name: Dict[str, List[Dict]] = defaultdict(list)
+                for boss in bosses:
+                    self._boss_by_key.setdefault(_get_boss_key(boss), boss)
+                    bosses_by_name[boss.get('name')].append(boss)
+                self._bosses_by_name = dict(bosses_by_name)
+                self._bosses_by_zone = bosses_by_zone = dict(bosses_by_zone)
+                
+                # Zones whose rows were built stay built when their group is recreated,
+                # so the saved scroll position still points at the same content
+                populated = {z for z in self.zone_groups if z not in self._zone_pending}
+                
+                # Drop zone groups that disappeared or whose set of targets changed;
+                # everything else is updated in place below
+                if not any(zone in bosses_by_zone for zone in self.zone_groups):
+                    self._clear_widgets()
+                else:
+                    for zone in list(self.zone_groups):
+                        zone_bosses = bosses_by_zone.get(zone)
+                        # Both lists are in the same sorted order, so compare them directly
+                        if zone_bosses is None or (
+                            [_get_boss_key(b) for b in zone_bosses] != self._zone_boss_keys.get(zone)
+                        ):
+                            self._remove_zone_group(zone)
+                
+                # Create or update zone groups - sort alphabetically A-Z (case-insensitive)
+                for index, zone in enumerate(sorted(bosses_by_zone.keys(), key=str.lower)):
+                    try:
+                        if zone in self.zone_groups:
+                            self._update_zone_group(zone, bosses_by_zone[zone], enabled_by_zone[zone])
+                        else:
+                            self._create_zone_group(zone, bosses_by_zone[zone], enabled_by_zone[zone], index)
+                            if zone in populated:
+                                self._populate_zone(zone)
+                    except Exception as e:
+                        logger.error(f"Error creating zone group for '{zone}': {e}", exc_info=True)
+                
+                # Add stretch at end (kept across in-place updates)
+                if self.container_layout.count() == len(self.zone_groups):
+                    self.container_layout.addStretch()
+                
+                # Restore scroll position, building the rows of the zones in view there
+                self._scroll_to(scroll_position)
+            finally:
+                self.setUpdatesEnabled(True)
             
             # Update all boss info labels after creating widgets
-            QTimer.singleShot(0, self._update_all_boss_info)
-            
-            # Restore scroll position after widgets are created
-            # Use QTimer to ensure widgets are fully laid out before scrolling
-            QTimer.singleShot(0, lambda: self.verticalScrollBar().setValue(scroll_position))
+            self._update_all_boss_info()
         except Exception as e:
             logger.error(f"Error setting bosses: {e}", exc_info=True)
     
@@ -135,13 +289,13 @@ class ZoneGroupWidget(QScrollArea):
             # Disconnect all signals first to prevent callbacks during cleanup
             for checkbox in self.boss_checkboxes.values():
                 try:
-                    checkbox.stateChanged.disconnect()
+                    checkbox.clicked.disconnect()
                 except:
                     pass
             
             for checkbox in self.zone_checkboxes.values():
                 try:
-                    checkbox.stateChanged.disconnect()
+                    checkbox.clicked.disconnect()
                 except:
                     pass
             
@@ -156,12 +310,61 @@ class ZoneGroupWidget(QScrollArea):
             self.zone_groups.clear()
             self.boss_checkboxes.clear()
             self.zone_checkboxes.clear()
+            self.zone_count_labels.clear()
             self.boss_info_labels.clear()
+            self._zone_boss_keys.clear()
+            self._zone_pending.clear()
+            self._boss_state_cache.clear()
         except Exception as e:
             logger.error(f"Error clearing widgets: {e}", exc_info=True)
     
-    def _create_zone_group(self, zone_name: str, bosses: List[Dict]) -> None:
-        """Create a zone group widget."""
+    def _remove_zone_group(self, zone_name: str) -> None:
+        """Remove a single zone group and forget its checkboxes and labels."""
+        group_box = self.zone_groups.pop(zone_name)
+        self.zone_checkboxes.pop(zone_name, None)
+        self.zone_count_labels.pop(zone_name, None)
+        self._zone_pending.pop(zone_name, None)
+        for boss_key in self._zone_boss_keys.pop(zone_name, []):
+            self.boss_checkboxes.pop(boss_key, None)
+            self.boss_info_labels.pop(boss_key, None)
+            self._boss_state_cache.pop(boss_key, None)
+        self.container_layout.removeWidget(group_box)
+        group_box.setParent(None)
+        group_box.deleteLater()
+    
+    @staticmethod
+    def _boss_state(boss: Dict) -> Tuple:
+        """Fields that feed a boss's info label, for spotting which rows need redrawing."""
+        return (
+            boss.get('last_killed'),
+            boss.get('respawn_hours'),
+            boss.get('respawn_hours_is_default', False),
+        )
+    
+    def _update_zone_group(self, zone_name: str, bosses: List[Dict], enabled_count: int) -> None:
+        """Update an existing zone group in place for the same set of targets."""
+        zone_checkbox = self.zone_checkboxes[zone_name]
+        all_enabled = enabled_count == len(bosses)
+        if zone_checkbox.isChecked() != all_enabled:
+            zone_checkbox.setChecked(all_enabled)
+        self.zone_count_labels[zone_name].setText(f"({len(bosses)} targets, {enabled_count} enabled)")
+        
+        if zone_name in self._zone_pending:
+            self._zone_pending[zone_name] = bosses
+            return
+        for boss in bosses:
+            boss_key = _get_boss_key(boss)
+            checkbox = self.boss_checkboxes[boss_key]
+            enabled = bool(boss.get('enabled', False))
+            if checkbox.isChecked() != enabled:
+                checkbox.setChecked(enabled)
+            state = self._boss_state(boss)
+            if self._boss_state_cache.get(boss_key) != state:
+                self._update_boss_info_label(boss['name'], boss, self.boss_info_labels[boss_key], checkbox)
+                self._boss_state_cache[boss_key] = state
+    
+    def _create_zone_group(self, zone_name: str, bosses: List[Dict], enabled_count: int, index: int = -1) -> None:
+        """Create a zone group widget at the given position in the zone list."""
         group_box = QGroupBox()
         group_layout = QVBoxLayout(group_box)
         group_layout.setSpacing(5)  # Consistent spacing
@@ -172,11 +375,11 @@ class ZoneGroupWidget(QScrollArea):
         
         # Zone checkbox - controls all bosses in zone
         zone_checkbox = QCheckBox()
-        # Check if all bosses in zone are enabled
-        all_enabled = all(b.get('enabled', False) for b in bosses)
-        zone_checkbox.setChecked(all_enabled)
-        zone_checkbox.stateChanged.connect(
-            lambda state, z=zone_name: self._on_zone_checkbox_changed(z, state)
+        # Checked when all bosses in zone are enabled
+        zone_checkbox.setChecked(enabled_count == len(bosses))
+        # clicked fires only for user toggles, so programmatic setChecked needs no signal blocking
+        zone_checkbox.clicked.connect(
+            lambda checked, z=zone_name: self._on_zone_checkbox_changed(z, checked)
         )
         header_layout.addWidget(zone_checkbox)
         self.zone_checkboxes[zone_name] = zone_checkbox
@@ -184,22 +387,52 @@ class ZoneGroupWidget(QScrollArea):
         # Zone label (aligned with boss names)
         zone_label = QLabel(zone_name)
         zone_label.setProperty("class", "zone-title")
-        zone_label.setStyleSheet("font-family: 'Segoe UI', 'Fira Sans', Arial, sans-serif; font-weight: bold; font-size: 10pt;")
         header_layout.addWidget(zone_label)
         
-        # Count enabled targets
-        enabled_count = sum(1 for b in bosses if b.get('enabled', False))
+        # Enabled targets were counted by set_bosses while grouping
         count_label = QLabel(f"({len(bosses)} targets, {enabled_count} enabled)")
         count_label.setProperty("class", "zone-count")
         header_layout.addWidget(count_label)
+        self.zone_count_labels[zone_name] = count_label
         
         header_layout.addStretch()
         group_layout.addLayout(header_layout)
         
-        # Boss checkboxes with kill time and respawn info
-        # Sort by name, then by note to keep duplicates together
-        for boss in sorted(bosses, key=lambda b: (b['name'], b.get('note', ''))):
+        # Boss rows are built by _populate_zone once the group scrolls into view
+        self._zone_pending[zone_name] = bosses
+        
+        # Store zone group
+        self.zone_groups[zone_name] = group_box
+        self._zone_boss_keys[zone_name] = [_get_boss_key(b) for b in bosses]
+        self.container_layout.insertWidget(index, group_box)
+        # Children added to a visible widget must be shown explicitly; doing it now
+        # (rather than from the event loop) gives the layout real geometry to test
+        group_box.show()
+    
+    def _populate_zone(self, zone_name: str) -> None:
+        """Build the boss rows of a zone group created by _create_zone_group."""
+        bosses = self._zone_pending.pop(zone_name)
+        group_layout = self.zone_groups[zone_name].layout()
+        
+        # Rows are nested layouts rather than one QWidget each; keep the margins a
+        # row widget's own layout would get from the style (child, not window, margins)
+        style = self.container.style()
+        child_option = QStyleOption()
+        row_margins = [
+            style.pixelMetric(metric, child_option, self.container)
+            for metric in (
+                QStyle.PixelMetric.PM_LayoutLeftMargin,
+                QStyle.PixelMetric.PM_LayoutTopMargin,
+                QStyle.PixelMetric.PM_LayoutRightMargin,
+                QStyle.PixelMetric.PM_LayoutBottomMargin,
+            )
+        ]
+        
+        # Boss checkboxes with kill time and respawn info (set_bosses passes each zone pre-sorted)
+        dup_debug = _DUP_DEBUG and logger.isEnabledFor(logging.DEBUG)
+        for boss in bosses:
             boss_row = QHBoxLayout()
+            boss_row.setContentsMargins(*row_margins)
             boss_row.setSpacing(8)
             
             # Build display text: name + note (if available)
@@ -208,8 +441,8 @@ class ZoneGroupWidget(QScrollArea):
             note = (note_raw or '').strip() if note_raw else ''
             
             # Debug logging for duplicate names
-            if boss_name in ["Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"]:
-                logger.info(f"[DUPLICATE DEBUG] Creating checkbox for '{boss_name}' - note_raw: {repr(note_raw)}, note: '{note}', full boss: {boss}")
+            if dup_debug and boss_name in _DUP_DEBUG_NAMES:
+                logger.debug("[DUPLICATE DEBUG] Creating checkbox for '%s' - note_raw: %r, note: '%s', full boss: %s", boss_name, note_raw, note, boss)
             
             if note:
                 display_text = f"{boss_name} ({note})"
@@ -217,57 +450,102 @@ class ZoneGroupWidget(QScrollArea):
                 display_text = boss_name
             
             boss_checkbox = QCheckBox(display_text)
+            # Use unique key (name + note) to handle duplicate names
+            boss_key = _get_boss_key(boss)
+
+            # Shared slots find the boss through these properties; looked up by key,
+            # since rows outlive the dicts passed to set_bosses
+            boss_checkbox.setProperty("boss_key", boss_key)
+            boss_checkbox.setProperty("zone", zone_name)
 
             # Right-click context menu: Edit (opens Edit Boss for this target)
             boss_checkbox.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            boss_checkbox.customContextMenuRequested.connect(
-                lambda pos, b=boss, w=boss_checkbox: self._show_boss_context_menu(b, pos, w)
-            )
+            boss_checkbox.customContextMenuRequested.connect(self._on_boss_context_menu_requested)
             boss_checkbox.setToolTip("Right-click to edit this target")
 
             # Additional debug for duplicate names
-            if boss_name in ["Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"]:
-                logger.info(f"[DUPLICATE DEBUG] Checkbox created with text: '{display_text}'")
+            if dup_debug and boss_name in _DUP_DEBUG_NAMES:
+                logger.debug("[DUPLICATE DEBUG] Checkbox created with text: '%s'", display_text)
             boss_checkbox.setChecked(boss.get('enabled', False))
 
-            # Connect signal with boss dict reference (for duplicate handling)
-            def make_handler(boss_dict, zone=zone_name):
-                return lambda state: self._on_boss_checkbox_changed(boss_dict, state, zone)
-
-            boss_checkbox.stateChanged.connect(make_handler(boss, zone_name))
+            # One slot for every boss checkbox; it resolves the boss by key (for duplicate handling)
+            boss_checkbox.clicked.connect(self._on_boss_checkbox_clicked)
 
             boss_row.addWidget(boss_checkbox)
             
             # Info label for last kill time and respawn time
             info_label = QLabel()
             info_label.setProperty("class", "boss-info")
-            info_label.setStyleSheet("color: #999999; font-size: 9pt;")
             self._update_boss_info_label(boss['name'], boss, info_label, boss_checkbox)
+            self._boss_state_cache[boss_key] = self._boss_state(boss)
             boss_row.addWidget(info_label)
             
             boss_row.addStretch()
+            group_layout.addLayout(boss_row)
+            boss_checkbox.show()
+            info_label.show()
             
-            # Create container widget for the row
-            boss_widget = QWidget()
-            boss_widget.setLayout(boss_row)
-            group_layout.addWidget(boss_widget)
-            
-            # Use unique key (name + note) to handle duplicate names
-            boss_key = _get_boss_key(boss)
             self.boss_checkboxes[boss_key] = boss_checkbox
             self.boss_info_labels[boss_key] = info_label
             
             # Debug logging for duplicate names
-            if boss_name in ["Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"]:
-                logger.info(f"[DUPLICATE DEBUG] Stored checkbox/label with key: '{boss_key}' for '{boss_name}' (note: '{note}')")
+            if dup_debug and boss_name in _DUP_DEBUG_NAMES:
+                logger.debug("[DUPLICATE DEBUG] Stored checkbox/label with key: '%s' for '%s' (note: '%s')", boss_key, boss_name, note)
+    
+    def _populate_visible_zones(self) -> None:
+        """Build the rows of every pending zone group that intersects the viewport."""
+        if not self._zone_pending:
+            return
+        # Viewport rectangle in container coordinates
+        visible = self.viewport().rect().translated(-self.container.pos())
+        for zone_name in [z for z in self._zone_pending if self.zone_groups[z].geometry().intersects(visible)]:
+            self._populate_zone(zone_name)
+    
+    def scroll_to(self, position: int) -> None:
+        """
+        Scroll to a saved position, first building the zones above and in view of it.
         
-        # Store zone group
-        self.zone_groups[zone_name] = group_box
-        self.container_layout.addWidget(group_box)
+        Zones that have not been scrolled into view yet are only a header tall, so
+        the rows above the target must exist for the position to mean the same thing.
+        """
+        self.flush()
+        self._scroll_to(position)
+    
+    def _scroll_to(self, position: int) -> None:
+        """Build the pending zones above and in view of position, then scroll there."""
+        bottom = position + self.viewport().height()
+        self._sync_layout()
+        for zone_name in sorted(self.zone_groups, key=str.lower):
+            if self.zone_groups[zone_name].geometry().top() > bottom:
+                break
+            if zone_name in self._zone_pending:
+                self._populate_zone(zone_name)
+                self._sync_layout()
+        self.verticalScrollBar().setValue(position)  # Clamped to the new range
+    
+    def _sync_layout(self) -> None:
+        """Lay out the container now and resize it, updating the scroll range."""
+        self.container_layout.activate()
+        # QScrollArea resizes its widget and recomputes the scroll bars on LayoutRequest;
+        # deliver one now rather than waiting for the posted event
+        QApplication.sendEvent(self, QEvent(QEvent.Type.LayoutRequest))
     
-    def _on_boss_checkbox_changed(self, boss: Dict, state: int, zone_name: str) -> None:
+    def _on_boss_checkbox_clicked(self, checked: bool) -> None:
+        """Dispatch a user toggle of a boss checkbox to _on_boss_checkbox_changed."""
+        checkbox = self.sender()
+        boss = self._boss_by_key.get(checkbox.property("boss_key"))
+        if boss is not None:
+            self._on_boss_checkbox_changed(boss, checked, checkbox.property("zone"))
+    
+    def _on_boss_context_menu_requested(self, pos) -> None:
+        """Dispatch a boss checkbox's context menu request to _show_boss_context_menu."""
+        checkbox = self.sender()
+        boss = self._boss_by_key.get(checkbox.property("boss_key"))
+        if boss is not None:
+            self._show_boss_context_menu(boss, pos, checkbox)
+    
+    def _on_boss_checkbox_changed(self, boss: Dict, enabled: bool, zone_name: str) -> None:
         """Handle boss checkbox state change."""
-        enabled = state == Qt.CheckState.Checked.value
         boss_name = boss.get('name', 'Unknown')
         note = boss.get('note', '').strip()
         
@@ -277,25 +555,21 @@ class ZoneGroupWidget(QScrollArea):
         if zone_name in self.zone_checkboxes:
             zone_checkbox = self.zone_checkboxes[zone_name]
             # Check if all bosses in this zone are now enabled
-            zone_bosses = [b for b in self.bosses if b.get('location') == zone_name]
-            all_enabled = all(
-                self.boss_checkboxes[_get_boss_key(b)].isChecked()
-                if _get_boss_key(b) in self.boss_checkboxes
-                else False
-                for b in zone_bosses
-            )
-            
-            # Update zone checkbox without triggering its signal
-            zone_checkbox.blockSignals(True)
+            all_enabled = True
+            for b in self._bosses_by_zone.get(zone_name, []):
+                checkbox = self.boss_checkboxes.get(_get_boss_key(b))
+                if checkbox is None or not checkbox.isChecked():
+                    all_enabled = False
+                    break
+            
+            # Update zone checkbox (doesn't emit clicked)
             zone_checkbox.setChecked(all_enabled)
-            zone_checkbox.blockSignals(False)
         
         # Emit signal with boss dict for proper duplicate handling
         self.boss_enabled_changed.emit(boss, enabled)
     
-    def _on_zone_checkbox_changed(self, zone_name: str, state: int) -> None:
+    def _on_zone_checkbox_changed(self, zone_name: str, enabled: bool) -> None:
         """Handle zone checkbox state change - enable/disable all bosses in zone."""
-        enabled = state == Qt.CheckState.Checked.value
         logger.debug(f"Zone checkbox changed: {zone_name} -> {enabled}")
         self._enable_all_in_zone(zone_name, enabled)
 
@@ -310,20 +584,17 @@ class ZoneGroupWidget(QScrollArea):
         """Enable or disable all targets in a zone."""
         try:
             # Find all bosses in this zone
-            zone_bosses = [b for b in self.bosses if b.get('location') == zone_name]
+            zone_bosses = self._bosses_by_zone.get(zone_name, [])
             
             logger.info(f"{'Enabling' if enabled else 'Disabling'} all {len(zone_bosses)} targets in zone '{zone_name}'")
             
-            # Block signals while updating checkboxes to prevent individual signals
+            # setChecked doesn't emit clicked, so no individual signals fire
             # The zone signal will handle all updates at once
             for boss in zone_bosses:
                 try:
                     boss_key = _get_boss_key(boss)
                     if boss_key in self.boss_checkboxes:
-                        checkbox = self.boss_checkboxes[boss_key]
-                        checkbox.blockSignals(True)  # Block individual checkbox signals
-                        checkbox.setChecked(enabled)
-                        checkbox.blockSignals(False)  # Re-enable signals
+                        self.boss_checkboxes[boss_key].setChecked(enabled)
                 except Exception as e:
                     logger.error(f"Error updating checkbox for boss '{boss.get('name', 'unknown')}': {e}", exc_info=True)
             
@@ -360,15 +631,7 @@ class ZoneGroupWidget(QScrollArea):
             last_killed_str = boss.get('last_killed')
             if last_killed_str:
                 try:
-                    # Parse ISO format datetime (stored in UTC/local time)
-                    kill_time = datetime.fromisoformat(last_killed_str)
-                    # Format relative to user's timezone (already in local time from datetime.now())
-                    # Use 12-hour format with AM/PM or 24-hour format based on setting
-                    if self.use_military_time:
-                        time_str = kill_time.strftime("%m/%d %H:%M")  # 24-hour format
-                    else:
-                        time_str = kill_time.strftime("%m/%d %I:%M %p")  # 12-hour format with AM/PM
-                    parts.append(f"Last: {time_str}")
+                    parts.append(_format_last_killed(last_killed_str, self.use_military_time))
                 except (ValueError, TypeError) as e:
                     logger.debug(f"Could not parse last_killed '{last_killed_str}' for '{boss_name}': {e}")
             
@@ -384,43 +647,37 @@ class ZoneGroupWidget(QScrollArea):
                     parts.append("Respawn: Unknown")
                     tooltip_text = "Respawn Time: Unknown (default 6d 18h - please set actual respawn time)"
                 else:
-                    respawn_info = self.boss_db.get_time_until_respawn(boss_name)
+                    cache_key = (boss_name, last_killed_str, respawn_hours, int(time.time() // 60))
+                    if cache_key in self._respawn_cache:
+                        respawn_info = self._respawn_cache[cache_key]
+                    else:
+                        respawn_info = self.boss_db.get_time_until_respawn(boss_name)
+                        self._respawn_cache[cache_key] = respawn_info
                     if respawn_info:
                         if respawn_info['is_respawned']:
                             parts.append("Respawned!")
                         else:
+                            if respawn_info['hours_remaining'] <= 1:
+                                self._respawn_soon = True
+                                if self.update_timer.interval() != _RESPAWN_TICK_MS:
+                                    self.update_timer.setInterval(_RESPAWN_TICK_MS)
                             days = int(respawn_info['hours_remaining'] // 24)
                             hours = int(respawn_info['hours_remaining'] % 24)
-                            if days > 0:
-                                parts.append(f"Respawn: {days}d {hours}h")
-                            else:
-                                parts.append(f"Respawn: {hours}h")
+                            parts.append(_format_respawn(days, hours))
                     
                     # Set tooltip on checkbox if respawn time is defined
                     if respawn_hours is not None:
-                        # Format tooltip: convert hours to days and hours for readability
-                        total_hours = respawn_hours
-                        tooltip_days = int(total_hours // 24)
-                        tooltip_hours = int(total_hours % 24)
-                        
-                        if tooltip_days > 0:
-                            if tooltip_hours > 0:
-                                tooltip_text = f"Respawn Time: {tooltip_days} day{'s' if tooltip_days != 1 else ''} {tooltip_hours} hour{'s' if tooltip_hours != 1 else ''}"
-                            else:
-                                tooltip_text = f"Respawn Time: {tooltip_days} day{'s' if tooltip_days != 1 else ''}"
-                        else:
-                            tooltip_text = f"Respawn Time: {tooltip_hours} hour{'s' if tooltip_hours != 1 else ''}"
+                        tooltip_text = _format_respawn_tooltip(respawn_hours)
             
-            if parts:
-                label.setText(" | ".join(parts))
-            else:
-                label.setText("")
+            # Compare before setting: setText relayouts the label even when nothing changed,
+            # and most per-minute ticks leave every label as it was
+            label_text = " | ".join(parts)
+            if label.text() != label_text:
+                label.setText(label_text)
             
             # Set tooltip on checkbox (boss name) if respawn time is defined
-            if tooltip_text:
+            if checkbox.toolTip() != tooltip_text:
                 checkbox.setToolTip(tooltip_text)
-            else:
-                checkbox.setToolTip("")
         except Exception as e:
             logger.error(f"Error updating boss info label for '{boss_name}': {e}", exc_info=True)
             label.setText("")
@@ -429,9 +686,11 @@ class ZoneGroupWidget(QScrollArea):
     
     def _update_all_boss_info(self) -> None:
         """Update all boss info labels and checkbox text."""
+        self._respawn_soon = False
+        dup_debug = _DUP_DEBUG and logger.isEnabledFor(logging.DEBUG)
         for boss_key, label in self.boss_info_labels.items():
             # Find boss by matching the unique key
-            boss = next((b for b in self.bosses if _get_boss_key(b) == boss_key), None)
+            boss = self._boss_by_key.get(boss_key)
             if boss and boss_key in self.boss_checkboxes:
                 checkbox = self.boss_checkboxes[boss_key]
                 
@@ -441,8 +700,8 @@ class ZoneGroupWidget(QScrollArea):
                 note = (note_raw or '').strip() if note_raw else ''
                 
                 # Debug logging for duplicate names
-                if boss_name in ["Thall Va Xakra", "Kaas Thox Xi Aten Ha Ra"]:
-                    logger.info(f"[DUPLICATE DEBUG] _update_all_boss_info - Updating checkbox for '{boss_name}' with note: '{note}' (key: '{boss_key}', raw: {repr(note_raw)}, boss dict note: {repr(boss.get('note'))})")
+                if dup_debug and boss_name in _DUP_DEBUG_NAMES:
+                    logger.debug("[DUPLICATE DEBUG] _update_all_boss_info - Updating checkbox for '%s' with note: '%s' (key: '%s', raw: %r)", boss_name, note, boss_key, note_raw)
                 
                 if note:
                     display_text = f"{boss_name} ({note})"
@@ -451,15 +710,37 @@ class ZoneGroupWidget(QScrollArea):
                 
                 current_text = checkbox.text()
                 if current_text != display_text:
-                    logger.info(f"[DUPLICATE DEBUG] Changing checkbox text from '{current_text}' to '{display_text}' for key '{boss_key}'")
+                    logger.debug("Changing checkbox text from '%s' to '%s' for key '%s'", current_text, display_text, boss_key)
                     checkbox.setText(display_text)
                 
                 self._update_boss_info_label(boss_name, boss, label, checkbox)
+        
+        interval = _RESPAWN_TICK_MS if self._respawn_soon else _RESPAWN_IDLE_TICK_MS
+        if self.update_timer.interval() != interval:
+            self.update_timer.setInterval(interval)
     
     def _update_respawn_times(self) -> None:
         """Update all respawn time displays (called every minute)."""
+        self._respawn_cache.clear()
+        # Nothing to repaint while hidden (tray, other tab); catch up in showEvent
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            self._dirty = True
+            return
         self._update_all_boss_info()
     
+    def showEvent(self, event) -> None:
+        """Refresh respawn times skipped while the widget was hidden."""
+        super().showEvent(event)
+        self._populate_visible_zones()
+        if self._dirty:
+            self._dirty = False
+            self._update_all_boss_info()
+    
+    def resizeEvent(self, event) -> None:
+        """Build rows for zones that a larger viewport brings into view."""
+        super().resizeEvent(event)
+        self._populate_visible_zones()
+    
     def refresh_boss_info(self, boss_name: str, note: Optional[str] = None) -> None:
         """
         Refresh the info label and checkbox text for a specific boss.
@@ -472,10 +753,10 @@ class ZoneGroupWidget(QScrollArea):
         boss = None
         if note:
             # Note provided - find exact match
-            boss = next((b for b in self.bosses if b.get('name') == boss_name and (b.get('note', '') or '').strip() == note.strip()), None)
+            boss = self._boss_by_key.get(_get_boss_key({'name': boss_name, 'note': note}))
         else:
             # No note provided - try to find unique boss or first match
-            matching_bosses = [b for b in self.bosses if b.get('name') == boss_name]
+            matching_bosses = self._bosses_by_name.get(boss_name, [])
             if len(matching_bosses) == 1:
                 boss = matching_bosses[0]
             elif len(matching_bosses) > 1:
@@ -525,9 +806,9 @@ class ZoneGroupWidget(QScrollArea):
         # Find boss by name (and note if provided)
         boss = None
         if note:
-            boss = next((b for b in self.bosses if b.get('name') == boss_name and b.get('note', '').strip() == note.strip()), None)
+            boss = self._boss_by_key.get(_get_boss_key({'name': boss_name, 'note': note}))
         else:
-            matching_bosses = [b for b in self.bosses if b.get('name') == boss_name]
+            matching_bosses = self._bosses_by_name.get(boss_name, [])
             if len(matching_bosses) == 1:
                 boss = matching_bosses[0]
         
@@ -535,8 +816,10 @@ class ZoneGroupWidget(QScrollArea):
             boss_key = _get_boss_key(boss)
             if boss_key in self.boss_checkboxes:
                 checkbox = self.boss_checkboxes[boss_key]
-                if enabled is not None:
+                if enabled is not None and checkbox.isChecked() != enabled:
                     checkbox.setChecked(enabled)
+                    # setChecked doesn't emit clicked; report the change as a toggle would
+                    self._on_boss_checkbox_changed(boss, enabled, checkbox.property("zone"))
             
             # Refresh boss info when updated
             self.refresh_boss_info(boss_name, boss.get('note'))
@@ -0,0 +1,63 @@
+"""
+Shared setup for the test modules.
+
+Test modules import the module under test inside each test method (with
+importlib.import_module) rather than at the top, so discovery in
+run_all_tests.py doesn't load the application modules.
+"""
+import os
+import sys
+from typing import List, Optional
+
+
+# Set once the console streams have been checked in this process
+_console_fixed = False
+
+
+def fix_win_console() -> None:
+    """Fix Windows console encoding (only if not already wrapped); later calls are no-ops."""
+    global _console_fixed
+    if _console_fixed or sys.platform != 'win32':
+        return
+    _console_fixed = True
+    import io
+    # Streams without a buffer (e.g. the runner's captured StringIO) are left alone
+    if hasattr(sys.stdout, 'buffer') and (not isinstance(sys.stdout, io.TextIOWrapper) or sys.stdout.encoding != 'utf-8'):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    if hasattr(sys.stderr, 'buffer') and (not isinstance(sys.stderr, io.TextIOWrapper) or sys.stderr.encoding != 'utf-8'):
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+
+def write_log(lines: List[str]) -> None:
+    """Write a test's buffered progress lines to stdout in one call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def start_log(testcase) -> List[str]:
+    """
+    Start a test's progress log.
+    
+    Fixes the console encoding and returns a list for the test to append
+    progress lines to. The lines are written with a single stdout call when
+    the test finishes, so they still appear when an assertion fails partway.
+    """
+    fix_win_console()
+    log: List[str] = []
+    testcase.addCleanup(write_log, log)
+    return log
+
+
+def temp_root() -> Optional[str]:
+    """
+    Parent directory for the tests' temporary databases.
+    
+    Uses the RAM-backed /dev/shm when it is available, so the JSON round trips
+    don't touch the disk. Set EQ_BOSS_TRACKER_TEST_DISK=true to use the system
+    temp directory instead (None lets tempfile pick it).
+    """
+    if os.getenv('EQ_BOSS_TRACKER_TEST_DISK', '').lower() in ('1', 'true', 'yes'):
+        return None
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
@@ -1,9 +1,14 @@
 """Mock Discord webhook for testing without real Discord."""
+import asyncio
 import json
+import string
 import sys
+import time
 from pathlib import Path
-from typing import Optional, List, Dict
-from datetime import datetime
+from typing import Optional, List, Dict, Deque, Tuple
+from datetime import datetime, timedelta
+from collections import deque
+from functools import lru_cache
 
 # Add src to path for logger
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -16,15 +21,44 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str], str], ...]]:
+    """
+    Split a message template into (literal, field name, format spec) parts.
+    
+    Returns None for templates using anything beyond plain {name} / {name:spec}
+    fields (conversions, attribute/index lookups, nested specs); those are left
+    to str.format.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (conversion or not field.isidentifier() or '{' in spec):
+            return None
+        parts.append((literal, field, spec))
+    return tuple(parts)
+
+
 class MockDiscordNotifier:
     """Mock Discord notifier that logs messages instead of posting."""
+    
+    __slots__ = ('default_webhook_url', 'timestamp_formatter', 'posted_messages', 'verbose')
 
     def __init__(self, default_webhook_url: Optional[str] = None,
-                 timestamp_formatter=None):
-        """Initialize the mock Discord notifier."""
+                 timestamp_formatter=None, max_history: int = 10000, verbose: bool = True):
+        """
+        Initialize the mock Discord notifier.
+        
+        Args:
+            default_webhook_url: Webhook URL used when notify() isn't given one
+            timestamp_formatter: Optional TimestampFormatter for Discord timestamp variables
+            max_history: Number of most recent posts kept in posted_messages
+            verbose: Also print each post to stdout (turn off for bulk/benchmark runs)
+        """
         self.default_webhook_url = default_webhook_url
         self.timestamp_formatter = timestamp_formatter
-        self.posted_messages: List[Dict] = []
+        # Bounded so long-running sessions don't grow the history without limit
+        self.posted_messages: Deque[Dict] = deque(maxlen=max_history)
+        self.verbose = verbose
         logger.info("Mock Discord notifier initialized (messages will be logged, not posted)")
     
     def start(self) -> None:
@@ -47,7 +81,14 @@ class MockDiscordNotifier:
             kwargs['timestamp'] = timestamp
         
         try:
-            return template.format(**kwargs)
+            # Templates repeat across messages, so their placeholders are parsed once
+            parts = _compile_template(template)
+            if parts is None:
+                return template.format(**kwargs)
+            return ''.join([
+                literal if field is None else literal + format(kwargs[field], spec)
+                for literal, field, spec in parts
+            ])
         except KeyError as e:
             logger.error(f"Missing template variable: {e}")
             return template
@@ -62,28 +103,49 @@ class MockDiscordNotifier:
         """
         url = webhook_url or self.default_webhook_url
 
+        # Raw clock reading; formatted as ISO only when the history is read
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp_ns': time.time_ns(),
             'message': message,
             'webhook_url': url
         }
         
         self.posted_messages.append(entry)
         
+        # Lazy %-formatting: the message is only built if INFO is emitted
         logger.info("=" * 80)
         logger.info("MOCK DISCORD POST (not actually posted):")
-        logger.info(f"Webhook: {url[:50]}..." if url else "Webhook: None")
-        logger.info(f"Message: {message}")
+        if url:
+            logger.info("Webhook: %.50s...", url)
+        else:
+            logger.info("Webhook: None")
+        logger.info("Message: %s", message)
         logger.info("=" * 80)
         
-        print("\n" + "=" * 80)
-        print("MOCK DISCORD POST (not actually posted):")
-        print(f"Message: {message}")
-        print("=" * 80 + "\n")
+        if self.verbose:
+            print("\n" + "=" * 80)
+            print("MOCK DISCORD POST (not actually posted):")
+            print(f"Message: {message}")
+            print("=" * 80 + "\n")
+    
+    def get_posted_messages(self) -> Tuple[Dict, ...]:
+        """Get a read-only snapshot of the posted messages (oldest first), with ISO 'timestamp's."""
+        return tuple(
+            dict(entry, timestamp=datetime.fromtimestamp(entry['timestamp_ns'] / 1e9).isoformat())
+            for entry in self.posted_messages
+        )
+    
+    def copy_posted_messages(self) -> List[Dict]:
+        """Get the posted messages as a list the caller may modify."""
+        return list(self.get_posted_messages())
     
-    def get_posted_messages(self) -> List[Dict]:
-        """Get all posted messages."""
-        return self.posted_messages.copy()
+    def __len__(self) -> int:
+        """Number of posted messages in the history, without copying it."""
+        return len(self.posted_messages)
+    
+    def __bool__(self) -> bool:
+        """Always true, so an empty history doesn't make the notifier look absent."""
+        return True
     
     def clear_messages(self) -> None:
         """Clear posted messages list."""
@@ -94,11 +156,15 @@ class MockDiscordNotifier:
 class MockDiscordChecker:
     """Mock Discord checker for testing duplicate detection."""
     
+    __slots__ = ('bot_token', 'ready', 'duplicate_messages', '_last_seen')
+    
     def __init__(self, bot_token: Optional[str] = None):
         """Initialize the mock Discord checker."""
         self.bot_token = bot_token
         self.ready = True  # Always ready for mock
-        self.duplicate_messages: List[Dict] = []
+        self.duplicate_messages: List[Dict] = []  # Checks reported as duplicates
+        # Target name -> latest log time checked for it; stands in for the channel history
+        self._last_seen: Dict[str, datetime] = {}
         logger.info("Mock Discord checker initialized")
     
     async def initialize(self) -> bool:
@@ -110,22 +176,86 @@ class MockDiscordChecker:
     async def check_duplicate(self, channel_id: int, target_name: str,
                              log_timestamp: str, tolerance_minutes: int = 3) -> bool:
         """
-        Check for duplicates in mock posted messages.
+        Check for duplicates among the kills checked earlier.
+        
+        Every check counts as a post, so a second check for the same target
+        within tolerance_minutes of the last one is a duplicate.
         
         Args:
             channel_id: Channel ID (ignored in mock)
             target_name: Target name to check
-            log_timestamp: Log timestamp
+            log_timestamp: Log timestamp (format: "Sat Jan 31 23:30:48 2026")
             tolerance_minutes: Tolerance window
             
         Returns:
-            True if duplicate found in mock messages, False otherwise
+            True if the target was checked within the tolerance window, False otherwise
         """
-        # This would check against posted_messages from MockDiscordNotifier
-        # For now, return False (no duplicates in mock)
+        try:
+            dt_log = datetime.strptime(log_timestamp, "%a %b %d %H:%M:%S %Y")
+        except ValueError as e:
+            logger.error(f"Failed to parse log timestamp '{log_timestamp}': {e}")
+            return False
+        
+        last = self._last_seen.get(target_name)
+        # Keep the latest time, refreshed on repeats, so a run of duplicates
+        # can't slip through at the edge of the window
+        self._last_seen[target_name] = dt_log if last is None else max(last, dt_log)
+        
+        if last is not None and abs(dt_log - last) <= timedelta(minutes=tolerance_minutes):
+            self.duplicate_messages.append({'target_name': target_name, 'timestamp': log_timestamp})
+            logger.debug(f"Mock duplicate check for {target_name}: duplicate of kill at {last}")
+            return True
         logger.debug(f"Mock duplicate check for {target_name}: No duplicate (mock)")
         return False
     
+    async def get_channel_id_from_webhook(self, webhook_url: str) -> Optional[int]:
+        """
+        Get a channel ID for a webhook URL without calling the Discord API.
+        
+        Returns:
+            The webhook ID from the URL when it is numeric, 1 for any other
+            non-empty URL (the mock has a single channel), None for an empty URL
+        """
+        if not webhook_url:
+            return None
+        parts = webhook_url.rstrip('/').split('/')
+        if len(parts) > 5 and parts[5].isdigit():
+            return int(parts[5])
+        return 1
+    
+    def check_duplicate_sync(self, channel_id: Optional[int], target_name: str,
+                             log_timestamp: str, tolerance_minutes: int = 3) -> bool:
+        """
+        Synchronous wrapper for check_duplicate, as called by the app.
+        
+        Args:
+            channel_id: Channel ID (or None to skip check)
+            target_name: Target name to check
+            log_timestamp: Log timestamp (format: "Sat Jan 31 23:30:48 2026")
+            tolerance_minutes: Tolerance window
+            
+        Returns:
+            True if duplicate found, False otherwise
+        """
+        if not channel_id:
+            return False
+        return asyncio.run(self.check_duplicate(channel_id, target_name, log_timestamp, tolerance_minutes))
+    
+    def set_log_timezone(self, iana_timezone: Optional[str] = None) -> None:
+        """Set timezone for interpreting log timestamps (no-op; the mock compares naive times)."""
+        logger.debug(f"Mock Discord checker log timezone set to {iana_timezone or 'US/Eastern'}")
+    
+    def scan_channel_for_kills_sync(self, channel_id: Optional[int], boss_names: List[str],
+                                     limit: int = 500) -> Dict[str, Dict]:
+        """
+        Scan the channel for kills (the mock has no channel history).
+    
+        Returns:
+            Empty dictionary (no kills found)
+        """
+        logger.debug(f"Mock channel scan for {len(boss_names)} bosses: no kills (mock)")
+        return {}
+    
     async def close(self) -> None:
         """Close mock checker (no-op)."""
         logger.debug("Mock Discord checker closed")
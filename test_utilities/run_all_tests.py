@@ -1,59 +1,62 @@
 """Run all unit tests."""
 import sys
 import io
-import importlib
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
+from typing import Tuple
 
-# Fix Windows console encoding
-if sys.platform == 'win32':
-    # Only wrap if not already wrapped
-    if not isinstance(sys.stdout, io.TextIOWrapper) or sys.stdout.encoding != 'utf-8':
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    if not isinstance(sys.stderr, io.TextIOWrapper) or sys.stderr.encoding != 'utf-8':
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
-# Add test_utilities to path
+# Add test_utilities to path (also for the worker processes, which re-import this module on spawn)
 sys.path.insert(0, str(Path(__file__).parent))
 
-print("=" * 80)
-print("EverQuest Boss Tracker - Test Suite")
-print("=" * 80)
-print()
-
-# Run tests
-tests = [
-    ("Message Parser", "test_parser", "test_message_parser"),
-    ("Boss Database", "test_database", "test_boss_database"),
-    ("Timestamp Formatter", "test_timestamp", "test_timestamp_formatter"),
-    ("Activity Database", "test_activity", "test_activity_database"),
-]
-
-passed = 0
-failed = 0
-
-for test_name, test_module, test_func_name in tests:
-    print(f"\nRunning {test_name} tests...")
-    print("-" * 80)
-    try:
-        module = importlib.import_module(test_module)
-        if hasattr(module, test_func_name):
-            test_func = getattr(module, test_func_name)
-            test_func()
-            passed += 1
-            print(f"[PASS] {test_name} tests PASSED")
-        else:
-            print(f"[FAIL] {test_name} tests FAILED - test function '{test_func_name}' not found")
-            print(f"Available functions: {[x for x in dir(module) if x.startswith('test_')]}")
-            failed += 1
-    except Exception as e:
-        print(f"[FAIL] {test_name} tests FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        failed += 1
-
-print("\n" + "=" * 80)
-print(f"Test Results: {passed} passed, {failed} failed")
-print("=" * 80)
-
-if failed > 0:
-    sys.exit(1)
+from _bootstrap import fix_win_console
+
+
+def _run_module(module_name: str) -> Tuple[int, int, int, str]:
+    """
+    Run the tests of one test module in a worker process.
+    
+    Returns:
+        (tests run, failed, skipped, captured output)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        # An import error becomes a failing test rather than an exception here
+        suite = unittest.defaultTestLoader.loadTestsFromName(module_name)
+        result = unittest.TextTestRunner(stream=output, verbosity=2).run(suite)
+    failed = len(result.failures) + len(result.errors)
+    return result.testsRun, failed, len(result.skipped), output.getvalue()
+
+
+def main() -> int:
+    fix_win_console()
+    print("=" * 80)
+    print("EverQuest Boss Tracker - Test Suite")
+    print("=" * 80)
+    print()
+    
+    # Every test_*.py is picked up automatically; the modules share no state, so each
+    # runs in its own process and output is printed per module once it has finished
+    modules = sorted(p.stem for p in Path(__file__).parent.glob("test_*.py"))
+    
+    passed = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=min(len(modules), os.cpu_count() or 1)) as executor:
+        for module_name, (run, module_failed, skipped, output) in zip(modules, executor.map(_run_module, modules)):
+            print(f"\nRunning {module_name}...")
+            print("-" * 80)
+            print(output, end="")
+            passed += run - module_failed - skipped
+            failed += module_failed
+    
+    print("\n" + "=" * 80)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 80)
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
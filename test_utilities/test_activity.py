@@ -1,83 +1,86 @@
 """Test activity database."""
 import sys
-import io
+import importlib
+import unittest
 from pathlib import Path
 import tempfile
 import shutil
-from datetime import date, datetime
-
-# Fix Windows console encoding (only if not already wrapped)
-if sys.platform == 'win32':
-    if not isinstance(sys.stdout, io.TextIOWrapper) or (hasattr(sys.stdout, 'encoding') and sys.stdout.encoding != 'utf-8'):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    if not isinstance(sys.stderr, io.TextIOWrapper) or (hasattr(sys.stderr, 'encoding') and sys.stderr.encoding != 'utf-8'):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+from datetime import datetime
 
 # Add project root and src to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
-# Import module
-import activity_database
-ActivityDatabase = activity_database.ActivityDatabase
+try:
+    from ._bootstrap import start_log, temp_root
+except ImportError:
+    from _bootstrap import start_log, temp_root
 
 
-def test_activity_database():
-    """Test activity database operations."""
-    print("Testing Activity Database...")
-    print("=" * 60)
-    
-    # Create temporary directory
-    temp_dir = Path(tempfile.mkdtemp())
-    db_path = temp_dir / "test_activity.json"
+class TestActivityDatabase(unittest.TestCase):
+    """Activity database tests."""
     
-    try:
-        # Create database
-        db = ActivityDatabase(str(db_path))
-        print("[OK] Database created")
-        
-        # Use today's date for the test timestamp
-        today = datetime.now()
-        timestamp_str = today.strftime("%a %b %d %H:%M:%S %Y")
-        
-        # Test adding activity
-        activity1 = db.add_activity(
-            timestamp=timestamp_str,
-            monster="Severilous",
-            location="The Emerald Jungle",
-            player="TestPlayer",
-            guild="Test Guild",
-            posted_to_discord=True,
-            discord_message="Test message"
-        )
-        assert activity1 is not None, "Should add activity"
-        print("[OK] Added activity")
-        
-        # Test today's activities
-        today_activities = db.get_today_activities()
-        assert len(today_activities) >= 1, f"Should have today's activities (found {len(today_activities)}, date stored: {activity1.get('date')}, today: {date.today().isoformat()})"
-        print(f"[OK] Today's activities: {len(today_activities)}")
-        
-        # Test all activities
-        all_activities = db.get_all_activities()
-        assert len(all_activities) >= 1, "Should have all activities"
-        print(f"[OK] All activities: {len(all_activities)}")
+    def test_activity_database(self):
+        """Test activity database operations."""
+        log = start_log(self)
+        ActivityDatabase = importlib.import_module("activity_database").ActivityDatabase
         
-        # Test persistence
-        db2 = ActivityDatabase(str(db_path))
-        today_activities2 = db2.get_today_activities()
-        assert len(today_activities2) >= 1, "Activities should persist"
-        print("[OK] Persistence works")
+        log.append("Testing Activity Database...")
+        log.append("=" * 60)
         
-        print("\n" + "=" * 60)
-        print("All tests passed!")
+        # Create temporary directory (in RAM where available)
+        temp_dir = Path(tempfile.mkdtemp(dir=temp_root()))
+        db_path = temp_dir / "test_activity.json"
         
-    finally:
-        # Cleanup
-        shutil.rmtree(temp_dir)
-        print(f"\nCleaned up temporary files: {temp_dir}")
+        try:
+            # Create database
+            db = ActivityDatabase(str(db_path))
+            log.append("[OK] Database created")
+            
+            # Use today's date for the test timestamp (read the clock once so the
+            # timestamp and the date reported below can't straddle midnight)
+            now = datetime.now()
+            today = now.date()
+            timestamp_str = now.strftime("%a %b %d %H:%M:%S %Y")
+            
+            # Test adding activity
+            activity1 = db.add_activity(
+                timestamp=timestamp_str,
+                monster="Severilous",
+                location="The Emerald Jungle",
+                player="TestPlayer",
+                guild="Test Guild",
+                posted_to_discord=True,
+                discord_message="Test message"
+            )
+            assert activity1 is not None, "Should add activity"
+            log.append("[OK] Added activity")
+            
+            # Test today's activities
+            today_activities = db.get_today_activities()
+            assert len(today_activities) >= 1, f"Should have today's activities (found {len(today_activities)}, date stored: {activity1.get('date')}, today: {today.isoformat()})"
+            log.append(f"[OK] Today's activities: {len(today_activities)}")
+            
+            # Test all activities
+            all_activities = db.get_all_activities()
+            assert len(all_activities) >= 1, "Should have all activities"
+            log.append(f"[OK] All activities: {len(all_activities)}")
+            
+            # Test persistence (a fresh instance also covers the constructor's load path)
+            db2 = ActivityDatabase(str(db_path))
+            today_activities2 = db2.get_today_activities()
+            assert len(today_activities2) >= 1, "Activities should persist"
+            log.append("[OK] Persistence works")
+            
+            log.append("\n" + "=" * 60)
+            log.append("All tests passed!")
+            
+        finally:
+            # Cleanup
+            shutil.rmtree(temp_dir)
+            log.append(f"\nCleaned up temporary files: {temp_dir}")
 
 
 if __name__ == "__main__":
-    test_activity_database()
+    unittest.main()
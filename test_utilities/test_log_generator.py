@@ -14,10 +14,20 @@ import message_parser
 MessageParser = message_parser.MessageParser
 
 
+# English day/month names as written by the EverQuest client; indexing these avoids
+# strftime's per-call format parsing and keeps the output independent of the locale
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
 def generate_test_log_line(timestamp: datetime, server: str, player: str, 
                            guild: str, monster: str, location: str) -> str:
     """Generate a test log line in EverQuest format."""
-    timestamp_str = timestamp.strftime("%a %b %d %H:%M:%S %Y")
+    # Same as timestamp.strftime("%a %b %d %H:%M:%S %Y")
+    timestamp_str = (
+        f"{_WEEKDAYS[timestamp.weekday()]} {_MONTHS[timestamp.month]} {timestamp.day:02d} "
+        f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d} {timestamp.year}"
+    )
     return f"[{timestamp_str}] {server} tells the guild, '{player} of <{guild}> has killed {monster} in {location}!'"
 
 
@@ -40,37 +50,32 @@ def generate_test_log_file(output_path: Path, num_entries: int = 20):
         ("Master Yael", "The Emerald Jungle"),
     ]
     
-    # Generate entries
-    lines = []
+    # Generate entries, sampling each column for all entries in one call
     base_time = datetime.now() - timedelta(hours=1)
-    
-    for i in range(num_entries):
-        # Random time within last hour
-        entry_time = base_time + timedelta(minutes=random.randint(0, 60))
-        
-        # Random selection
-        server = random.choice(servers)
-        player = random.choice(players)
-        guild = random.choice(guilds)
-        monster, location = random.choice(bosses_zones)
-        
-        line = generate_test_log_line(entry_time, server, player, guild, monster, location)
-        lines.append(line)
+    minutes = random.choices(range(61), k=num_entries)  # Random time within last hour
+    servers_pick = random.choices(servers, k=num_entries)
+    players_pick = random.choices(players, k=num_entries)
+    guilds_pick = random.choices(guilds, k=num_entries)
+    bosses_pick = random.choices(bosses_zones, k=num_entries)
+    
+    # Join straight from the temporary list so only the text outlives it; the same
+    # text is written and then parsed below, so it is never built twice
+    text = '\n'.join([
+        generate_test_log_line(base_time + timedelta(minutes=m), server, player, guild, monster, location)
+        for m, server, player, guild, (monster, location)
+        in zip(minutes, servers_pick, players_pick, guilds_pick, bosses_pick)
+    ])
     
     # Write to file
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+        f.write(text)
     
     print(f"Generated test log file: {output_path}")
     print(f"Entries: {num_entries}")
     
-    # Verify parsing
-    parser = MessageParser()
-    parsed_count = 0
-    for line in lines:
-        if parser.parse_line(line):
-            parsed_count += 1
+    # Verify parsing with one scan of the written text (MessageParser.PATTERN is compiled once)
+    parsed_count = len(MessageParser.parse_lines(text))
     
     print(f"Successfully parsed: {parsed_count}/{num_entries}")
     
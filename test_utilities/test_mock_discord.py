@@ -0,0 +1,53 @@
+"""Test the mock Discord duplicate checker."""
+import asyncio
+import sys
+import importlib
+import unittest
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+class TestMockDiscordChecker(unittest.TestCase):
+    """Mock Discord checker tests."""
+    
+    def test_check_duplicate(self):
+        """Test duplicate detection through the same calls the app makes."""
+        MockDiscordChecker = importlib.import_module("mock_discord").MockDiscordChecker
+        checker = MockDiscordChecker()
+        
+        # The app resolves the channel first and skips the check without one
+        webhook_url = "https://discord.com/api/webhooks/123456/token"
+        channel_id = asyncio.run(checker.get_channel_id_from_webhook(webhook_url))
+        self.assertEqual(channel_id, 123456)
+        
+        first = "Sat Jan 31 23:30:48 2026"
+        self.assertFalse(checker.check_duplicate_sync(channel_id, "Lady Vox", first),
+                         "First kill should not be a duplicate")
+        self.assertTrue(checker.check_duplicate_sync(channel_id, "Lady Vox", "Sat Jan 31 23:32:00 2026"),
+                        "Repeat within tolerance should be a duplicate")
+        self.assertFalse(checker.check_duplicate_sync(channel_id, "Lady Vox", "Sat Jan 31 23:45:00 2026"),
+                         "Repeat outside tolerance should not be a duplicate")
+        self.assertFalse(checker.check_duplicate_sync(channel_id, "Lady Vox", "not a timestamp"),
+                         "Unparseable timestamp should not be a duplicate")
+        self.assertFalse(checker.check_duplicate_sync(None, "Lady Vox", first),
+                         "No channel should skip the check")
+        self.assertEqual(len(checker.duplicate_messages), 1)
+    
+    def test_options_and_scan(self):
+        """Test the calls made when saving options and scanning the channel."""
+        MockDiscordChecker = importlib.import_module("mock_discord").MockDiscordChecker
+        checker = MockDiscordChecker()
+        
+        checker.set_log_timezone("America/Chicago")
+        checker.set_log_timezone(None)
+        self.assertEqual(checker.scan_channel_for_kills_sync(123456, ["Lady Vox", "Lord Nagafen"]), {})
+        self.assertEqual(checker.scan_channel_for_kills_sync(None, [], limit=10), {})
+
+
+if __name__ == "__main__":
+    unittest.main()